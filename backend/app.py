@@ -1,143 +1,284 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, jsonify, request
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import cProfile
+import multiprocessing
+import os
+import random
+import threading
 import re
+import time
 import logging
+from urllib.parse import urlsplit
+
+import config
+from models.serialization import OrjsonProvider, dumps
 
 # Import our job scraper
 from services.job_scraper import JobScraper
+from services.job_store import count_terms, profile_terms
+from services.job_database import JobDatabase
+from services.facets import parse_filters, seniority_filter
+from services.ingestion import FeedIngestor
+from services.metrics import REGISTRY, REQUEST_SECONDS, stage_timer
+from services.resume_parser import ResumeParseError, UnsupportedResumeType, iter_resume_text
+from services.scheduler import HostLock, RefreshScheduler
+from services.text_analyzer import AIReadyTextAnalyzer, analyze_batch_item, init_batch_worker
+from services.transport import HttpTransport
 
 app = Flask(__name__)
+# jsonify/get_json through orjson; job records are written from their cached encoding
+app.json = OrjsonProvider(app)
 CORS(app)
 
+# Hard cap on request bodies; multipart uploads above ~500 KB are spooled to disk by Werkzeug
+app.config['MAX_CONTENT_LENGTH'] = config.MAX_UPLOAD_BYTES
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class AIReadyTextAnalyzer:
-    """Text analyzer designed for easy AI integration later"""
-    
-    def __init__(self):
-        self.known_job_patterns = {
-            'Software Developer': ['developer', 'programming', 'coding', 'software engineer'],
-            'Data Scientist': ['data scientist', 'data', 'analytics', 'machine learning', 'ml'],
-            'Frontend Developer': ['frontend', 'front-end', 'react', 'javascript', 'css', 'html', 'ui'],
-            'Backend Developer': ['backend', 'back-end', 'api', 'server', 'database'],
-            'DevOps Engineer': ['devops', 'docker', 'kubernetes', 'aws', 'infrastructure'],
-            'Full Stack Developer': ['full stack', 'fullstack', 'full-stack'],
-            'Nurse': ['nurse', 'nursing', 'healthcare', 'medical', 'rn'],
-            'Teacher': ['teacher', 'education', 'instructor', 'professor', 'tutor'],
-            'Accountant': ['accountant', 'accounting', 'finance', 'bookkeeper'],
-            'Chef': ['chef', 'cook', 'culinary', 'kitchen', 'restaurant'],
-            'Sales Representative': ['sales', 'salesperson', 'selling', 'sales rep'],
-            'Marketing Manager': ['marketing', 'marketing manager', 'digital marketing'],
-            'Graphic Designer': ['graphic designer', 'designer', 'design', 'photoshop'],
-            'Project Manager': ['project manager', 'pm', 'project management'],
-        }
-        
-        self.skill_patterns = [
-            'python', 'javascript', 'react', 'java', 'c++', 'sql',
-            'aws', 'docker', 'kubernetes', 'git', 'linux', 'html', 'css'
-        ]
-        
-        self.ai_service = None
-        self.confidence_threshold = 0.7
-        
-    def analyze_text(self, search_text):
-        search_text = search_text.strip()
-        original_text = search_text
-        search_text_lower = search_text.lower()
-        
-        simple_result = self._simple_pattern_analysis(search_text_lower)
-        
-        if simple_result['confidence'] < self.confidence_threshold:
-            if self.ai_service:
-                pass
-            else:
-                enhanced_result = self._fallback_analysis(search_text_lower)
-                if enhanced_result.get('predicted_roles'):
-                    simple_result['predicted_roles'] = enhanced_result['predicted_roles']
-                    simple_result['confidence'] = max(simple_result['confidence'], 0.6)
-                    simple_result['fallback_used'] = True
-                    simple_result['analysis_method'] = 'fallback_patterns'
-        
-        if 'analysis_method' not in simple_result:
-            simple_result['analysis_method'] = 'pattern_matching'
-        
-        simple_result.update({
-            'original_query': original_text,
-            'search_type': 'text_search',
-            'ai_ready': True,
-            'can_enhance_with_ai': simple_result['confidence'] < self.confidence_threshold
-        })
-        
-        return simple_result
+# Batch pool workers started by the dev server (python app.py) re-run this script as
+# __mp_main__; they only need services.text_analyzer, not the ingestor or scheduler
+BACKGROUND_JOBS = __name__ != '__mp_main__'
+
+# Initialize components
+job_database = JobDatabase(config.JOB_DB_PATH) if config.JOB_DB_PATH else None
+text_analyzer = AIReadyTextAnalyzer(cache_size=config.RESULT_CACHE_SIZE, cache_ttl=config.RESULT_CACHE_TTL)
+upstream_transport = HttpTransport(
+    connect_timeout=config.UPSTREAM_CONNECT_TIMEOUT,
+    read_timeout=config.UPSTREAM_READ_TIMEOUT,
+    max_retries=config.UPSTREAM_RETRIES,
+    backoff_base=config.UPSTREAM_BACKOFF_BASE,
+    backoff_max=config.UPSTREAM_BACKOFF_MAX,
+    pool_size=config.UPSTREAM_POOL_SIZE,
+    host_pool_sizes=config.UPSTREAM_HOST_POOL_SIZES,
+    failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=config.CIRCUIT_RESET_TIMEOUT
+)
+job_scraper = JobScraper(
+    cache_ttl=config.FEED_CACHE_TTL,
+    source_timeouts=config.SOURCE_TIMEOUTS,
+    max_workers=config.SEARCH_WORKERS,
+    result_cache_size=config.RESULT_CACHE_SIZE,
+    result_cache_ttl=config.RESULT_CACHE_TTL,
+    job_database=job_database,
+    dedup_threshold=config.DEDUP_THRESHOLD,
+    dedup_num_perm=config.DEDUP_NUM_PERM,
+    transport=upstream_transport,
+    streaming=config.FEED_STREAMING,
+    query_log_window=config.QUERY_LOG_WINDOW
+)
+job_scraper.sources['remoteok'].api_url = config.REMOTEOK_API_URL
+
+feed_ingestor = None
+refresh_lock = None
+if job_database is not None and BACKGROUND_JOBS:
+    # Workers share the database: one per host downloads and ingests, the others follow
+    if config.REFRESH_LOCK_PATH:
+        refresh_lock = HostLock(config.REFRESH_LOCK_PATH)
+    feed_ingestor = FeedIngestor(job_scraper, job_database, interval=config.INGEST_INTERVAL,
+                                 streaming=config.FEED_STREAMING, lock=refresh_lock)
+    if config.REMOTEOK_FEED_FILE:
+        feed_ingestor.ingest_file(config.REMOTEOK_FEED_FILE)
+    elif not config.SCHEDULER_ENABLED:
+        feed_ingestor.start()
+
+def refresh_remoteok():
+    """Scheduled RemoteOK sync: into the database when there is one, else the feed cache (and index)"""
+    if feed_ingestor is not None:
+        if not feed_ingestor.run_once():
+            # Another worker refreshes the shared database; refill the caches once it changed it
+            if feed_ingestor.follow():
+                scheduler.run_soon('prewarm')
+            return
+    else:
+        job_scraper.feed_cache.refresh(job_scraper.sources['remoteok'].api_url)
+    # A changed feed invalidated the result cache; refill it before users notice
+    scheduler.run_soon('prewarm')
+
+def _breaker_wait(url):
+    """Seconds until url's circuit breaker lets a call through (0 when closed)"""
+    return lambda: upstream_transport.breaker(urlsplit(url).netloc).retry_in()
+
+scheduler = None
+if config.SCHEDULER_ENABLED and BACKGROUND_JOBS:
+    scheduler = RefreshScheduler(jitter=config.SCHEDULER_JITTER)
+    job_scraper.local_only = True
+    # Sources that serve generated data (mock) have nothing to refresh
+    if not config.REMOTEOK_FEED_FILE:
+        scheduler.add_job('remoteok', config.SOURCE_REFRESH_INTERVALS['remoteok'], refresh_remoteok,
+                          defer=_breaker_wait(config.REMOTEOK_API_URL))
+    scheduler.add_job('prewarm', config.PREWARM_INTERVAL, lambda: job_scraper.prewarm(config.PREWARM_TOP_N),
+                      initial_delay=config.PREWARM_INTERVAL)
+    scheduler.start()
+
+def warmup():
+    """Exercise the singletons once so the first real request doesn't pay for cold caches"""
+    started = time.monotonic()
+    text_analyzer.analyze_text('warmup software developer')
+    # Not a user query: keep it out of the log that prewarm replays
+    job_scraper.search('developer', log_query=False)
+    logger.info(f"Warmup finished in {time.monotonic() - started:.2f}s")
+
+def shutdown():
+    """Stop background work; the production server calls this on graceful exit"""
+    if scheduler is not None:
+        scheduler.stop()
+    if feed_ingestor is not None:
+        feed_ingestor.stop()
+    job_scraper.shutdown()
+    if batch_executor is not None:
+        batch_executor.shutdown(wait=True, cancel_futures=True)
+    upstream_transport.close()
+
+batch_executor = None
+batch_executor_lock = threading.Lock()
+
+def _get_batch_executor():
+    """
+    Process pool for large analysis batches, created on first use
+    Workers are started with forkserver/spawn rather than forked from this
+    multi-threaded process (a lock held by another thread at fork time would
+    deadlock them), and each builds its own analyzer instead of importing app
+    """
+    global batch_executor
+    with batch_executor_lock:
+        if batch_executor is None:
+            context = multiprocessing.get_context(config.BATCH_START_METHOD)
+            if config.BATCH_START_METHOD == 'forkserver':
+                # Workers fork from a server that has only imported the analyzer
+                context.set_forkserver_preload(['services.text_analyzer'])
+            batch_executor = ProcessPoolExecutor(
+                max_workers=config.BATCH_WORKERS,
+                mp_context=context,
+                initializer=init_batch_worker,
+                initargs=(config.RESULT_CACHE_SIZE, config.RESULT_CACHE_TTL)
+            )
+    return batch_executor
+
+def _pagination_params(data):
+    """Read limit/offset from a request body; limit is capped and offset bounded by config"""
+    try:
+        limit = int(data.get('limit', config.DEFAULT_PAGE_SIZE))
+        offset = int(data.get('offset', 0))
+    except (TypeError, ValueError):
+        raise ValueError("limit and offset must be integers")
     
-    def _simple_pattern_analysis(self, search_text):
-        found_roles = []
-        confidence_score = 0.5
-        
-        for role, keywords in self.known_job_patterns.items():
-            matches = sum(1 for keyword in keywords if keyword in search_text)
-            if matches > 0:
-                found_roles.append({
-                    'role': role,
-                    'confidence': min(0.9, 0.5 + (matches * 0.2)),
-                    'matched_keywords': [kw for kw in keywords if kw in search_text]
-                })
-        
-        found_roles = sorted(found_roles, key=lambda x: x['confidence'], reverse=True)[:3]
-        role_names = [role['role'] for role in found_roles]
-        
-        found_skills = []
-        for skill in self.skill_patterns:
-            if skill in search_text:
-                found_skills.append(skill.title())
-        
-        preferences = self._extract_preferences(search_text)
-        
-        if found_roles:
-            confidence_score = max(role['confidence'] for role in found_roles)
-        elif found_skills:
-            confidence_score = 0.6
-        elif any(word in search_text for word in ['job', 'position', 'work', 'career']):
-            confidence_score = 0.4
-        
-        return {
-            'predicted_roles': role_names,
-            'mentioned_skills': found_skills,
-            'work_preferences': preferences,
-            'confidence': confidence_score,
-            'role_details': found_roles
-        }
+    if limit < 1 or offset < 0:
+        raise ValueError("limit must be positive and offset cannot be negative")
+    if offset > config.MAX_OFFSET:
+        raise ValueError(f"offset cannot exceed {config.MAX_OFFSET}")
     
-    def _fallback_analysis(self, search_text):
-        job_title = self._extract_job_title_patterns(search_text)
-        return {
-            'predicted_roles': [job_title] if job_title else ['General Position'],
-            'extracted_job_title': job_title
-        }
+    return min(limit, config.MAX_PAGE_SIZE), offset
+
+def _filter_params(data):
+    """Structured filters (salary_min/salary_max/location/seniority/remote) from a request body"""
+    return parse_filters(data.get('filters'))
+
+def _preference_filters(preferences):
+    """Filters implied by an analysis's work preferences (remote, seniority)"""
+    filters = {}
+    if preferences.get('remote_preferred'):
+        filters['remote'] = True
+    if preferences.get('senior_level') and not preferences.get('junior_level'):
+        # 'lead' and 'principal' also set senior_level; those postings are classed lead
+        filters['seniority'] = seniority_filter(['senior', 'lead'])
+    elif preferences.get('junior_level') and not preferences.get('senior_level'):
+        filters['seniority'] = seniority_filter(['junior'])
+    return filters
+
+profile_lock = threading.Lock()
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
     
-    def _extract_job_title_patterns(self, search_text):
-        stop_words = ['looking', 'for', 'job', 'position', 'work', 'career', 'remote', 'part', 'time', 'full', 'flexible', 'schedule']
-        words = [word for word in search_text.split() if word not in stop_words and len(word) > 2]
-        
-        if words:
-            return ' '.join(words[:2]).title()
-        
-        return None
+    # Sampled cProfile of a single request, opt-in per request via header.
+    # Only the request thread is profiled, and one request at a time
+    if (config.PROFILE_ENABLED and request.headers.get('X-Profile') == '1'
+            and random.random() < config.PROFILE_SAMPLE_RATE and profile_lock.acquire(blocking=False)):
+        g.profiler = cProfile.Profile()
+        g.profiler.enable()
+
+@app.after_request
+def record_request_timing(response):
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profiler.disable()
+        try:
+            os.makedirs(config.PROFILE_DIR, exist_ok=True)
+            path = os.path.join(config.PROFILE_DIR, f"{request.endpoint or 'unknown'}-{time.time():.6f}.prof")
+            profiler.dump_stats(path)
+            response.headers['X-Profile-Output'] = path
+            logger.info(f"Wrote request profile to {path}")
+        finally:
+            profile_lock.release()
     
-    def _extract_preferences(self, search_text):
-        return {
-            'remote_preferred': any(term in search_text for term in ['remote', 'work from home', 'wfh']),
-            'part_time': 'part time' in search_text or 'part-time' in search_text,
-            'freelance': 'freelance' in search_text or 'contract' in search_text,
-            'senior_level': any(term in search_text for term in ['senior', 'lead', 'principal']),
-            'junior_level': any(term in search_text for term in ['junior', 'entry', 'new grad'])
-        }
+    started = g.get('request_started')
+    if started is not None:
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint, request.method, str(response.status_code))
+    return response
 
-# Initialize components
-text_analyzer = AIReadyTextAnalyzer()
-job_scraper = JobScraper()
+@app.teardown_request
+def release_profiler(exc):
+    # after_request is skipped when a request fails before producing a response
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profiler.disable()
+        profile_lock.release()
+
+def _cache_samples():
+    caches = {
+        'feed': job_scraper.feed_cache.get_stats(),
+        'search': job_scraper.result_cache.get_stats(),
+        'analysis': text_analyzer.cache.get_stats()
+    }
+    for cache, stats in caches.items():
+        for event in ('hits', 'stale_hits', 'misses', 'evictions', 'expirations', 'invalidations', 'revalidated', 'errors'):
+            if event in stats:
+                yield {'cache': cache, 'event': event}, stats[event]
+
+REGISTRY.collector('job_finder_cache_events_total', 'Cache lookups and maintenance events', 'counter', _cache_samples)
+
+def _upstream_samples():
+    for host, upstream in upstream_transport.get_stats()['upstreams'].items():
+        yield {'host': host}, 0 if upstream['state'] == 'closed' else 1
+
+REGISTRY.collector('job_finder_upstream_circuit_open', 'Whether an upstream circuit breaker is open or half-open', 'gauge', _upstream_samples)
+
+def _refresh_age_samples():
+    if scheduler is None:
+        return
+    for job, stats in scheduler.get_stats().items():
+        if stats['last_refresh_age_seconds'] is not None:
+            yield {'job': job}, stats['last_refresh_age_seconds']
+
+REGISTRY.collector('job_finder_refresh_age_seconds', 'Seconds since a scheduled refresh job last succeeded', 'gauge', _refresh_age_samples)
+
+def scheduler_health():
+    """Scheduler section of /health: per job, the age of its last successful refresh"""
+    if scheduler is None:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        "jobs": scheduler.get_stats(),
+        "tracked_queries": len(job_scraper.query_log),
+        # False for workers that only read the database another worker refreshes
+        "refresher": refresh_lock.held if refresh_lock is not None else True
+    }
+
+@app.errorhandler(413)
+def request_too_large(e):
+    return jsonify({"error": f"Upload exceeds the {config.MAX_UPLOAD_BYTES // (1024 * 1024)} MB limit"}), 413
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -146,7 +287,17 @@ def health_check():
         "message": "AI Job Finder API is running",
         "version": "1.0.0",
         "ai_ready": True,
-        "job_scraper_ready": True
+        "job_scraper_ready": True,
+        "feed_cache": job_scraper.feed_cache.get_stats(),
+        "analysis_cache": text_analyzer.cache.get_stats(),
+        "search_cache": job_scraper.result_cache.get_stats(),
+        "upstream_transport": upstream_transport.get_stats(),
+        "scheduler": scheduler_health(),
+        "job_database": {
+            "enabled": job_database is not None,
+            "jobs": job_database.count() if job_database is not None else 0,
+            "last_ingest": feed_ingestor.last_counts if feed_ingestor is not None else {}
+        }
     })
 
 @app.route('/api/analyze-text', methods=['POST'])
@@ -172,6 +323,113 @@ def analyze_text():
         logging.error(f"Error in text analysis: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/analyze-text/batch', methods=['POST'])
+def analyze_text_batch():
+    """Analyze many search texts in one request, streamed back as NDJSON in input order"""
+    data = request.get_json(silent=True)
+    
+    if not data or not isinstance(data.get('search_texts'), list):
+        return jsonify({"error": "search_texts must be a list"}), 400
+    
+    search_texts = data['search_texts']
+    if len(search_texts) > config.BATCH_MAX_ITEMS:
+        return jsonify({"error": f"at most {config.BATCH_MAX_ITEMS} search_texts per batch"}), 400
+    
+    items = list(enumerate(search_texts))
+    parallel = data.get('parallel', len(items) >= config.BATCH_PARALLEL_THRESHOLD)
+    
+    if parallel and items:
+        chunksize = max(1, len(items) // (config.BATCH_WORKERS * 4))
+        results = _get_batch_executor().map(analyze_batch_item, items, chunksize=chunksize)
+    else:
+        results = map(partial(analyze_batch_item, analyzer=text_analyzer), items)
+    
+    def generate():
+        try:
+            for result in results:
+                yield dumps(result) + b'\n'
+        except Exception as e:
+            logger.error(f"Batch analysis aborted: {str(e)}")
+            yield dumps({"success": False, "error": f"Batch aborted: {str(e)}"}) + b'\n'
+    
+    return Response(generate(), mimetype='application/x-ndjson')
+
+@app.route('/api/analyze-resume', methods=['POST'])
+def analyze_resume():
+    """Analyze an uploaded resume (PDF, DOCX or text) and search jobs for its best-matching role"""
+    try:
+        upload = request.files.get('resume')
+        if upload is None or not upload.filename:
+            return jsonify({"error": "resume file is required"}), 400
+        
+        # Text is extracted and matched chunk by chunk; the upload is never held whole.
+        # Term counts for similarity matching are gathered on the same pass
+        chunks = iter_resume_text(upload.stream, upload.filename, max_chars=config.RESUME_MAX_TEXT_CHARS)
+        term_counts = Counter()
+        analysis = text_analyzer.analyze_stream(count_terms(chunks, term_counts))
+        analysis['original_query'] = upload.filename
+        
+        predicted_roles = analysis.get('predicted_roles', [])
+        keywords = predicted_roles[0] if predicted_roles else ' '.join(analysis.get('mentioned_skills', [])[:3]) or 'developer'
+        location = 'remote' if analysis['work_preferences'].get('remote_preferred') else ''
+        
+        result = job_scraper.search(keywords, location, limit=config.DEFAULT_PAGE_SIZE)
+        similar = job_scraper.match_profile(term_counts, limit=config.DEFAULT_PAGE_SIZE)
+        
+        return jsonify({
+            "success": True,
+            "analysis": analysis,
+            "jobs": result['jobs'],
+            "total_found": result['total'],
+            "similar_jobs": similar['jobs'],
+            "search_keywords": keywords,
+            "sources": result['sources'],
+            "sources_answered": result['sources_answered'],
+            "partial_results": result['partial']
+        })
+    
+    except UnsupportedResumeType as e:
+        return jsonify({"error": str(e)}), 415
+    except ResumeParseError as e:
+        return jsonify({"error": str(e)}), 422
+    except RequestEntityTooLarge:
+        raise
+    except Exception as e:
+        logger.error(f"Error analyzing resume: {str(e)}")
+        return jsonify({"error": f"Resume analysis failed: {str(e)}"}), 500
+
+@app.route('/api/match-jobs', methods=['POST'])
+def match_jobs():
+    """Rank every job in the feed by similarity to a candidate's text (a query, profile or pasted resume)"""
+    try:
+        data = request.get_json()
+        
+        if not data or not isinstance(data.get('text'), str) or not data['text'].strip():
+            return jsonify({"error": "text is required"}), 400
+        
+        try:
+            limit, offset = _pagination_params(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        result = job_scraper.match_profile(profile_terms(data['text']), limit=limit, offset=offset)
+        
+        with stage_timer('api', 'serialize'):
+            response = jsonify({
+                "success": True,
+                "jobs": result['jobs'],
+                "total_found": result['total'],
+                "limit": limit,
+                "offset": offset
+            })
+        return response
+    
+    except Exception as e:
+        logger.error(f"Error matching jobs: {str(e)}")
+        return jsonify({
+            "error": f"Job matching failed: {str(e)}"
+        }), 500
+
 @app.route('/api/search-jobs', methods=['POST'])
 def search_jobs():
     """NEW: Search for jobs using our job scraper"""
@@ -197,17 +455,37 @@ def search_jobs():
         if not keywords:
             keywords = 'developer'  # Fallback
         
+        try:
+            limit, offset = _pagination_params(data)
+            filters = _filter_params(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        # Without explicit filters, the analysis's remote/seniority preferences narrow the results
+        if 'filters' not in data and analysis_data:
+            filters = _preference_filters(analysis_data.get('work_preferences') or {})
+        
         # Search for jobs using our scraper
-        logger.info(f"Searching for jobs with keywords: '{keywords}', location: '{location}'")
-        jobs = job_scraper.search_jobs(keywords, location)
+        logger.info(f"Searching for jobs with keywords: '{keywords}', location: '{location}', filters: {filters}")
+        result = job_scraper.search(keywords, location, limit=limit, offset=offset, filters=filters)
+        jobs = result['jobs']
         
-        return jsonify({
-            "success": True,
-            "jobs": jobs,
-            "total_found": len(jobs),
-            "search_keywords": keywords,
-            "message": f"Found {len(jobs)} job opportunities"
-        })
+        with stage_timer('api', 'serialize'):
+            response = jsonify({
+                "success": True,
+                "jobs": jobs,
+                "total_found": result['total'],
+                "limit": limit,
+                "offset": offset,
+                "search_keywords": keywords,
+                "filters": filters,
+                "facets": result['facets'],
+                "sources": result['sources'],
+                "sources_answered": result['sources_answered'],
+                "partial_results": result['partial'],
+                "message": f"Found {result['total']} job opportunities"
+            })
+        return response
     
     except Exception as e:
         logger.error(f"Error searching jobs: {str(e)}")
@@ -230,16 +508,32 @@ def search_jobs_simple():
         if not keywords:
             return jsonify({"error": "keywords cannot be empty"}), 400
         
+        try:
+            limit, offset = _pagination_params(data)
+            filters = _filter_params(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
         # Search for jobs
-        jobs = job_scraper.search_jobs(keywords, location)
+        result = job_scraper.search(keywords, location, limit=limit, offset=offset, filters=filters)
+        jobs = result['jobs']
         
-        return jsonify({
-            "success": True,
-            "jobs": jobs,
-            "total_found": len(jobs),
-            "search_keywords": keywords,
-            "search_location": location
-        })
+        with stage_timer('api', 'serialize'):
+            response = jsonify({
+                "success": True,
+                "jobs": jobs,
+                "total_found": result['total'],
+                "limit": limit,
+                "offset": offset,
+                "search_keywords": keywords,
+                "search_location": location,
+                "filters": filters,
+                "facets": result['facets'],
+                "sources": result['sources'],
+                "sources_answered": result['sources_answered'],
+                "partial_results": result['partial']
+            })
+        return response
     
     except Exception as e:
         logger.error(f"Error in simple job search: {str(e)}")
@@ -248,4 +542,6 @@ def search_jobs_simple():
         }), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
+    warmup()
+    app.run(debug=config.DEBUG, host=config.HOST, port=config.PORT)
@@ -0,0 +1,252 @@
+"""
+Async serving mode: the job search endpoints on aiohttp
+
+Upstream providers are awaited on the event loop instead of each request
+holding a worker thread for the length of its slowest upstream call, and
+identical searches in flight at the same time share one upstream fan-out.
+Everything else (analyzer, scraper, caches, index, database, transport
+breakers) is the same singletons app.py builds, so both modes behave alike.
+Routes without an async handler are passed to the Flask app on a thread.
+
+    cd backend && WEB_MODE=async gunicorn -c gunicorn.conf.py async_app:app
+    cd backend && python async_app.py        # development
+"""
+import asyncio
+import json
+import time
+import logging
+
+from aiohttp import web
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+
+import config
+from app import (app as flask_app, job_database, job_scraper, feed_ingestor, text_analyzer, upstream_transport,
+                 scheduler_health, warmup, _filter_params, _pagination_params, _preference_filters)
+from models.serialization import dumps, loads
+from services.async_search import AsyncJobSearch
+from services.async_transport import AsyncHttpTransport
+from services.metrics import REGISTRY, REQUEST_SECONDS, stage_timer
+
+logger = logging.getLogger(__name__)
+
+async_transport = AsyncHttpTransport(upstream_transport)
+async_search = AsyncJobSearch(job_scraper, async_transport)
+
+# Hop-by-hop headers aiohttp sets itself on the way out
+WSGI_SKIP_HEADERS = {'content-length', 'transfer-encoding', 'connection'}
+
+
+@web.middleware
+async def request_timer(request, handler):
+    started = time.perf_counter()
+    status = '500'
+    try:
+        response = await handler(request)
+        status = str(response.status)
+        return response
+    except web.HTTPException as e:
+        status = str(e.status)
+        raise
+    finally:
+        route = request.match_info.route.resource
+        endpoint = route.canonical if route is not None else 'unmatched'
+        REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint, request.method, status)
+
+
+@web.middleware
+async def cors_headers(request, handler):
+    # Same open policy flask_cors applies to the Flask routes
+    response = await handler(request)
+    response.headers.setdefault('Access-Control-Allow-Origin', '*')
+    return response
+
+
+def json_response(data, status: int = 200) -> web.Response:
+    """JSON response encoded by models.serialization (orjson, pre-encoded job records)"""
+    return web.Response(body=dumps(data), status=status, content_type='application/json')
+
+
+async def _json_body(request):
+    try:
+        return await request.json(loads=loads)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+async def metrics(request):
+    return web.Response(body=REGISTRY.render().encode('utf-8'), headers={'Content-Type': 'text/plain; version=0.0.4'})
+
+
+async def health_check(request):
+    return json_response({
+        "status": "healthy",
+        "message": "AI Job Finder API is running",
+        "version": "1.0.0",
+        "mode": "async",
+        "ai_ready": True,
+        "job_scraper_ready": True,
+        "feed_cache": job_scraper.feed_cache.get_stats(),
+        "analysis_cache": text_analyzer.cache.get_stats(),
+        "search_cache": job_scraper.result_cache.get_stats(),
+        "search_coalescing": async_search.get_stats(),
+        "upstream_transport": upstream_transport.get_stats(),
+        "scheduler": scheduler_health(),
+        "job_database": {
+            "enabled": job_database is not None,
+            "jobs": job_database.count() if job_database is not None else 0,
+            "last_ingest": feed_ingestor.last_counts if feed_ingestor is not None else {}
+        }
+    })
+
+
+async def search_jobs(request):
+    """Async variant of app.search_jobs"""
+    try:
+        data = await _json_body(request)
+
+        if not data:
+            return json_response({"error": "Request data is required"}, status=400)
+
+        keywords = data.get('keywords', '')
+        location = data.get('location', '')
+        analysis_data = data.get('analysis', {})
+
+        # If we have analysis data, use it to generate better keywords
+        if analysis_data and not keywords:
+            if analysis_data.get('search_type') == 'text_search':
+                predicted_roles = analysis_data.get('predicted_roles', [])
+                keywords = predicted_roles[0] if predicted_roles else analysis_data.get('original_query', 'developer')
+            else:
+                keywords = 'software developer'
+
+        if not keywords:
+            keywords = 'developer'  # Fallback
+
+        try:
+            limit, offset = _pagination_params(data)
+            filters = _filter_params(data)
+        except ValueError as e:
+            return json_response({"error": str(e)}, status=400)
+
+        # Without explicit filters, the analysis's remote/seniority preferences narrow the results
+        if 'filters' not in data and analysis_data:
+            filters = _preference_filters(analysis_data.get('work_preferences') or {})
+
+        logger.info(f"Searching for jobs with keywords: '{keywords}', location: '{location}', filters: {filters}")
+        result = await async_search.search(keywords, location, limit=limit, offset=offset, filters=filters)
+
+        with stage_timer('api', 'serialize'):
+            response = json_response({
+                "success": True,
+                "jobs": result['jobs'],
+                "total_found": result['total'],
+                "limit": limit,
+                "offset": offset,
+                "search_keywords": keywords,
+                "filters": filters,
+                "facets": result['facets'],
+                "sources": result['sources'],
+                "sources_answered": result['sources_answered'],
+                "partial_results": result['partial'],
+                "message": f"Found {result['total']} job opportunities"
+            })
+        return response
+
+    except Exception as e:
+        logger.error(f"Error searching jobs: {str(e)}")
+        return json_response({"error": f"Job search failed: {str(e)}"}, status=500)
+
+
+async def search_jobs_simple(request):
+    """Async variant of app.search_jobs_simple"""
+    try:
+        data = await _json_body(request)
+
+        if not data or 'keywords' not in data:
+            return json_response({"error": "keywords are required"}, status=400)
+
+        keywords = data['keywords'].strip()
+        location = data.get('location', '').strip()
+
+        if not keywords:
+            return json_response({"error": "keywords cannot be empty"}, status=400)
+
+        try:
+            limit, offset = _pagination_params(data)
+            filters = _filter_params(data)
+        except ValueError as e:
+            return json_response({"error": str(e)}, status=400)
+
+        result = await async_search.search(keywords, location, limit=limit, offset=offset, filters=filters)
+
+        with stage_timer('api', 'serialize'):
+            response = json_response({
+                "success": True,
+                "jobs": result['jobs'],
+                "total_found": result['total'],
+                "limit": limit,
+                "offset": offset,
+                "search_keywords": keywords,
+                "search_location": location,
+                "filters": filters,
+                "facets": result['facets'],
+                "sources": result['sources'],
+                "sources_answered": result['sources_answered'],
+                "partial_results": result['partial']
+            })
+        return response
+
+    except Exception as e:
+        logger.error(f"Error in simple job search: {str(e)}")
+        return json_response({"error": f"Job search failed: {str(e)}"}, status=500)
+
+
+async def wsgi_fallback(request):
+    """
+    Every other endpoint (text/resume analysis, matching) is served by the
+    Flask app on a worker thread. Bodies are buffered both ways, so the
+    batch endpoint's NDJSON arrives in one piece rather than streamed
+    """
+    body = await request.read()
+    environ = EnvironBuilder(
+        path=request.path,
+        method=request.method,
+        query_string=request.query_string,
+        headers=list(request.headers.items()),
+        data=body
+    ).get_environ()
+    environ['REMOTE_ADDR'] = request.remote or ''
+
+    def call():
+        app_iter, status, headers = run_wsgi_app(flask_app.wsgi_app, environ, buffered=True)
+        return b''.join(app_iter), status, headers
+
+    payload, status, headers = await asyncio.get_running_loop().run_in_executor(None, call)
+    response = web.Response(body=payload, status=int(status.split(' ', 1)[0]))
+    for name, value in headers.items():
+        if name.lower() not in WSGI_SKIP_HEADERS:
+            response.headers.add(name, value)
+    return response
+
+
+async def close_async_transport(app):
+    await async_transport.close()
+
+
+def create_app() -> web.Application:
+    application = web.Application(middlewares=[request_timer, cors_headers], client_max_size=config.MAX_UPLOAD_BYTES)
+    application.router.add_get('/health', health_check)
+    application.router.add_get('/metrics', metrics)
+    application.router.add_post('/api/search-jobs', search_jobs)
+    application.router.add_post('/api/search-jobs-simple', search_jobs_simple)
+    application.router.add_route('*', '/{tail:.*}', wsgi_fallback)
+    application.on_cleanup.append(close_async_transport)
+    return application
+
+
+app = create_app()
+
+if __name__ == '__main__':
+    # Development server only; production runs under gunicorn with WEB_MODE=async
+    warmup()
+    web.run_app(app, host=config.HOST, port=config.PORT)
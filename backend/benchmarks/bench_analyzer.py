@@ -0,0 +1,47 @@
+"""
+AIReadyTextAnalyzer throughput
+
+Run from backend/:  python -m benchmarks.bench_analyzer [iterations]
+"""
+import sys
+import time
+
+import config
+from services.text_analyzer import AIReadyTextAnalyzer
+
+QUERIES = [
+    'remote python developer',
+    'senior data scientist with machine learning and sql',
+    'nurse part time',
+    'looking for a modern web development job, react and css',
+    'work from home project manager',
+    'entry level accountant bookkeeper',
+    'freelance graphic designer photoshop',
+    'lead devops engineer kubernetes docker aws',
+    'chef in a restaurant kitchen',
+    'something completely unrelated to any known role',
+]
+
+
+def bench(iterations: int):
+    # Configured like the app's analyzer, without booting the app (database, scheduler)
+    text_analyzer = AIReadyTextAnalyzer(cache_size=config.RESULT_CACHE_SIZE, cache_ttl=config.RESULT_CACHE_TTL)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for query in QUERIES:
+            text_analyzer.matcher.find_all(query)
+    match_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for query in QUERIES:
+            text_analyzer.analyze_text(query)
+    analyze_s = time.perf_counter() - started
+
+    calls = iterations * len(QUERIES)
+    print(f"matcher.find_all : {calls / match_s:10.0f} queries/s ({match_s / calls * 1e6:6.1f} us/query)")
+    print(f"analyze_text     : {calls / analyze_s:10.0f} queries/s ({analyze_s / calls * 1e6:6.1f} us/query)")
+
+
+if __name__ == '__main__':
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
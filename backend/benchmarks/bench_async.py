@@ -0,0 +1,137 @@
+"""
+Threaded vs. async serving under a burst of concurrent clients
+
+Starts a delayed stub upstream and gunicorn in each mode (streaming feed
+search, no job database, result cache off, so every search goes upstream),
+then has --clients concurrent clients each send --rounds searches:
+
+  threaded       app:app on gthread workers (WEB_WORKERS x WEB_THREADS)
+  async          async_app:app on aiohttp workers; identical in-flight
+                 searches are coalesced into one upstream call
+  async-unique   as above, but every client's keywords are distinct, so
+                 nothing can be coalesced: the event loop alone
+
+Run from backend/:  python -m benchmarks.bench_async [--clients 1000] [--upstream-delay 0.2]
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import aiohttp
+
+from benchmarks.load_test import KEYWORDS, free_port, percentile, wait_until_healthy
+from benchmarks.stub_upstream import StubUpstream
+
+MODES = {
+    'threaded': ('threaded', 'app:app', False),
+    'async': ('async', 'async_app:app', False),
+    'async-unique': ('async', 'async_app:app', True),
+}
+
+
+async def drive(base_url: str, clients: int, rounds: int, unique: bool):
+    latencies = []
+    errors = 0
+    connector = aiohttp.TCPConnector(limit=0)
+    timeout = aiohttp.ClientTimeout(total=120)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        async def client(client_id: int):
+            nonlocal errors
+            for round_id in range(rounds):
+                keywords = KEYWORDS[(client_id + round_id) % len(KEYWORDS)]
+                if unique:
+                    keywords = f"{keywords} c{client_id}r{round_id}"
+                started = time.perf_counter()
+                try:
+                    async with session.post(f"{base_url}/api/search-jobs-simple", json={'keywords': keywords}) as response:
+                        await response.read()
+                        ok = response.status == 200
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    ok = False
+                if ok:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    errors += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(client(i) for i in range(clients)))
+        wall = time.monotonic() - started
+
+    latencies.sort()
+    return latencies, errors, wall
+
+
+def run_mode(mode: str, stub: StubUpstream, args):
+    web_mode, app_path, unique = MODES[mode]
+    port = free_port()
+    env = dict(
+        os.environ,
+        HOST='127.0.0.1',
+        PORT=str(port),
+        WEB_MODE=web_mode,
+        WEB_WORKERS=str(args.workers),
+        WEB_THREADS=str(args.threads),
+        REMOTEOK_API_URL=stub.url,
+        JOB_DB_PATH='',
+        FEED_STREAMING='1',
+        RESULT_CACHE_SIZE='0',
+        # Measures the request path itself, not searches served from scheduler-refreshed data
+        SCHEDULER_ENABLED='0',
+        UPSTREAM_POOL_SIZE=str(args.clients)
+    )
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--log-level', 'warning',
+         '--backlog', str(args.clients * 2), app_path],
+        cwd=backend_dir, env=env, stderr=subprocess.DEVNULL
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        wait_until_healthy(base_url)
+        # Startup warmup searches hit the stub too; only count the benchmark's own calls
+        time.sleep(1)
+        upstream_before = stub.requests['200']
+        latencies, errors, wall = asyncio.run(drive(base_url, args.clients, args.rounds, unique))
+        upstream_calls = stub.requests['200'] - upstream_before
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+
+    ms = lambda value: value * 1000
+    print(f"{mode:<13} | {len(latencies):>5} ok {errors:>4} failed | {len(latencies) / wall:7.1f} req/s | "
+          f"p50 {ms(percentile(latencies, 50)):7.0f} ms  p90 {ms(percentile(latencies, 90)):7.0f} ms  "
+          f"p99 {ms(percentile(latencies, 99)):7.0f} ms | {upstream_calls:>5} upstream calls")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=1000)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--upstream-jobs', type=int, default=500)
+    parser.add_argument('--upstream-delay', type=float, default=0.2)
+    parser.add_argument('modes', nargs='*', help=f"any of {', '.join(MODES)} (default: all)")
+    args = parser.parse_args()
+    unknown = set(args.modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+
+    stub = StubUpstream(jobs=args.upstream_jobs, delay=args.upstream_delay).start()
+    print(f"{args.clients} concurrent clients x {args.rounds} searches, {args.workers} workers "
+          f"({args.threads} threads each in threaded mode), upstream {args.upstream_delay * 1000:.0f} ms delay")
+    try:
+        for mode in args.modes or MODES:
+            run_mode(mode, stub, args)
+    finally:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
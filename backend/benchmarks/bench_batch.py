@@ -0,0 +1,43 @@
+"""
+/api/analyze-text/batch vs. one /api/analyze-text call per query
+
+Uses Flask's test client, so HTTP connection costs are excluded and the
+single-call numbers are a best case for the per-query endpoint.
+
+Run from backend/:  python -m benchmarks.bench_batch [queries]
+"""
+import logging
+import os
+import sys
+import time
+
+# No job database, refresh lock or scheduler: only the analyzer endpoints are measured
+os.environ.update(JOB_DB_PATH='', SCHEDULER_ENABLED='0')
+
+from app import app
+from benchmarks.bench_analyzer import QUERIES
+
+
+def bench(count: int):
+    client = app.test_client()
+    texts = [QUERIES[i % len(QUERIES)] for i in range(count)]
+
+    started = time.perf_counter()
+    for text in texts:
+        client.post('/api/analyze-text', json={'search_text': text})
+    single_s = time.perf_counter() - started
+    print(f"single calls     : {count / single_s:9.0f} queries/s")
+
+    for parallel in (False, True):
+        started = time.perf_counter()
+        response = client.post('/api/analyze-text/batch', json={'search_texts': texts, 'parallel': parallel})
+        lines = response.get_data().count(b'\n')
+        batch_s = time.perf_counter() - started
+        assert lines == count
+        label = 'batch (parallel)' if parallel else 'batch (serial)  '
+        print(f"{label} : {count / batch_s:9.0f} queries/s ({single_s / batch_s:4.1f}x)")
+
+
+if __name__ == '__main__':
+    logging.disable(logging.INFO)
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,81 @@
+"""
+Faceted filtering: precomputed FacetIndex vs. scanning every job's fields
+
+  scan    matches_filters over every posting, then Counters per facet (what
+          filtering the projected job dicts per request would cost)
+  index   FacetIndex.mask (bitmap ANDs, salary binary searches) + counts
+          (popcounts)
+  query   JobStore.facet_counts for a keyword query: the same, plus turning
+          the query's posting lists into a bitmap
+
+Run from backend/:  python -m benchmarks.bench_facets [sizes...]
+"""
+import sys
+import time
+from collections import Counter
+
+from benchmarks.synthetic import make_feed
+from services.facets import FacetIndex, matches_filters, parse_filters
+from services.job_store import JobStore
+
+FILTERS = {
+    'none': {},
+    'seniority': {'seniority': 'senior'},
+    'salary range': {'salary_min': 70000, 'salary_max': 120000},
+    'combined': {'seniority': 'lead', 'location': 'Berlin', 'salary_min': 90000},
+}
+QUERY = 'python developer'
+
+
+def scan(docs, filters):
+    counts = {facet: Counter() for facet in ('seniority', 'location_key', 'remote')}
+    matched = 0
+    for doc in docs:
+        if matches_filters(doc, filters):
+            matched += 1
+            for facet, counter in counts.items():
+                counter[doc[facet]] += 1
+    return matched, counts
+
+
+def indexed(index: FacetIndex, filters):
+    matched = index.mask(filters)
+    index.counts(matched)
+    return index.count(matched)
+
+
+def timed(func, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def bench(size: int):
+    store = JobStore()
+    store.replace(make_feed(size))
+    docs = [JobStore.typed_fields(job) for job in make_feed(size)[1:]]
+
+    started = time.perf_counter()
+    index = FacetIndex(docs)
+    build_ms = (time.perf_counter() - started) * 1000
+    print(f"{size:>8} postings | index build {build_ms:7.1f} ms")
+
+    for name, raw in FILTERS.items():
+        filters = parse_filters(raw)
+        scan_ms, (scan_matched, _) = timed(lambda: scan(docs, filters), 3)
+        index_ms, matched = timed(lambda: indexed(index, filters), 50)
+        query_ms, facets = timed(lambda: store.facet_counts(QUERY, filters), 20)
+        assert matched == scan_matched
+        print(f"  {name:<13} | {matched:>7} match | scan {scan_ms:8.2f} ms | index {index_ms:6.3f} ms "
+              f"({scan_ms / index_ms:6.0f}x) | '{QUERY}' + filters {query_ms:6.3f} ms ({facets['matched']} match)")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Streaming vs. whole-document parsing of a large RemoteOK-shaped feed
+
+Each mode runs in a fresh interpreter so peak RSS (ru_maxrss, reported
+above the post-import baseline) is not polluted by earlier runs:
+
+  load-search     json.load the whole feed, then filter for the first matches
+  stream-search   parse posting by posting, stop after the first matches
+  load-ingest     json.load, then upsert every posting into SQLite
+  stream-ingest   parse posting by posting straight into SQLite
+  load-parse      json.load only
+  stream-parse    iterate every posting only
+
+Run from backend/:  python -m benchmarks.bench_feed_stream [postings...]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+MODES = ['load-search', 'stream-search', 'load-ingest', 'stream-ingest', 'load-parse', 'stream-parse']
+KEYWORDS = 'rust engineer'
+MATCHES = 10
+
+
+def run_mode(mode: str, path: str) -> dict:
+    """Executed in the child process"""
+    import logging
+    logging.disable(logging.WARNING)
+
+    from services.feed_stream import iter_file_chunks, iter_json_array
+    from services.ingestion import FeedIngestor
+    from services.job_database import JobDatabase
+    from services.job_scraper import JobScraper
+
+    scraper = JobScraper()
+    keywords = KEYWORDS.lower()
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result = {}
+
+    started = time.perf_counter()
+    with open(path, 'rb') as f, tempfile.TemporaryDirectory() as tmp:
+        if mode.startswith('load'):
+            postings = json.load(f)
+        else:
+            postings = iter_json_array(iter_file_chunks(f))
+
+        if mode.endswith('search'):
+            jobs = []
+            for job in postings:
+                if isinstance(job, dict) and job.get('position') and scraper._job_matches_keywords(job, keywords):
+                    jobs.append(scraper._process_remoteok_job(job))
+                    if len(jobs) >= MATCHES:
+                        break
+            result['matches'] = len(jobs)
+            result['bytes_read'] = f.tell()
+        elif mode.endswith('ingest'):
+            ingestor = FeedIngestor(scraper, JobDatabase(os.path.join(tmp, 'jobs.db')))
+            result['inserted'] = ingestor.ingest(postings)['inserted']
+        else:
+            result['postings'] = sum(1 for _ in postings)
+
+    result['seconds'] = time.perf_counter() - started
+    result['peak_mb'] = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_kb) / 1024
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('sizes', nargs='*', type=int, default=[10_000, 50_000])
+    parser.add_argument('--mode', help=argparse.SUPPRESS)
+    parser.add_argument('--file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.file)))
+        return
+
+    from benchmarks.synthetic import make_feed
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f'feed-{size}.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(make_feed(size), f)
+            print(f"{size} postings, {os.path.getsize(path) / 1024 / 1024:.1f} MB fixture")
+
+            for mode in MODES:
+                output = subprocess.run(
+                    [sys.executable, '-m', 'benchmarks.bench_feed_stream', '--mode', mode, '--file', path],
+                    cwd=backend_dir, capture_output=True, text=True, check=True
+                ).stdout
+                result = json.loads(output.strip().splitlines()[-1])
+                extra = ', '.join(f"{key} {value}" for key, value in result.items() if key not in ('seconds', 'peak_mb'))
+                print(f"  {mode:<14} | {result['seconds'] * 1000:9.1f} ms | peak RSS +{result['peak_mb']:7.1f} MB | {extra}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Inverted-index keyword search vs. the per-request substring scan
+
+Run from backend/:  python -m benchmarks.bench_job_index [sizes...]
+"""
+import sys
+import time
+
+from benchmarks.synthetic import make_feed
+from services.job_scraper import JobScraper
+from services.job_store import JobStore
+
+QUERIES = ['python developer', 'senior react', 'nurse', 'kubernetes aws', 'marketing manager', 'rust']
+
+
+def bench(size: int, repeat: int = 5):
+    feed = make_feed(size)
+    scraper = JobScraper()
+
+    started = time.perf_counter()
+    store = JobStore()
+    store.replace(feed)
+    ingest_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            keywords = query.lower()
+            [job for job in feed[1:] if scraper._job_matches_keywords(job, keywords)]
+    scan_ms = (time.perf_counter() - started) * 1000 / (repeat * len(QUERIES))
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            store.search(query)
+    index_ms = (time.perf_counter() - started) * 1000 / (repeat * len(QUERIES))
+
+    print(f"{size:>8} postings | ingest {ingest_s:6.2f}s | scan {scan_ms:9.2f} ms/query | "
+          f"index {index_ms:8.2f} ms/query | {scan_ms / index_ms:6.1f}x")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    for size in sizes:
+        bench(size)
@@ -0,0 +1,90 @@
+"""
+Job dicts vs. compact Job records: memory held and response encoding time
+
+  memory    tracemalloc'd size of every posting kept in memory: the raw
+            decoded feed (what the feed cache and job store held), the
+            projected job dicts, and models.job.Job records (slots,
+            interned strings, tuple tags)
+  encode    one search response page (dicts: projection + dict copy with
+            relevance + Flask's default json.dumps; records: extended() +
+            orjson with pre-encoded fragments), and every posting at once
+            with stdlib json, orjson over dicts and orjson over records (first
+            serialization, then from the cached encodings)
+
+Run from backend/:  python -m benchmarks.bench_job_model [sizes...]
+"""
+import json
+import logging
+import sys
+import time
+import tracemalloc
+
+from benchmarks.synthetic import make_feed
+from models.serialization import dumps
+from services.job_scraper import JobScraper
+import orjson
+
+PAGE = 20
+
+
+def held(build):
+    """Result of build() and the bytes it allocated that are still alive"""
+    tracemalloc.start()
+    try:
+        result = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def timed(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def flask_dumps(obj) -> bytes:
+    # What Flask's DefaultJSONProvider does outside debug mode
+    return json.dumps(obj, ensure_ascii=True, sort_keys=True, separators=(',', ':')).encode()
+
+
+def bench(scraper: JobScraper, size: int):
+    payload = orjson.dumps(make_feed(size))
+    raw, raw_bytes = held(lambda: orjson.loads(payload)[1:])
+    dicts, dict_bytes = held(lambda: [scraper._process_remoteok_job(job) for job in raw])
+    records, record_bytes = held(lambda: [scraper._remoteok_record(job) for job in raw])
+
+    mb = lambda value: value / 1024 / 1024
+    print(f"{size:>8} postings | memory: raw feed {mb(raw_bytes):7.1f} MB | job dicts {mb(dict_bytes):7.1f} MB "
+          f"| Job records {mb(record_bytes):7.1f} MB ({dict_bytes / record_bytes:.1f}x smaller than dicts, "
+          f"{raw_bytes / record_bytes:.1f}x than the raw feed)")
+
+    page = list(range(0, size, size // PAGE))[:PAGE]
+    old_page = lambda: flask_dumps({'jobs': [dict(scraper._process_remoteok_job(raw[i]), relevance=1.5) for i in page]})
+    new_page = lambda: dumps({'jobs': [records[i].extended(relevance=1.5) for i in page]})
+    assert orjson.loads(old_page()) == orjson.loads(new_page())
+    old_ms, new_ms = timed(old_page, 500), timed(new_page, 500)
+    print(f"  page of {PAGE}      | dicts + json {old_ms * 1000:7.1f} us | records + orjson {new_ms * 1000:7.1f} us "
+          f"({old_ms / new_ms:.1f}x)")
+
+    repeat = max(1, 200_000 // size)
+    stdlib_ms = timed(lambda: flask_dumps(dicts), repeat)
+    orjson_ms = timed(lambda: orjson.dumps(dicts), repeat)
+    cold_ms = timed(lambda: dumps(records), 1)
+    warm_ms = timed(lambda: dumps(records), repeat)
+    print(f"  all postings     | json {stdlib_ms:7.1f} ms | orjson dicts {orjson_ms:6.1f} ms | orjson records "
+          f"{cold_ms:6.1f} ms first time, {warm_ms:6.1f} ms pre-encoded ({stdlib_ms / warm_ms:.0f}x json)")
+
+
+def main():
+    logging.disable(logging.WARNING)
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    scraper = JobScraper()
+    for size in sizes:
+        bench(scraper, size)
+
+
+if __name__ == '__main__':
+    main()
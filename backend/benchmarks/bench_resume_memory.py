@@ -0,0 +1,143 @@
+"""
+Peak memory of /api/analyze-resume across upload sizes
+
+Builds plain-text, DOCX and PDF resumes from 100 KB to 20 MB on disk, posts
+each one to the app (served by Werkzeug in this process; the client streams
+the multipart body from a file), and reports the tracemalloc peak for the
+request. Memory should stay flat as the upload grows.
+
+Run from backend/:  python -m benchmarks.bench_resume_memory [--formats text,docx,pdf]
+"""
+import argparse
+import logging
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+import zipfile
+
+import requests
+from werkzeug.serving import make_server
+
+SIZES = [100 * 1024, 1024 * 1024, 5 * 1024 * 1024, 20 * 1024 * 1024]
+
+PARAGRAPH = ("Senior software engineer with eight years of Python, Docker and Kubernetes experience. "
+             "Led a remote team building data pipelines and machine learning services on AWS. ")
+
+
+def write_text(path: str, size: int):
+    with open(path, 'w', encoding='utf-8') as f:
+        written = 0
+        while written < size:
+            f.write(PARAGRAPH + '\n')
+            written += len(PARAGRAPH) + 1
+
+
+def write_docx(path: str, size: int):
+    ns = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+    paragraph = f'<w:p><w:r><w:t>{PARAGRAPH}</w:t></w:r></w:p>'
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED) as archive:
+        archive.writestr('[Content_Types].xml', '<?xml version="1.0"?><Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"/>')
+        with archive.open('word/document.xml', 'w') as document:
+            document.write(f'<?xml version="1.0"?><w:document xmlns:w="{ns}"><w:body>'.encode())
+            written = 0
+            while written < size:
+                document.write(paragraph.encode())
+                written += len(paragraph)
+            document.write(b'</w:body></w:document>')
+
+
+def write_pdf(path: str, size: int):
+    lines_per_page = 40
+    line = PARAGRAPH[:90]
+    content = ('BT /F1 9 Tf 40 800 Td 11 TL ' + ' '.join(f'({line}) \'' for _ in range(lines_per_page)) + ' ET').encode()
+    pages = max(1, size // (len(content) + 120))
+
+    offsets = []
+    with open(path, 'wb') as f:
+        def obj(number: int, body: bytes):
+            offsets.append(f.tell())
+            f.write(f'{number} 0 obj\n'.encode() + body + b'\nendobj\n')
+
+        f.write(b'%PDF-1.4\n')
+        kids = ' '.join(f'{4 + 2 * i} 0 R' for i in range(pages))
+        obj(1, b'<< /Type /Catalog /Pages 2 0 R >>')
+        obj(2, f'<< /Type /Pages /Kids [{kids}] /Count {pages} >>'.encode())
+        obj(3, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+        for i in range(pages):
+            page, stream = 4 + 2 * i, 5 + 2 * i
+            obj(page, f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Resources << /Font << /F1 3 0 R >> >> /Contents {stream} 0 R >>'.encode())
+            obj(stream, f'<< /Length {len(content)} >>\nstream\n'.encode() + content + b'\nendstream')
+
+        xref = f.tell()
+        f.write(f'xref\n0 {len(offsets) + 1}\n0000000000 65535 f \n'.encode())
+        for offset in offsets:
+            f.write(f'{offset:010d} 00000 n \n'.encode())
+        f.write(f'trailer\n<< /Size {len(offsets) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+
+
+WRITERS = {'text': ('.txt', write_text), 'docx': ('.docx', write_docx), 'pdf': ('.pdf', write_pdf)}
+
+
+def multipart_file(resume_path: str, body_path: str) -> str:
+    """Write a multipart body around the resume to disk so the client can stream it"""
+    boundary = uuid.uuid4().hex
+    with open(body_path, 'wb') as body, open(resume_path, 'rb') as resume:
+        body.write(f'--{boundary}\r\nContent-Disposition: form-data; name="resume"; '
+                   f'filename="{os.path.basename(resume_path)}"\r\nContent-Type: application/octet-stream\r\n\r\n'.encode())
+        while True:
+            block = resume.read(1024 * 1024)
+            if not block:
+                break
+            body.write(block)
+        body.write(f'\r\n--{boundary}--\r\n'.encode())
+    return boundary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--formats', default='text,docx,pdf')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    os.environ.setdefault('JOB_DB_PATH', '')
+    os.environ['REMOTEOK_FEED_FILE'] = ''
+    from app import app, job_scraper
+    # Keep the job search out of the measurement; only the resume pipeline matters here
+    job_scraper.sources['remoteok'].enabled = False
+
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/api/analyze-resume"
+
+    print(f"{'format':<6} {'size':>8} {'status':>6} {'time':>8} {'peak':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in args.formats.split(','):
+            extension, writer = WRITERS[fmt]
+            for size in SIZES:
+                resume_path = os.path.join(tmp, f'resume-{size}{extension}')
+                body_path = os.path.join(tmp, 'body.bin')
+                writer(resume_path, size)
+                boundary = multipart_file(resume_path, body_path)
+
+                tracemalloc.start()
+                started = time.perf_counter()
+                with open(body_path, 'rb') as body:
+                    response = requests.post(url, data=body, headers={
+                        'Content-Type': f'multipart/form-data; boundary={boundary}',
+                        'Content-Length': str(os.path.getsize(body_path))
+                    })
+                elapsed = time.perf_counter() - started
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                actual = os.path.getsize(resume_path)
+                print(f"{fmt:<6} {actual / 1024:>6.0f}KB {response.status_code:>6} {elapsed:>7.2f}s {peak / 1024 / 1024:>8.2f}MB")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
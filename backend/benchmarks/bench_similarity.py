@@ -0,0 +1,76 @@
+"""
+TF-IDF similarity matching: sparse matrix product vs. Python loops over job dicts
+
+The loop baseline scores the same normalized vectors, held as one dict per
+posting, the way a per-request scan over _scrape_remoteok's output would.
+
+Run from backend/:  python -m benchmarks.bench_similarity [sizes...]
+"""
+import heapq
+import sys
+import time
+
+from benchmarks.synthetic import make_feed
+from services.job_store import JobStore, profile_terms
+from services.similarity import TfidfMatrix
+
+PROFILES = {
+    'query': 'senior python developer',
+    'resume': ("Senior backend engineer. Eight years building Python and Go services on AWS with Docker and "
+               "Kubernetes; designed data pipelines, REST APIs and SQL schemas; led a remote team, mentored "
+               "junior developers and shipped product features with React frontends. ") * 3,
+}
+
+
+def loop_top_k(vectors, matrix: TfidfMatrix, term_names, term_counts, k: int):
+    ids, weights = matrix.vectorize(term_counts)
+    terms = {term_names[term_id]: float(weight) for term_id, weight in zip(ids.tolist(), weights.tolist())}
+    scores = ((sum(weight * vector.get(term, 0.0) for term, weight in terms.items()), doc_id)
+              for doc_id, vector in enumerate(vectors))
+    return heapq.nlargest(k, (item for item in scores if item[0] > 0))
+
+
+def dict_vectors(matrix: TfidfMatrix):
+    """The matrix unpacked into one {term: weight} dict per posting"""
+    vectors = [{} for _ in range(matrix.doc_count)]
+    for term, term_id in matrix.vocabulary.items():
+        start, end = matrix.indptr[term_id], matrix.indptr[term_id + 1]
+        for doc_id, weight in zip(matrix.indices[start:end].tolist(), matrix.data[start:end].tolist()):
+            vectors[doc_id][term] = weight
+    return vectors
+
+
+def bench(size: int, repeat: int = 5):
+    feed = make_feed(size)
+    store = JobStore()
+    fields = [store._document_fields(job) for job in feed[1:]]
+
+    started = time.perf_counter()
+    matrix = TfidfMatrix.fit(fields)
+    fit_s = time.perf_counter() - started
+    matrix_mb = (matrix.indptr.nbytes + matrix.indices.nbytes + matrix.data.nbytes) / 1024 / 1024
+
+    term_names = {term_id: term for term, term_id in matrix.vocabulary.items()}
+    vectors = dict_vectors(matrix)
+
+    print(f"{size:>8} postings | fit {fit_s:5.2f}s | {len(matrix.data):>9} non-zeros, {matrix_mb:6.1f} MB")
+    for name, text in PROFILES.items():
+        term_counts = profile_terms(text)
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            matrix.top_k(term_counts, k=20)
+        matrix_ms = (time.perf_counter() - started) * 1000 / repeat
+
+        started = time.perf_counter()
+        loop_top_k(vectors, matrix, term_names, term_counts, k=20)
+        loop_ms = (time.perf_counter() - started) * 1000
+
+        print(f"{'':>8} {name:<8} | {len(term_counts):>3} terms | loop {loop_ms:9.2f} ms | "
+              f"sparse {matrix_ms:8.2f} ms | {loop_ms / matrix_ms:6.1f}x")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    for size in sizes:
+        bench(size)
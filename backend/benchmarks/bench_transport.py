@@ -0,0 +1,119 @@
+"""
+Upstream transport under injected faults, against the local stub
+
+  flaky     30% of requests answer 503 or drop the connection: success rate
+            of a plain requests.Session vs. HttpTransport with retries
+  outage    the upstream fails every request: per-call latency before and
+            after the circuit breaker opens
+  recovery  the upstream comes back: the breaker half-opens after its reset
+            timeout and closes on the first good probe
+  pooling   bursts of 32 concurrent fetches: TCP connections opened with the
+            default 10-connection pool (idle extras are discarded after every
+            burst) vs. a pool sized to the concurrency
+
+Run from backend/:  python -m benchmarks.bench_transport
+"""
+import logging
+import threading
+import time
+
+import requests
+
+from benchmarks.stub_upstream import StubUpstream
+from services.transport import CircuitOpenError, HttpTransport
+
+
+def attempt_all(get, url: str, calls: int):
+    ok = 0
+    started = time.perf_counter()
+    for _ in range(calls):
+        try:
+            if get(url).status_code == 200:
+                ok += 1
+        except requests.RequestException:
+            pass
+    return ok, (time.perf_counter() - started) / calls * 1000
+
+
+def flaky(stub: StubUpstream, calls: int = 200):
+    stub.set_faults(fail_rate=0.15, drop_rate=0.15)
+    session = requests.Session()
+    transport = HttpTransport(max_retries=3, backoff_base=0.01, backoff_max=0.05, failure_threshold=50)
+
+    plain_ok, plain_ms = attempt_all(lambda url: session.get(url, timeout=5), stub.url, calls)
+    retry_ok, retry_ms = attempt_all(transport.get, stub.url, calls)
+    print(f"flaky     | session {plain_ok}/{calls} ok ({plain_ms:.1f} ms/call) | "
+          f"transport {retry_ok}/{calls} ok ({retry_ms:.1f} ms/call, {transport.get_stats()['retries']} retries)")
+
+
+def outage(stub: StubUpstream, calls: int = 20):
+    stub.set_faults(fail_rate=1.0)
+    errors_before = stub.requests['error']
+    transport = HttpTransport(max_retries=2, backoff_base=0.05, backoff_max=0.2, failure_threshold=3, reset_timeout=1.0)
+
+    timings = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        try:
+            transport.get(stub.url)
+        except CircuitOpenError:
+            pass
+        timings.append((time.perf_counter() - started) * 1000)
+
+    stats = transport.get_stats()
+    print(f"outage    | first 3 calls {sum(timings[:3]) / 3:.1f} ms each (with retries) | "
+          f"after breaker opened {sum(timings[3:]) / len(timings[3:]):.3f} ms each | "
+          f"short-circuited {stats['short_circuited']}, upstream hit {stub.requests['error'] - errors_before} times")
+    return transport
+
+
+def recovery(stub: StubUpstream, transport: HttpTransport):
+    stub.set_faults()
+    host = next(iter(transport.get_stats()['upstreams']))
+    before = transport.breaker(host).state
+    time.sleep(transport.reset_timeout)
+    status = transport.get(stub.url).status_code
+    print(f"recovery  | breaker {before} -> probe HTTP {status} -> {transport.breaker(host).state}")
+
+
+def pooling(stub: StubUpstream, threads: int = 32, calls: int = 20):
+    stub.set_faults()
+    stub.delay = 0.01
+    for pool_size in (10, threads):
+        transport = HttpTransport(pool_size=pool_size)
+        burst = threading.Barrier(threads)
+        before = stub.connections
+
+        def worker():
+            for _ in range(calls):
+                burst.wait()
+                transport.get(stub.url)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        started = time.perf_counter()
+        for worker_thread in workers:
+            worker_thread.start()
+        for worker_thread in workers:
+            worker_thread.join()
+        elapsed = time.perf_counter() - started
+        print(f"pooling   | pool {pool_size:>2}: {calls} bursts of {threads} requests in {elapsed:.2f}s, "
+              f"{stub.connections - before} TCP connections opened")
+        transport.close()
+    stub.delay = 0.0
+
+
+def main():
+    # Also silences urllib3's "connection pool is full" warnings in the pooling run
+    logging.disable(logging.WARNING)
+    stub = StubUpstream(jobs=20).start()
+    try:
+        flaky(stub)
+        transport = outage(stub)
+        recovery(stub, transport)
+        pooling(stub)
+    finally:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
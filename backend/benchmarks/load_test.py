@@ -0,0 +1,148 @@
+"""
+Load test for /api/search-jobs-simple
+
+By default this starts a stub upstream and a gunicorn server pointed at it
+(on a free port, with a throwaway job database), drives it with concurrent
+clients, and reports requests per second and latency percentiles.
+Pass --url to target a server that is already running instead.
+
+Run from backend/:  python -m benchmarks.load_test --concurrency 32 --duration 15
+"""
+import argparse
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import requests
+
+from benchmarks.stub_upstream import StubUpstream
+
+KEYWORDS = ['python developer', 'senior react', 'data scientist', 'devops kubernetes', 'marketing manager',
+            'nurse', 'frontend javascript', 'backend api', 'rust engineer', 'product designer']
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_healthy(base_url: str, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become healthy")
+
+
+def run_load(base_url: str, concurrency: int, duration: float):
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def client(worker_id: int):
+        session = requests.Session()
+        local = []
+        i = worker_id
+        while time.monotonic() < stop_at:
+            keywords = KEYWORDS[i % len(KEYWORDS)]
+            i += 1
+            started = time.perf_counter()
+            try:
+                response = session.post(f"{base_url}/api/search-jobs-simple", json={'keywords': keywords}, timeout=30)
+                ok = response.status_code == 200
+            except requests.RequestException:
+                ok = False
+            elapsed = time.perf_counter() - started
+            if ok:
+                local.append(elapsed)
+            else:
+                with lock:
+                    errors[0] += 1
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.monotonic() - started
+
+    latencies.sort()
+    ms = lambda value: value * 1000
+    print(f"requests   : {len(latencies)} ok, {errors[0]} failed in {wall:.1f}s ({concurrency} clients)")
+    print(f"throughput : {len(latencies) / wall:.1f} req/s")
+    print(f"latency ms : p50 {ms(percentile(latencies, 50)):.1f} | p90 {ms(percentile(latencies, 90)):.1f} | "
+          f"p99 {ms(percentile(latencies, 99)):.1f} | max {ms(latencies[-1] if latencies else 0):.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', help='target an already running server instead of spawning one')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--upstream-jobs', type=int, default=2000)
+    parser.add_argument('--upstream-delay', type=float, default=0.05)
+    parser.add_argument('--cold', action='store_true', help='disable the search result cache')
+    args = parser.parse_args()
+
+    if args.url:
+        wait_until_healthy(args.url)
+        run_load(args.url.rstrip('/'), args.concurrency, args.duration)
+        return
+
+    stub = StubUpstream(jobs=args.upstream_jobs, delay=args.upstream_delay).start()
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            HOST='127.0.0.1',
+            PORT=str(port),
+            WEB_WORKERS=str(args.workers),
+            WEB_THREADS=str(args.threads),
+            REMOTEOK_API_URL=stub.url,
+            JOB_DB_PATH=os.path.join(tmp, 'jobs.db'),
+        )
+        if args.cold:
+            env['RESULT_CACHE_SIZE'] = '0'
+
+        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--log-level', 'warning', 'app:app'],
+            cwd=backend_dir, env=env
+        )
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            wait_until_healthy(base_url)
+            print(f"gunicorn: {args.workers} workers x {args.threads} threads, upstream stub "
+                  f"{args.upstream_jobs} jobs / {args.upstream_delay * 1000:.0f} ms delay")
+            run_load(base_url, args.concurrency, args.duration)
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=60)
+            stub.stop()
+
+
+if __name__ == '__main__':
+    main()
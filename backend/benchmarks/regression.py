@@ -0,0 +1,338 @@
+"""
+Performance regression suite for the backend hot paths
+
+Runs each case against synthetic corpora (1k to 1M postings, see
+benchmarks.synthetic) and records throughput, latency percentiles and
+allocations (tracemalloc peak and retained bytes of one operation):
+
+  analyze_text        AIReadyTextAnalyzer.analyze_text, one posting's text per call (cache off)
+  job_matches         JobScraper._job_matches_keywords over the whole corpus
+  clean_description   JobScraper._clean_description over the whole corpus
+  remove_duplicates   NearDuplicateDetector.deduplicate over the projected corpus
+  api_*               Flask endpoints in-process (test client), with the corpus
+                      served by a local stub standing in for RemoteOK (result
+                      caches off, no job database, no scheduler)
+
+Results are compared with a JSON baseline; the run fails (exit status 1)
+when throughput drops, or p50 latency or peak allocations grow, by more
+than --threshold. p90/p99 are recorded but not gated (too noisy for short
+runs).
+Baselines are machine-specific: record one on the machine you compare on.
+
+Run from backend/:
+  python -m benchmarks.regression                        # compare (records the baseline if there is none)
+  python -m benchmarks.regression --update-baseline      # record a new baseline
+  python -m benchmarks.regression --sizes 1000000 --cases job_matches clean_description
+"""
+import argparse
+import gc
+import itertools
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.load_test import KEYWORDS, percentile
+from benchmarks.synthetic import make_feed
+
+SIZES = [1_000, 10_000, 100_000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Gated metrics -> whether a higher value is better
+GATED = {'throughput': True, 'p50_ms': False, 'alloc_peak_kb': False}
+# Differences below these are noise whatever the ratio
+NOISE_FLOOR = {'p50_ms': 0.005, 'alloc_peak_kb': 64}
+
+
+class Corpus:
+    """One synthetic corpus and the views of it the cases need, built on first use"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.feed = make_feed(size)
+        self.raw = self.feed[1:]
+        self._jobs = None
+        self._texts = None
+
+    @property
+    def jobs(self) -> List[Dict]:
+        """Postings projected onto the API's job shape"""
+        if self._jobs is None:
+            scraper = Harness.get().scraper
+            self._jobs = [scraper._process_remoteok_job(job) for job in self.raw]
+        return self._jobs
+
+    @property
+    def texts(self) -> List[str]:
+        """One search-like text per posting: title and tags"""
+        if self._texts is None:
+            self._texts = [f"{job['position']} {' '.join(job['tags'])}" for job in self.raw]
+        return self._texts
+
+
+class Harness:
+    """The app, wired to a stub upstream, shared by every case"""
+
+    _instance = None
+
+    def __init__(self):
+        from benchmarks.stub_upstream import StubUpstream
+
+        self.stub = StubUpstream(feed=make_feed(0)).start()
+        os.environ.update(
+            REMOTEOK_API_URL=self.stub.url,
+            JOB_DB_PATH='',
+            RESULT_CACHE_SIZE='0',
+            FEED_STREAMING='0',
+            SCHEDULER_ENABLED='0'
+        )
+        import app
+
+        self.app = app
+        self.scraper = app.job_scraper
+        self.client = app.app.test_client()
+        self.size = None
+
+    @classmethod
+    def get(cls) -> 'Harness':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def serve(self, corpus: Corpus):
+        """Point the stub at corpus and reindex it"""
+        if self.size != corpus.size:
+            self.stub.set_feed(corpus.feed)
+            self.scraper.feed_cache.refresh(self.scraper.sources['remoteok'].api_url)
+            self.size = corpus.size
+
+    def close(self):
+        self.stub.stop()
+
+
+# name -> (unit, largest corpus it runs on, setup(corpus) -> (operation, units per operation))
+CASES: Dict[str, Tuple[str, int, Callable]] = {}
+
+
+def case(name: str, unit: str, max_size: int = 1_000_000):
+    def register(setup):
+        CASES[name] = (unit, max_size, setup)
+        return setup
+    return register
+
+
+@case('analyze_text', 'queries')
+def analyze_text(corpus: Corpus):
+    analyzer = Harness.get().app.AIReadyTextAnalyzer(cache_size=0)
+    texts = itertools.cycle(corpus.texts)
+    return lambda: analyzer.analyze_text(next(texts)), 1
+
+
+@case('job_matches', 'postings')
+def job_matches(corpus: Corpus):
+    scraper = Harness.get().scraper
+    queries = itertools.cycle(keywords.lower() for keywords in KEYWORDS)
+
+    def scan():
+        keywords = next(queries)
+        return sum(1 for job in corpus.raw if scraper._job_matches_keywords(job, keywords))
+    return scan, corpus.size
+
+
+@case('clean_description', 'postings')
+def clean_description(corpus: Corpus):
+    scraper = Harness.get().scraper
+    descriptions = [job['description'] for job in corpus.raw]
+    return lambda: [scraper._clean_description(description) for description in descriptions], corpus.size
+
+
+@case('remove_duplicates', 'postings', max_size=100_000)
+def remove_duplicates(corpus: Corpus):
+    scraper = Harness.get().scraper
+    jobs = corpus.jobs
+    # Calls the detector directly: _remove_duplicates leaves RemoteOK reposts to ingest
+    return lambda: scraper.deduplicator.deduplicate(jobs), corpus.size
+
+
+def endpoint(path: str, payloads):
+    def setup(corpus: Corpus):
+        harness = Harness.get()
+        harness.serve(corpus)
+        bodies = itertools.cycle(payloads)
+
+        def request():
+            response = harness.client.post(path, json=next(bodies))
+            if response.status_code != 200:
+                raise RuntimeError(f"{path} answered {response.status_code}: {response.get_data(as_text=True)[:200]}")
+            return response.get_data()
+        return request, 1
+    return setup
+
+
+case('api_search_simple', 'requests', max_size=100_000)(
+    endpoint('/api/search-jobs-simple', [{'keywords': keywords} for keywords in KEYWORDS]))
+case('api_search_filtered', 'requests', max_size=100_000)(
+    endpoint('/api/search-jobs', [{'keywords': keywords, 'filters': {'seniority': 'senior', 'salary_min': 60000}}
+                                  for keywords in KEYWORDS]))
+case('api_analyze_text', 'requests', max_size=100_000)(
+    endpoint('/api/analyze-text', [{'search_text': f"remote {keywords} job"} for keywords in KEYWORDS]))
+case('api_match_jobs', 'requests', max_size=100_000)(
+    endpoint('/api/match-jobs', [{'text': f"{keywords} with sql, docker and aws experience"} for keywords in KEYWORDS]))
+
+
+def measure(setup: Callable, corpus: Corpus, repeat: int, min_time: float, min_runs: int, max_runs: int) -> Dict:
+    """
+    Time the operation repeat times (each for min_time and at least min_runs
+    calls) and keep the fastest repeat, which is the one least disturbed by
+    whatever else the machine was doing
+    """
+    operation, units = setup(corpus)
+    operation()  # warm up caches and lazy state
+    # Keep the corpus (and whatever earlier cases left alive) out of the collector's
+    # generations, so collections cost the same whichever cases ran before
+    gc.collect()
+    gc.freeze()
+
+    latencies = None
+    for _ in range(repeat):
+        sample = []
+        started = time.perf_counter()
+        while len(sample) < min_runs or (time.perf_counter() - started < min_time and len(sample) < max_runs):
+            op_started = time.perf_counter()
+            operation()
+            sample.append(time.perf_counter() - op_started)
+        if latencies is None or sum(sample) / len(sample) < sum(latencies) / len(latencies):
+            latencies = sample
+
+    # Separate traced run, on a fresh operation so it always traces the same
+    # (second) input; tracing slows everything down too much to time
+    operation, _ = setup(corpus)
+    operation()
+    tracemalloc.start()
+    try:
+        operation()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.unfreeze()
+
+    latencies.sort()
+    ms = lambda value: round(value * 1000, 4)
+    return {
+        'runs': len(latencies),
+        'throughput': round(units * len(latencies) / sum(latencies), 2),
+        'p50_ms': ms(percentile(latencies, 50)),
+        'p90_ms': ms(percentile(latencies, 90)),
+        'p99_ms': ms(percentile(latencies, 99)),
+        'alloc_peak_kb': round(peak / 1024, 1),
+        'alloc_retained_kb': round(retained / 1024, 1)
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Descriptions of every gated metric that regressed by more than threshold"""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        for metric, higher_is_better in GATED.items():
+            old, new = previous.get(metric), result.get(metric)
+            if not old or new is None or abs(new - old) < NOISE_FLOOR.get(metric, 0):
+                continue
+            change = (new - old) / old
+            if (change < -threshold) if higher_is_better else (change > threshold):
+                regressions.append(f"{key} {metric}: {old} -> {new} ({change:+.0%})")
+    return regressions
+
+
+def change_column(result: Dict, previous: Optional[Dict]) -> str:
+    if not previous or not previous.get('throughput'):
+        return ''
+    return f" | vs baseline {(result['throughput'] - previous['throughput']) / previous['throughput']:+6.1%}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='corpus sizes (up to 1000000)')
+    parser.add_argument('--cases', nargs='+', help=f"any of {', '.join(CASES)} (default: all)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--update-baseline', action='store_true', help='record this run as the baseline')
+    parser.add_argument('--threshold', type=float, default=float(os.getenv('BENCH_REGRESSION_THRESHOLD', '0.25')),
+                        help='allowed relative regression before failing (default 0.25)')
+    parser.add_argument('--output', help='also write this run\'s results to a JSON file')
+    parser.add_argument('--repeat', type=int, default=3, help='measurements per case; the fastest is kept')
+    parser.add_argument('--min-time', type=float, default=0.5, help='seconds each measurement keeps calling the case')
+    parser.add_argument('--min-runs', type=int, default=1, help='calls per measurement however long they take')
+    parser.add_argument('--max-runs', type=int, default=100_000)
+    args = parser.parse_args()
+    unknown = set(args.cases or []) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    logging.disable(logging.WARNING)
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+    results = {}
+    try:
+        for size in sorted(args.sizes):
+            cases = [name for name in (args.cases or CASES) if size <= CASES[name][1]]
+            if not cases:
+                continue
+            corpus = Corpus(size)
+            for name in cases:
+                unit, _, setup = CASES[name]
+                key = f"{name}@{size}"
+                result = results[key] = measure(setup, corpus, args.repeat, args.min_time, args.min_runs, args.max_runs)
+                print(f"{name:<20} {size:>8} | {result['throughput']:>12,.0f} {unit}/s | p50 {result['p50_ms']:9.3f} ms "
+                      f"p90 {result['p90_ms']:9.3f} ms p99 {result['p99_ms']:9.3f} ms | alloc peak "
+                      f"{result['alloc_peak_kb']:9.1f} KB{change_column(result, baseline.get(key))}", flush=True)
+            del corpus
+    finally:
+        if Harness._instance is not None:
+            Harness._instance.close()
+
+    report = {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'threshold': args.threshold
+        },
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if not baseline:
+        # Keep the results of cases/sizes this run didn't cover when re-recording
+        if args.update_baseline and os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                report['results'] = dict(json.load(f)['results'], **results)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Recorded baseline {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    compared = sum(1 for key in results if key in baseline)
+    print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline} "
+          f"({compared} of {len(results)} results had a baseline)")
+
+
+if __name__ == '__main__':
+    main()
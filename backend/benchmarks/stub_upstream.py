@@ -0,0 +1,141 @@
+"""
+Local stand-in for the RemoteOK API
+
+Serves a synthetic feed with an ETag and Last-Modified (answering
+conditional GETs with 304)
+and an optional response delay, so the backend can be benchmarked without
+touching the real upstream. Faults can be injected: a fraction of requests
+answered with an error status, or dropped without any response.
+
+Run from backend/:  python -m benchmarks.stub_upstream --port 8900 --jobs 5000 --delay 0.05 [--fail-rate 0.3]
+"""
+import argparse
+import email.utils
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.synthetic import make_feed
+
+
+class QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients that stop reading early (streaming parsers) reset the connection
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StubUpstream:
+    """Threaded HTTP server serving one JSON feed at any path"""
+
+    def __init__(self, feed=None, jobs: int = 1000, delay: float = 0.0, host: str = '127.0.0.1', port: int = 0,
+                 fail_rate: float = 0.0, error_status: int = 503, drop_rate: float = 0.0, seed: int = 0):
+        self.delay = delay
+        self.requests = {'200': 0, '304': 0, 'error': 0, 'dropped': 0}
+        self.connections = 0
+        # Headers of the most recent request, to check what a client sent
+        self.last_headers = {}
+        self.set_feed(feed if feed is not None else make_feed(jobs))
+        self.set_faults(fail_rate, error_status, drop_rate)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_GET(self):
+                stub.last_headers = dict(self.headers)
+                if stub.delay:
+                    time.sleep(stub.delay)
+
+                with stub._lock:
+                    roll = stub._rng.random()
+                if roll < stub.drop_rate:
+                    stub.requests['dropped'] += 1
+                    self.close_connection = True
+                    return
+                if roll < stub.drop_rate + stub.fail_rate:
+                    stub.requests['error'] += 1
+                    self.send_response(stub.error_status)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                if self.headers.get('If-None-Match') == stub.etag:
+                    stub.requests['304'] += 1
+                    self.send_response(304)
+                    self.send_header('ETag', stub.etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                stub.requests['200'] += 1
+                body = stub.body
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('ETag', stub.etag)
+                self.send_header('Last-Modified', stub.last_modified)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = QuietServer((host, port), Handler)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def set_feed(self, feed):
+        self.body = json.dumps(feed).encode('utf-8')
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest() + '"'
+        self.last_modified = email.utils.formatdate(usegmt=True)
+
+    def set_faults(self, fail_rate: float = 0.0, error_status: int = 503, drop_rate: float = 0.0):
+        """Answer fail_rate of requests with error_status and drop drop_rate without a response"""
+        self.fail_rate = fail_rate
+        self.error_status = error_status
+        self.drop_rate = drop_rate
+
+    def start(self) -> 'StubUpstream':
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--jobs', type=int, default=1000)
+    parser.add_argument('--delay', type=float, default=0.0)
+    parser.add_argument('--fail-rate', type=float, default=0.0)
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--drop-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    stub = StubUpstream(jobs=args.jobs, delay=args.delay, host=args.host, port=args.port,
+                        fail_rate=args.fail_rate, error_status=args.error_status, drop_rate=args.drop_rate)
+    print(f"Serving {args.jobs} synthetic postings at {stub.url}")
+    stub.server.serve_forever()
@@ -0,0 +1,38 @@
+"""
+Synthetic RemoteOK-shaped feeds for benchmarks
+Deterministic for a given seed so runs are comparable
+"""
+import random
+from typing import Dict, List
+
+ROLES = ['Developer', 'Engineer', 'Designer', 'Manager', 'Analyst', 'Scientist', 'Nurse', 'Teacher', 'Accountant', 'Chef']
+LEVELS = ['', 'Senior ', 'Junior ', 'Lead ', 'Principal ', 'Sr. ']
+AREAS = ['Python', 'JavaScript', 'React', 'Backend', 'Frontend', 'Data', 'DevOps', 'Marketing', 'Sales', 'Product', 'Mobile', 'Security']
+TAGS = ['python', 'javascript', 'react', 'java', 'sql', 'aws', 'docker', 'kubernetes', 'git', 'linux', 'html', 'css',
+        'api', 'golang', 'rust', 'design', 'marketing', 'sales', 'healthcare', 'finance', 'education', 'remote']
+WORDS = ['build', 'scale', 'maintain', 'services', 'customers', 'platform', 'team', 'product', 'growth', 'systems',
+         'data', 'pipelines', 'cloud', 'modern', 'development', 'experience', 'collaborate', 'ship', 'features', 'quality']
+COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark', 'Wayne', 'Wonka', 'Tyrell', 'Cyberdyne']
+
+
+def make_job(rng: random.Random, job_id: int) -> Dict:
+    area = rng.choice(AREAS)
+    words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(30, 70)))
+    salary_min = rng.choice([0, 0, 40000, 60000, 80000, 100000])
+    return {
+        'id': str(job_id),
+        'position': f"{rng.choice(LEVELS)}{area} {rng.choice(ROLES)}",
+        'company': f"{rng.choice(COMPANIES)} {rng.choice(['Inc', 'LLC', 'Labs', 'Co'])}",
+        'description': f"<p>We are hiring a {area.lower()} expert.</p><p>{words}</p>",
+        'tags': rng.sample(TAGS, rng.randint(2, 6)),
+        'location': rng.choice(['Remote', 'Worldwide', 'USA', 'Europe', 'Berlin', 'New York']),
+        'salary_min': salary_min,
+        'salary_max': salary_min + 30000 if salary_min else 0,
+        'date': '2026-01-01T00:00:00+00:00'
+    }
+
+
+def make_feed(n: int, seed: int = 42) -> List[Dict]:
+    """RemoteOK feed of n postings, including the leading metadata row"""
+    rng = random.Random(seed)
+    return [{'legal': 'synthetic feed'}] + [make_job(rng, i) for i in range(n)]
@@ -0,0 +1,99 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Serving: `python app.py` runs the Flask dev server, gunicorn.conf.py the production one
+HOST = os.getenv('HOST', '0.0.0.0')
+PORT = int(os.getenv('PORT', '5001'))
+DEBUG = os.getenv('FLASK_DEBUG', '0') == '1'
+WEB_WORKERS = int(os.getenv('WEB_WORKERS', str(min(4, (os.cpu_count() or 1) * 2))))
+WEB_THREADS = int(os.getenv('WEB_THREADS', '8'))
+GRACEFUL_TIMEOUT = int(os.getenv('GRACEFUL_TIMEOUT', '30'))
+# 'threaded' serves app:app on gthread workers; 'async' serves async_app:app on aiohttp workers
+WEB_MODE = os.getenv('WEB_MODE', 'threaded')
+
+REMOTEOK_API_URL = os.getenv('REMOTEOK_API_URL', 'https://remoteok.io/api')
+
+# Upstream feed cache: how long a fetched feed is served before revalidating
+FEED_CACHE_TTL = float(os.getenv('FEED_CACHE_TTL', '300'))
+
+# Per-source deadlines (seconds) for the concurrent search fan-out
+SOURCE_TIMEOUTS = {
+    'remoteok': float(os.getenv('REMOTEOK_TIMEOUT', '8')),
+    'mock': float(os.getenv('MOCK_TIMEOUT', '1'))
+}
+# Threads per source for search fan-out (each source has its own pool)
+SEARCH_WORKERS = int(os.getenv('SEARCH_WORKERS', '8'))
+
+# Upstream HTTP transport: timeouts, jittered retries, circuit breaker and
+# keep-alive pool sizes (UPSTREAM_HOST_POOL_SIZES is "host=size,host=size")
+UPSTREAM_CONNECT_TIMEOUT = float(os.getenv('UPSTREAM_CONNECT_TIMEOUT', '3.05'))
+UPSTREAM_READ_TIMEOUT = float(os.getenv('UPSTREAM_READ_TIMEOUT', '10'))
+UPSTREAM_RETRIES = int(os.getenv('UPSTREAM_RETRIES', '2'))
+UPSTREAM_BACKOFF_BASE = float(os.getenv('UPSTREAM_BACKOFF_BASE', '0.2'))
+UPSTREAM_BACKOFF_MAX = float(os.getenv('UPSTREAM_BACKOFF_MAX', '2'))
+UPSTREAM_POOL_SIZE = int(os.getenv('UPSTREAM_POOL_SIZE', '16'))
+UPSTREAM_HOST_POOL_SIZES = {
+    host.strip(): int(size)
+    for host, _, size in (item.partition('=') for item in os.getenv('UPSTREAM_HOST_POOL_SIZES', '').split(',') if item.strip())
+}
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5'))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv('CIRCUIT_RESET_TIMEOUT', '30'))
+
+# Near-duplicate merging: estimated Jaccard similarity (0-1] above which two
+# postings are the same job, and MinHash signature length
+DEDUP_THRESHOLD = float(os.getenv('DEDUP_THRESHOLD', '0.7'))
+DEDUP_NUM_PERM = int(os.getenv('DEDUP_NUM_PERM', '64'))
+
+# Search result paging
+DEFAULT_PAGE_SIZE = int(os.getenv('DEFAULT_PAGE_SIZE', '20'))
+MAX_PAGE_SIZE = int(os.getenv('MAX_PAGE_SIZE', '100'))
+# Deepest offset served: deeper pages make every source rank and dedupe that many matches
+MAX_OFFSET = int(os.getenv('MAX_OFFSET', '1000'))
+
+# /api/analyze-text/batch: batches at or above the threshold run on a process pool
+BATCH_MAX_ITEMS = int(os.getenv('BATCH_MAX_ITEMS', '10000'))
+BATCH_PARALLEL_THRESHOLD = int(os.getenv('BATCH_PARALLEL_THRESHOLD', '1000'))
+BATCH_WORKERS = int(os.getenv('BATCH_WORKERS', str(os.cpu_count() or 2)))
+# How pool workers are started: forkserver or spawn (fork is unsafe from the threaded server)
+BATCH_START_METHOD = os.getenv('BATCH_START_METHOD', 'forkserver' if os.name == 'posix' else 'spawn')
+
+# LRU caches for analysis results and merged search results (per normalized query)
+RESULT_CACHE_SIZE = int(os.getenv('RESULT_CACHE_SIZE', '1024'))
+RESULT_CACHE_TTL = float(os.getenv('RESULT_CACHE_TTL', '120'))
+
+# Persistent job store; set JOB_DB_PATH to an empty string to read the feed directly
+JOB_DB_PATH = os.getenv('JOB_DB_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'jobs.db'))
+INGEST_INTERVAL = float(os.getenv('INGEST_INTERVAL', '300'))
+# Ingest this saved feed once at startup instead of polling RemoteOK (offline/dev)
+REMOTEOK_FEED_FILE = os.getenv('REMOTEOK_FEED_FILE', '')
+# Parse the feed incrementally: ingestion streams straight into the database in
+# constant memory, and without a database searches filter the feed as it downloads
+FEED_STREAMING = os.getenv('FEED_STREAMING', '0') == '1'
+
+# Background scheduler: refreshes each source every interval (+/- SCHEDULER_JITTER as a
+# fraction) and prewarms results for the PREWARM_TOP_N most frequent queries seen in the
+# last QUERY_LOG_WINDOW seconds. While enabled, requests only read local data
+SCHEDULER_ENABLED = os.getenv('SCHEDULER_ENABLED', '1') == '1'
+SCHEDULER_JITTER = float(os.getenv('SCHEDULER_JITTER', '0.1'))
+SOURCE_REFRESH_INTERVALS = {
+    'remoteok': float(os.getenv('REMOTEOK_REFRESH_INTERVAL', str(INGEST_INTERVAL)))
+}
+# With a database, one worker per host (whichever holds this lock file) downloads and
+# ingests upstream feeds; the other workers read the shared database
+REFRESH_LOCK_PATH = os.getenv('REFRESH_LOCK_PATH', JOB_DB_PATH + '-refresh.lock' if JOB_DB_PATH else '')
+PREWARM_TOP_N = int(os.getenv('PREWARM_TOP_N', '20'))
+PREWARM_INTERVAL = float(os.getenv('PREWARM_INTERVAL', '60'))
+QUERY_LOG_WINDOW = float(os.getenv('QUERY_LOG_WINDOW', '900'))
+
+# Per-request cProfile: requests sent with `X-Profile: 1` are profiled (sampled at
+# PROFILE_SAMPLE_RATE) and the stats written to PROFILE_DIR
+PROFILE_ENABLED = os.getenv('PROFILE_ENABLED', '0') == '1'
+PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', '1.0'))
+PROFILE_DIR = os.getenv('PROFILE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'profiles'))
+
+# Uploads: hard request-size cap, and a cap on text extracted from one resume
+MAX_UPLOAD_BYTES = int(os.getenv('MAX_UPLOAD_BYTES', str(25 * 1024 * 1024)))
+RESUME_MAX_TEXT_CHARS = int(os.getenv('RESUME_MAX_TEXT_CHARS', '200000'))
@@ -0,0 +1,41 @@
+"""
+Production serving settings
+
+    cd backend && gunicorn -c gunicorn.conf.py app:app
+    cd backend && WEB_MODE=async gunicorn -c gunicorn.conf.py async_app:app
+
+WEB_MODE picks the worker class: gthread for app:app, aiohttp's worker for
+async_app:app. Workers and threads come from WEB_WORKERS / WEB_THREADS
+(threads apply to the threaded mode only). Each worker warms up the analyzer
+and scraper singletons before it accepts traffic, and stops their background
+threads on graceful shutdown (SIGTERM, bounded by GRACEFUL_TIMEOUT). With the
+job database, one worker holds REFRESH_LOCK_PATH and refreshes upstream feeds
+for all of them.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Not `import config`: gunicorn would read a module-level `config` as its own setting
+import config as settings
+
+bind = f"{settings.HOST}:{settings.PORT}"
+workers = settings.WEB_WORKERS
+threads = settings.WEB_THREADS
+worker_class = 'aiohttp.GunicornWebWorker' if settings.WEB_MODE == 'async' else 'gthread'
+graceful_timeout = settings.GRACEFUL_TIMEOUT
+timeout = 60
+keepalive = 5
+preload_app = False
+
+
+def post_worker_init(worker):
+    # Runs after the worker imported app.py and before it starts accepting
+    from app import warmup
+    warmup()
+
+
+def worker_exit(server, worker):
+    from app import shutdown
+    shutdown()
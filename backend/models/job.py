@@ -0,0 +1,141 @@
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import orjson
+
+# The API's job shape, in output order
+FIELDS = (
+    'title', 'company', 'location', 'salary', 'description', 'url', 'source', 'posted_date', 'tags',
+    'salary_min', 'salary_max', 'location_key', 'remote', 'seniority'
+)
+# Per-request fields set on copies of a record (see Job.extended); absent while None
+EXTRAS = ('relevance', 'similarity', 'merged_sources')
+_KEYS = frozenset(FIELDS + EXTRAS)
+
+
+def _intern(value):
+    """One shared copy of a short string repeated across postings"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class Job:
+    """
+    Compact, immutable job record
+    Attributes live in __slots__ instead of a per-posting dict, repeated
+    strings (source, 'Recently', company, location, tags...) are interned,
+    and tags are a tuple. Records also read like the job dicts they replace
+    (job['title'], job.get('relevance'), dict(job)) so the search pipeline
+    handles both.
+
+    The JSON encoding of the record's fields is computed the first time it
+    is serialized and kept, so a posting returned by many requests is only
+    encoded once; extended() copies share it and append their own extras
+    """
+
+    __slots__ = FIELDS + EXTRAS + ('_encoded', '_fragment')
+
+    def __init__(self, title: str, company: str, location: str, salary: str, description: str, url: str,
+                 source: str, posted_date: str, tags=(), salary_min: Optional[int] = None,
+                 salary_max: Optional[int] = None, location_key: str = '', remote: bool = False,
+                 seniority: str = 'mid'):
+        self.title = title
+        self.company = _intern(company)
+        self.location = _intern(location)
+        self.salary = _intern(salary)
+        self.description = description
+        self.url = url
+        self.source = _intern(source)
+        self.posted_date = _intern(posted_date)
+        self.tags = tuple(_intern(tag) for tag in tags or ())
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.location_key = _intern(location_key)
+        self.remote = remote
+        self.seniority = _intern(seniority)
+        self.relevance = None
+        self.similarity = None
+        self.merged_sources = None
+        self._encoded = None
+        self._fragment = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Job':
+        """Record from a job dict (extras such as relevance are carried over)"""
+        job = cls(**{field: data[field] for field in FIELDS if field in data})
+        for extra in EXTRAS:
+            if data.get(extra) is not None:
+                setattr(job, extra, data[extra])
+        return job
+
+    def extended(self, **extras) -> 'Job':
+        """Copy with per-request extras (relevance, similarity, merged_sources) set"""
+        job = object.__new__(Job)
+        for slot in Job.__slots__:
+            setattr(job, slot, getattr(self, slot))
+        for extra, value in extras.items():
+            if extra not in EXTRAS:
+                raise KeyError(extra)
+            setattr(job, extra, value)
+        # Encoded once on the shared record, not once per copy
+        job._encoded = self._encode_fields()
+        job._fragment = None
+        return job
+
+    def to_dict(self) -> Dict:
+        return {key: getattr(self, key) if key != 'tags' else list(self.tags) for key in self.keys()}
+
+    def fragment(self) -> orjson.Fragment:
+        """The record as pre-encoded JSON, for orjson.dumps"""
+        if self._fragment is None:
+            encoded = self._encode_fields()
+            extras = {extra: getattr(self, extra) for extra in EXTRAS if getattr(self, extra) is not None}
+            if extras:
+                # Splice the extras into the cached object: '{...}' + '{"relevance":...}' -> '{...,"relevance":...}'
+                encoded = encoded[:-1] + b',' + orjson.dumps(extras)[1:]
+            self._fragment = orjson.Fragment(encoded)
+        return self._fragment
+
+    def _encode_fields(self) -> bytes:
+        """JSON object of FIELDS, encoded once per record (copies share it)"""
+        if self._encoded is None:
+            self._encoded = orjson.dumps({field: getattr(self, field) for field in FIELDS})
+        return self._encoded
+
+    # Read-only mapping interface, so records and job dicts are interchangeable
+
+    def keys(self) -> List[str]:
+        return list(FIELDS) + [extra for extra in EXTRAS if getattr(self, extra) is not None]
+
+    def __getitem__(self, key: str):
+        value = getattr(self, key, None) if key in _KEYS else None
+        if value is None and key not in FIELDS:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        return key in FIELDS or (key in EXTRAS and getattr(self, key) is not None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def items(self) -> List[Tuple[str, object]]:
+        return [(key, self[key]) for key in self.keys()]
+
+    def __repr__(self):
+        return f"Job(title={self.title!r}, company={self.company!r}, source={self.source!r})"
+
+
+def with_extras(job: Union[Job, Dict], **extras) -> Union[Job, Dict]:
+    """Copy of a job record or job dict with per-request fields added"""
+    if isinstance(job, Job):
+        return job.extended(**extras)
+    return dict(job, **extras)
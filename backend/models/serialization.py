@@ -0,0 +1,45 @@
+import decimal
+from typing import Any
+
+import orjson
+from flask.json.provider import JSONProvider
+
+from .job import Job
+
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any):
+    if isinstance(obj, Job):
+        # Pre-encoded; orjson copies the bytes straight into the output
+        return obj.fragment()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """JSON-encode an API payload with orjson; Job records are written from their cached encoding"""
+    return orjson.dumps(obj, default=_default, option=OPTIONS)
+
+
+def loads(data) -> Any:
+    return orjson.loads(data)
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider (jsonify, request.get_json) backed by dumps/loads above"""
+
+    mimetype = 'application/json'
+
+    def dumps(self, obj: Any, **kwargs) -> str:
+        return dumps(obj).decode()
+
+    def loads(self, s, **kwargs) -> Any:
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        # Skips the bytes -> str -> bytes round trip of the base implementation
+        return self._app.response_class(dumps(self._prepare_response_obj(args, kwargs)), mimetype=self.mimetype)
@@ -0,0 +1,133 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from .async_transport import AsyncHttpTransport
+from .feed_stream import CHUNK_SIZE, JsonArrayParser
+from .job_scraper import JobScraper, SourceResults
+from .metrics import stage_timer
+from .providers import JobProvider
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJobSearch:
+    """
+    JobScraper.search for the async server: upstream calls are awaited on the
+    event loop instead of holding a thread each, and identical queries in
+    flight at the same time share one fan-out (request coalescing).
+    Shares the scraper's providers, result cache, index and database
+    """
+
+    def __init__(self, scraper: JobScraper, client: AsyncHttpTransport):
+        self.scraper = scraper
+        self.client = client
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self._stats = {
+            'searches': 0,
+            'coalesced': 0
+        }
+
+    async def search(self, keywords: str, location: str = "", limit: Optional[int] = None, offset: int = 0,
+                     filters: Optional[Dict] = None) -> Dict:
+        """Same contract and result shape as JobScraper.search"""
+        self._stats['searches'] += 1
+        scraper = self.scraper
+        depth = scraper._fetch_depth(limit, offset)
+        with stage_timer('job_scraper', 'cache_lookup'):
+            cache_key = scraper._cache_key(keywords, location, filters)
+            result = scraper._cached_result(cache_key, depth)
+        cached = result is not None
+        scraper.query_log.record(cache_key, keywords, location, filters, depth)
+
+        if not cached:
+            fanout_key = cache_key + (depth,)
+            fanout = self._inflight.get(fanout_key)
+            if fanout is None:
+                fanout = self._inflight[fanout_key] = asyncio.ensure_future(self._search_sources(keywords, location, filters, depth))
+                fanout.add_done_callback(lambda _: self._inflight.pop(fanout_key, None))
+            else:
+                self._stats['coalesced'] += 1
+            # Shielded so a client disconnecting doesn't cancel the fan-out other requests are waiting on
+            result = await asyncio.shield(fanout)
+            if not result['partial']:
+                scraper.result_cache.put(cache_key, result)
+
+        return scraper._page(result, limit, offset, cached)
+
+    def get_stats(self) -> Dict:
+        return dict(self._stats, inflight=len(self._inflight))
+
+    async def _search_sources(self, keywords: str, location: str, filters: Optional[Dict] = None, depth: int = 0) -> Dict:
+        """Fan out to every source (for at least depth jobs each), then merge, rank and dedupe"""
+        providers = self.scraper._fanout_providers(keywords, location)
+        results = SourceResults(depth)
+        tasks = [(p, asyncio.ensure_future(self._fetch_from(p, keywords, location, filters, max(p.max_jobs, depth))))
+                 for p in providers]
+
+        for provider, task in tasks:
+            try:
+                results.add(provider, await asyncio.wait_for(task, timeout=results.remaining(provider)))
+            except asyncio.TimeoutError:
+                results.timed_out(provider)
+            except Exception as e:
+                results.failed(provider, e)
+        results.finish()
+
+        # Ranking, MinHash dedup and facet counting are CPU-bound; keep them off the event loop
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.scraper._merge_results, results.jobs, results.report, keywords, filters, depth)
+
+    async def _fetch_from(self, provider: JobProvider, keywords: str, location: str, filters: Optional[Dict] = None,
+                          limit: Optional[int] = None) -> List[Dict]:
+        with stage_timer('job_scraper', f'source_{provider.name}'):
+            if provider.name == 'remoteok':
+                return await self._scrape_remoteok(keywords, filters, limit)
+            if provider.name == 'mock':
+                # Generated in-process; not worth a thread hop
+                return provider.fetch_jobs(keywords, location, filters, limit)
+            # Providers without a native coroutine keep their blocking client, on the scraper's pool for that source
+            return await asyncio.get_running_loop().run_in_executor(
+                self.scraper.executors[provider.name], provider.fetch_jobs, keywords, location, filters, limit)
+
+    async def _scrape_remoteok(self, keywords: str, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Async counterpart of JobScraper._scrape_remoteok: the same sources, awaited"""
+        scraper = self.scraper
+        try:
+            provider = scraper.sources['remoteok']
+            limit = limit or provider.max_jobs
+            mode = scraper._remoteok_mode()
+            if mode == 'database':
+                return await asyncio.to_thread(scraper._search_database, keywords, limit, filters)
+
+            if mode == 'stream':
+                with stage_timer('job_scraper', 'stream_filter'):
+                    return await self.stream_remoteok(keywords, limit=limit, filters=filters)
+
+            with stage_timer('job_scraper', 'upstream_fetch'):
+                data = scraper.feed_cache.peek(provider.api_url) if scraper.local_only else None
+                if data is None:
+                    data = await scraper.feed_cache.get_async(provider.api_url, self.client)
+
+            if isinstance(data, list):
+                return await asyncio.to_thread(scraper._rank_indexed, keywords, limit, filters)
+
+        except Exception as e:
+            logger.error(f"Error scraping RemoteOK: {str(e)}")
+
+        return []
+
+    async def stream_remoteok(self, keywords: str, limit: int, filters: Optional[Dict] = None) -> List[Dict]:
+        """Async counterpart of JobScraper.stream_remoteok: filter while downloading, stop early"""
+        scraper = self.scraper
+        parser = JsonArrayParser()
+        jobs = []
+
+        async with self.client.request('GET', scraper.sources['remoteok'].api_url) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                if scraper._collect_matches(parser.feed(chunk), keywords, limit, filters, jobs) or parser.done:
+                    return jobs
+            scraper._collect_matches(parser.close(), keywords, limit, filters, jobs)
+
+        return jobs
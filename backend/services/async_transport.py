@@ -0,0 +1,108 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+import logging
+
+import aiohttp
+
+from .metrics import STAGE_SECONDS
+from .transport import RETRY_STATUSES, CircuitBreaker, CircuitOpenError, HttpTransport
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncHttpTransport:
+    """
+    asyncio counterpart of HttpTransport for the async server, on aiohttp
+    Uses the same timeouts, pool sizes, retry/backoff policy, and shares
+    the sync transport's circuit breakers and counters, so /health reports
+    one view of each upstream whichever server mode is running
+    """
+
+    def __init__(self, transport: HttpTransport):
+        self.transport = transport
+        self._clients: Dict[str, aiohttp.ClientSession] = {}
+
+    def _client(self, host: str) -> aiohttp.ClientSession:
+        """One client (and connection pool) per configured host, plus a shared default; created inside the running loop"""
+        key = host if host in self.transport.host_pool_sizes else ''
+        client = self._clients.get(key)
+        if client is None or client.closed:
+            connect_timeout, read_timeout = self.transport.timeout
+            client = self._clients[key] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, limit_per_host=self.transport.host_pool_sizes.get(host, self.transport.pool_size)),
+                timeout=aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout),
+                headers=dict(self.transport.session.headers)
+            )
+        return client
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Yield the upstream response with its body still unread
+        Transient failures are retried with jittered backoff before anything
+        is yielded; raises CircuitOpenError while the host's breaker is open
+        """
+        transport = self.transport
+        host = urlsplit(url).netloc
+        breaker = transport.breaker(host)
+        if not breaker.allow():
+            transport.count('short_circuited')
+            raise CircuitOpenError(f"Circuit open for {host}; retrying in {breaker.retry_in():.1f}s")
+
+        transport.count('requests')
+        probe = breaker.state == CircuitBreaker.HALF_OPEN
+        try:
+            response = await self._send(method, url, headers, breaker)
+        except BaseException:
+            # Cancelled (a caller's wait_for timing out) or failed without an
+            # outcome recorded: free the half-open probe for the next call
+            if probe:
+                breaker.release_probe()
+            raise
+
+        try:
+            yield response
+        finally:
+            response.release()
+
+    async def _send(self, method: str, url: str, headers: Optional[Dict[str, str]], breaker: CircuitBreaker) -> aiohttp.ClientResponse:
+        """Attempt loop of request(): retries, backoff and the breaker's verdict"""
+        transport = self.transport
+        client = self._client(urlsplit(url).netloc)
+        attempt = 0
+        while True:
+            retry_after = None
+            started = asyncio.get_running_loop().time()
+            try:
+                response = await client.request(method, url, headers=headers)
+                STAGE_SECONDS.observe(asyncio.get_running_loop().time() - started, 'transport', 'attempt')
+                if response.status not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                error = None
+                retry_after = transport.retry_after(response.headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                response, error = None, e
+
+            if attempt >= transport.max_retries:
+                transport.count('failures')
+                breaker.record_failure()
+                if error is not None:
+                    raise error
+                return response
+
+            if response is not None:
+                response.release()
+            attempt += 1
+            transport.count('retries')
+            delay = retry_after if retry_after is not None else transport.backoff(attempt)
+            reason = (str(error) or type(error).__name__) if error is not None else f"HTTP {response.status}"
+            logger.info(f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt + 1}): {reason}")
+            await asyncio.sleep(delay)
+
+    async def close(self):
+        for client in self._clients.values():
+            await client.close()
+        self._clients.clear()
@@ -0,0 +1,196 @@
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+import logging
+
+import numpy as np
+
+from models.job import with_extras
+
+logger = logging.getLogger(__name__)
+
+# Mersenne prime for the universal hash family; a * h stays below 2**63 for 32-bit h
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+# Odd multipliers folding one LSH band into a single 64-bit bucket key
+BAND_MIX = np.uint64(0x9E3779B97F4A7C15)
+# Distinct clusters a posting is checked against per bucket; bounds the work
+# in crowded buckets so the total stays linear in the number of postings
+MAX_BUCKET_PROBES = 8
+
+TAG_RE = re.compile(r'<[^>]+>')
+WORD_RE = re.compile(r'[a-z0-9+#]+')
+
+# Spelling variants that should not make two postings look different
+ABBREVIATIONS = {
+    'sr': 'senior', 'jr': 'junior', 'snr': 'senior', 'jnr': 'junior',
+    'mgr': 'manager', 'eng': 'engineer', 'dev': 'developer', 'devs': 'developers'
+}
+COMPANY_SUFFIXES = {'inc', 'llc', 'ltd', 'co', 'corp', 'corporation', 'company', 'gmbh', 'plc', 'limited', 'sa', 'ag'}
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase words with HTML stripped and common abbreviations expanded"""
+    return [ABBREVIATIONS.get(word, word) for word in WORD_RE.findall(TAG_RE.sub(' ', text or '').lower())]
+
+
+def normalize_company(company: str) -> str:
+    return ' '.join(word for word in normalize_words(company) if word not in COMPANY_SUFFIXES)
+
+
+def job_shingles(job: Dict) -> Set[str]:
+    """
+    Features compared between postings: character trigrams of the normalized
+    title and company (robust to small spelling changes) plus word bigrams of
+    the description (robust to reordered sentences)
+    """
+    shingles = set()
+    for prefix, text in (('t', ' '.join(normalize_words(job.get('title', '')))), ('c', normalize_company(job.get('company', '')))):
+        padded = f' {text} '
+        shingles.update(f'{prefix}:{padded[i:i + 3]}' for i in range(len(padded) - 2))
+
+    words = normalize_words(job.get('description', ''))
+    shingles.update(f'd:{a} {b}' for a, b in zip(words, words[1:]))
+    return shingles
+
+
+def lsh_params(threshold: float, num_perm: int, recall: float = 0.9) -> Tuple[int, int]:
+    """
+    Bands and rows per band for LSH: the most rows per band (fewest chance
+    collisions) that still make a pair right at the threshold a candidate
+    with probability >= recall. Candidates are verified afterwards, so a
+    false positive only costs one signature comparison
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= recall:
+            best = (bands, rows)
+    return best
+
+
+class NearDuplicateDetector:
+    """
+    Collapses near-duplicate postings with MinHash signatures and LSH banding
+    Each posting is hashed once; only postings sharing an LSH bucket are
+    compared, so the cost stays near-linear in the number of postings
+    instead of the O(n^2) of pairwise fuzzy matching
+    """
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = 64, seed: int = 1):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 31, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+    def signature(self, shingles: Set[str]) -> np.ndarray:
+        """MinHash signature: per permutation, the minimum hash over the shingles"""
+        if not shingles:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        # Built-in str hashes are salted per process, which is fine: signatures are never persisted
+        hashes = np.fromiter(map(hash, shingles), dtype=np.int64, count=len(shingles)).astype(np.uint64) & np.uint64(MAX_HASH)
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % np.uint64(MERSENNE_PRIME) & np.uint64(MAX_HASH)
+        return permuted.min(axis=1)
+
+    def similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.count_nonzero(first == second)) / self.num_perm
+
+    def clusters(self, jobs: Iterable[Dict], deduplicated_sources: Iterable[str] = ()) -> List[List[int]]:
+        """
+        Group job indexes into duplicate clusters, each in input order
+        Postings with the same normalized title and company are always merged,
+        except that two postings of a source in deduplicated_sources (already
+        collapsed on ingest) are never merged with each other. jobs may be any
+        iterable; only its signatures are kept
+        """
+        keys: List[Tuple[str, str]] = []
+        sources: List[str] = []
+        signatures = []
+        for job in jobs:
+            keys.append((' '.join(normalize_words(job.get('title', ''))), normalize_company(job.get('company', ''))))
+            sources.append(job.get('source'))
+            signatures.append(self.signature(job_shingles(job)))
+        separate = set(deduplicated_sources)
+        parent = list(range(len(keys)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i: int, j: int):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                # Keep the earliest (best-ranked) posting as the root
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        def mergeable(i: int, j: int) -> bool:
+            return sources[i] != sources[j] or sources[i] not in separate
+
+        exact: Dict[Tuple[str, str], int] = {}
+        for i, key in enumerate(keys):
+            if key not in exact:
+                exact[key] = i
+            elif mergeable(exact[key], i):
+                union(exact[key], i)
+
+        if len(keys) < 2:
+            return [[i] for i in range(len(keys))]
+        signatures = np.vstack(signatures)
+
+        for band in range(self.bands):
+            # One 64-bit key per posting for this band; a stable sort groups equal keys in input order
+            rows = signatures[:, band * self.rows:(band + 1) * self.rows]
+            band_keys = np.zeros(len(keys), dtype=np.uint64)
+            for column in range(rows.shape[1]):
+                band_keys = band_keys * BAND_MIX + rows[:, column]
+            order = np.argsort(band_keys, kind='stable')
+            sorted_keys = band_keys[order]
+            boundaries = np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [len(keys)]))
+
+            for start, end in zip(starts[ends - starts > 1].tolist(), ends[ends - starts > 1].tolist()):
+                members = order[start:end].tolist()
+                # Compare against one posting per cluster already seen in the bucket
+                probes = [members[0]]
+                for i in members[1:]:
+                    root = find(i)
+                    for j in probes:
+                        if find(j) == root:
+                            break
+                        if mergeable(i, j) and self.similarity(signatures[i], signatures[j]) >= self.threshold:
+                            union(i, j)
+                            break
+                    else:
+                        if len(probes) < MAX_BUCKET_PROBES:
+                            probes.append(i)
+
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(keys)):
+            groups.setdefault(find(i), []).append(i)
+        return list(groups.values())
+
+    def deduplicate(self, jobs: List[Dict], deduplicated_sources: Iterable[str] = ()) -> List[Dict]:
+        """
+        Keep the first posting of each duplicate cluster, in input order
+        Each kept posting lists the sources of every copy in merged_sources
+        """
+        unique_jobs = []
+        for members in self.clusters(jobs, deduplicated_sources):
+            sources = []
+            for i in members:
+                source = jobs[i].get('source')
+                if source and source not in sources:
+                    sources.append(source)
+            unique_jobs.append(with_extras(jobs[members[0]], merged_sources=sources))
+
+        if len(unique_jobs) < len(jobs):
+            logger.info(f"Merged {len(jobs) - len(unique_jobs)} duplicate postings")
+        return unique_jobs
@@ -0,0 +1,243 @@
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SENIORITY_LEVELS = ('junior', 'mid', 'senior', 'lead')
+
+# Checked in order against the title; anything unmatched is 'mid'
+SENIORITY_PATTERNS = [
+    ('lead', re.compile(r'\b(lead|principal|staff|head of|director)\b')),
+    ('senior', re.compile(r'\b(senior|sr)\b')),
+    ('junior', re.compile(r'\b(junior|jr|entry|intern|internship|graduate|new grad|trainee)\b')),
+]
+
+LOCATION_ALIASES = {
+    'remote': 'anywhere', 'worldwide': 'anywhere', 'global': 'anywhere', 'anywhere': 'anywhere',
+    'usa': 'united states', 'us': 'united states', 'u s': 'united states', 'united states of america': 'united states',
+    'uk': 'united kingdom', 'nyc': 'new york', 'new york ny': 'new york', 'new york city': 'new york',
+    'eu': 'europe', 'sf': 'san francisco', 'bay area': 'san francisco'
+}
+REMOTE_LOCATIONS = {'anywhere'}
+
+# Upper edges of the salary facet buckets (annual USD); the last bucket is open-ended
+SALARY_BUCKET_EDGES = (50000, 100000, 150000)
+SALARY_BUCKETS = ('under_50k', '50k_100k', '100k_150k', '150k_plus')
+HOURS_PER_YEAR = 2080
+
+# At most this many location values are reported in facet counts
+MAX_LOCATION_FACETS = 20
+
+
+def normalize_location(text: Optional[str]) -> str:
+    """Lowercased, punctuation-free location with common aliases folded ('USA' -> 'united states')"""
+    key = ' '.join(re.sub(r'[^a-z0-9]+', ' ', (text or '').lower()).split())
+    return LOCATION_ALIASES.get(key, key)
+
+
+def seniority_of(title: Optional[str]) -> str:
+    title = (title or '').lower()
+    for level, pattern in SENIORITY_PATTERNS:
+        if pattern.search(title):
+            return level
+    return 'mid'
+
+
+def _salary(value) -> Optional[int]:
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+def typed_fields(title: Optional[str], location: Optional[str], salary_min=None, salary_max=None,
+                 remote: Optional[bool] = None, hourly: bool = False) -> Dict:
+    """
+    Typed, filterable fields for one posting: numeric annual salary bounds
+    (None when unknown; hourly rates are annualized), normalized location,
+    remote flag and seniority level
+    """
+    salary_min, salary_max = _salary(salary_min), _salary(salary_max)
+    if hourly:
+        salary_min = salary_min * HOURS_PER_YEAR if salary_min else None
+        salary_max = salary_max * HOURS_PER_YEAR if salary_max else None
+
+    location_key = normalize_location(location)
+    return {
+        'salary_min': salary_min,
+        'salary_max': salary_max,
+        'location_key': location_key,
+        'remote': bool(remote) if remote is not None else location_key in REMOTE_LOCATIONS,
+        'seniority': seniority_of(title)
+    }
+
+
+def salary_bucket(salary_min, salary_max) -> str:
+    """Salary facet value of a posting, by its lower known bound"""
+    lower = salary_min or salary_max
+    if not lower:
+        return 'unspecified'
+    return SALARY_BUCKETS[sum(1 for edge in SALARY_BUCKET_EDGES if lower >= edge)]
+
+
+def report_counts(totals: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Facet counts as reported (facet -> value -> count): values in sorted
+    order, zero counts dropped, booleans as 'true'/'false' and only the
+    MAX_LOCATION_FACETS most common locations
+    """
+    counts = {}
+    for facet, value_totals in totals.items():
+        pairs = [(str(value).lower() if isinstance(value, bool) else value, int(total))
+                 for value, total in sorted(value_totals.items(), key=lambda item: str(item[0])) if total]
+        if facet == 'location':
+            pairs = sorted(pairs, key=lambda pair: -pair[1])[:MAX_LOCATION_FACETS]
+        counts[facet] = dict(pairs)
+    return counts
+
+
+def parse_filters(data: Optional[Dict]) -> Dict:
+    """Validate a request's filters object; returns only the filters that are set"""
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise ValueError("filters must be an object")
+
+    filters = {}
+    for key in ('salary_min', 'salary_max'):
+        if data.get(key) is not None:
+            if isinstance(data[key], bool) or not isinstance(data[key], (int, float)) or data[key] < 0:
+                raise ValueError(f"filters.{key} must be a non-negative number")
+            filters[key] = int(data[key])
+    if data.get('location'):
+        if not isinstance(data['location'], str):
+            raise ValueError("filters.location must be a string")
+        filters['location'] = normalize_location(data['location'])
+    if data.get('seniority'):
+        filters['seniority'] = seniority_filter(data['seniority'])
+    if data.get('remote') is not None:
+        if not isinstance(data['remote'], bool):
+            raise ValueError("filters.remote must be true or false")
+        filters['remote'] = data['remote']
+    return filters
+
+
+def seniority_filter(levels) -> Tuple[str, ...]:
+    """
+    A seniority filter: one level or several (any of them matches), as a
+    tuple in SENIORITY_LEVELS order so equal sets compare and hash equal
+    """
+    requested = {levels} if isinstance(levels, str) else levels
+    if not isinstance(requested, (list, tuple, set, frozenset)) or not requested or any(
+            level not in SENIORITY_LEVELS for level in requested):
+        raise ValueError(f"filters.seniority must be one or more of {', '.join(SENIORITY_LEVELS)}")
+    return tuple(level for level in SENIORITY_LEVELS if level in requested)
+
+
+def filter_key(filters: Optional[Dict]) -> Tuple:
+    """Hashable form of a filters dict, for cache keys"""
+    return tuple(sorted((filters or {}).items()))
+
+
+def matches_filters(job: Dict, filters: Optional[Dict]) -> bool:
+    """Check one job's typed fields against filters (for short lists; indexes use FacetIndex)"""
+    if not filters:
+        return True
+    lower = job.get('salary_min') or job.get('salary_max')
+    upper = job.get('salary_max') or job.get('salary_min')
+    if 'salary_min' in filters and (upper is None or upper < filters['salary_min']):
+        return False
+    if 'salary_max' in filters and (lower is None or lower > filters['salary_max']):
+        return False
+    if 'location' in filters and job.get('location_key') != filters['location']:
+        return False
+    if 'seniority' in filters and job.get('seniority') not in filters['seniority']:
+        return False
+    if 'remote' in filters and bool(job.get('remote')) != filters['remote']:
+        return False
+    return True
+
+
+class FacetIndex:
+    """
+    Precomputed facet indexes over a snapshot of jobs (their typed fields)
+    Salary bounds are kept as sorted arrays, so a range filter is one binary
+    search. Every location, seniority level, remote flag and salary bucket
+    has a bitmap of its jobs, packed 64 per word, so combining filters is a
+    word-wise AND and counting a facet value is a popcount. Nothing here
+    scans the jobs themselves
+    """
+
+    def __init__(self, docs: Sequence[Dict]):
+        self.size = len(docs)
+        self._words = (self.size + 63) // 64
+
+        lower = np.array([doc['salary_min'] or doc['salary_max'] or np.nan for doc in docs], dtype=np.float64)
+        upper = np.array([doc['salary_max'] or doc['salary_min'] or np.nan for doc in docs], dtype=np.float64)
+        # argsort puts NaN (unknown salary) last; _known bounds the searchable prefix
+        self._upper_order = np.argsort(upper, kind='stable')
+        self._upper_sorted = upper[self._upper_order]
+        self._lower_order = np.argsort(lower, kind='stable')
+        self._lower_sorted = lower[self._lower_order]
+        self._known = int(np.count_nonzero(~np.isnan(lower)))
+
+        self._all = self.from_ids(np.arange(self.size))
+        buckets = np.where(np.isnan(lower), len(SALARY_BUCKETS), np.searchsorted(SALARY_BUCKET_EDGES, lower, side='right'))
+        self._facets = {
+            'seniority': self._bitmaps([doc['seniority'] for doc in docs]),
+            'location': self._bitmaps([doc['location_key'] for doc in docs]),
+            'remote': self._bitmaps([bool(doc['remote']) for doc in docs]),
+            'salary': self._bitmaps([(SALARY_BUCKETS + ('unspecified',))[bucket] for bucket in buckets])
+        }
+
+    def from_ids(self, doc_ids) -> np.ndarray:
+        """Bitmap with the given document ids set"""
+        bits = np.zeros(self._words * 64, dtype=bool)
+        bits[np.asarray(doc_ids, dtype=np.int64)] = True
+        return np.packbits(bits, bitorder='little').view(np.uint64)
+
+    def to_mask(self, bitmap: np.ndarray) -> np.ndarray:
+        """Bitmap as a boolean array indexed by document id"""
+        return np.unpackbits(bitmap.view(np.uint8), bitorder='little')[:self.size].astype(bool)
+
+    def count(self, bitmap: np.ndarray) -> int:
+        return int(np.bitwise_count(bitmap).sum())
+
+    def mask(self, filters: Optional[Dict]) -> np.ndarray:
+        """Bitmap of the documents passing every filter"""
+        result = self._all
+        for facet in ('location', 'seniority', 'remote'):
+            if facet in (filters or {}):
+                values, bitmaps = self._facets[facet]
+                # Seniority may list several levels: the union of their bitmaps
+                wanted = filters[facet] if facet == 'seniority' else (filters[facet],)
+                rows = [values.index(value) for value in wanted if value in values]
+                result = result & np.bitwise_or.reduce(bitmaps[rows], axis=0) if rows else np.zeros_like(result)
+
+        if 'salary_min' in (filters or {}):
+            # Pays at least salary_min: upper bound >= it
+            cut = int(np.searchsorted(self._upper_sorted[:self._known], filters['salary_min'], side='left'))
+            result = result & self.from_ids(self._upper_order[cut:self._known])
+        if 'salary_max' in (filters or {}):
+            cut = int(np.searchsorted(self._lower_sorted[:self._known], filters['salary_max'], side='right'))
+            result = result & self.from_ids(self._lower_order[:cut])
+        return result
+
+    def counts(self, bitmap: np.ndarray) -> Dict[str, Dict]:
+        """Per facet, how many documents in bitmap have each value"""
+        totals = {}
+        for facet, (values, bitmaps) in self._facets.items():
+            totals[facet] = dict(zip(values, np.bitwise_count(bitmaps & bitmap).sum(axis=1).tolist() if values else []))
+        return report_counts(totals)
+
+    def _bitmaps(self, column: List) -> Tuple[List, np.ndarray]:
+        """Distinct values of a column and a (values x words) matrix of their bitmaps"""
+        values = sorted(set(column), key=str)
+        position = {value: i for i, value in enumerate(values)}
+        codes = np.fromiter((position[value] for value in column), dtype=np.int64, count=len(column))
+
+        doc_ids = np.arange(len(column), dtype=np.uint64)
+        bitmaps = np.zeros((len(values), self._words), dtype=np.uint64)
+        np.bitwise_or.at(bitmaps, (codes, doc_ids >> np.uint64(6)), np.uint64(1) << (doc_ids & np.uint64(63)))
+        return values, bitmaps
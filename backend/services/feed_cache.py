@@ -0,0 +1,253 @@
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+from .metrics import stage_timer
+
+logger = logging.getLogger(__name__)
+
+class FeedCache:
+    """
+    Shared TTL cache for upstream JSON feeds
+    Revalidates with conditional GETs (ETag / If-Modified-Since) and
+    serves stale data while a background refresh is in flight.
+    session is a requests.Session or an HttpTransport; with timeout=None
+    the transport's own connect/read timeouts apply
+    """
+
+    def __init__(self, session, ttl: float = 300, timeout: Optional[float] = 10):
+        self.session = session
+        self.ttl = ttl
+        self.timeout = timeout
+
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        self._refreshing = set()
+        self._listeners: List[Callable[[str, Any], None]] = []
+        self._transform: Optional[Callable[[str, Any], Any]] = None
+        # Cold fetches in flight on the async server's event loop, shared by every awaiting request
+        self._async_fetches: Dict[str, asyncio.Future] = {}
+        self._stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'revalidated': 0,
+            'refreshes': 0,
+            'errors': 0
+        }
+
+    def get(self, url: str) -> Any:
+        """
+        Return the decoded feed for url
+        Fresh entries are returned as-is, stale ones are returned immediately
+        while a background refresh runs, and misses fetch synchronously
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry and time.monotonic() - entry['fetched_at'] < self.ttl:
+                self._stats['hits'] += 1
+                return entry['data']
+
+            if entry:
+                self._stats['stale_hits'] += 1
+                if url not in self._refreshing:
+                    self._refreshing.add(url)
+                    threading.Thread(target=self._background_refresh, args=(url,), daemon=True).start()
+                return entry['data']
+
+            self._stats['misses'] += 1
+            fetch_lock = self._fetch_locks.setdefault(url, threading.Lock())
+
+        # Only one thread fetches a cold URL; the others wait and reuse its result
+        with fetch_lock:
+            with self._lock:
+                entry = self._entries.get(url)
+            if entry:
+                return entry['data']
+            return self._fetch(url)
+
+    def peek(self, url: str) -> Optional[Any]:
+        """Cached data for url whatever its age, or None; never touches the network"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            self._stats['hits'] += 1
+            return entry['data']
+
+    def refresh(self, url: str) -> Any:
+        """Revalidate url now (conditional GET), regardless of its age"""
+        fetch_lock = self._fetch_locks.setdefault(url, threading.Lock())
+        with fetch_lock:
+            return self._fetch(url)
+
+    def add_listener(self, callback: Callable[[str, Any], None]):
+        """Call callback(url, data) whenever a feed is (re)downloaded with new content"""
+        self._listeners.append(callback)
+
+    def set_transform(self, func: Callable[[str, Any], Any]):
+        """
+        Cache func(url, data) instead of a freshly decoded feed (e.g. a
+        compact projection), so the raw payload can be freed; listeners
+        still receive the decoded feed
+        """
+        self._transform = func
+
+    def invalidate(self, url: Optional[str] = None):
+        """Drop one cached feed, or all of them"""
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(url, None)
+
+    def get_stats(self) -> Dict:
+        """Return hit/miss counters for health reporting"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+
+        lookups = stats['hits'] + stats['stale_hits'] + stats['misses']
+        stats['hit_ratio'] = round((stats['hits'] + stats['stale_hits']) / lookups, 4) if lookups else 0.0
+        stats['ttl_seconds'] = self.ttl
+        return stats
+
+    def _background_refresh(self, url: str):
+        try:
+            self._fetch(url)
+        except Exception as e:
+            logger.warning(f"Background refresh of {url} failed, keeping stale copy: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(url)
+
+    async def get_async(self, url: str, client) -> Any:
+        """
+        Coroutine version of get() for the async server, over the same cache
+        client is an AsyncHttpTransport. Concurrent cold misses share one
+        download; stale entries are refreshed in a background task
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry and time.monotonic() - entry['fetched_at'] < self.ttl:
+                self._stats['hits'] += 1
+                return entry['data']
+
+            if entry:
+                self._stats['stale_hits'] += 1
+                if url not in self._refreshing:
+                    self._refreshing.add(url)
+                    asyncio.ensure_future(self._background_refresh_async(url, client))
+                return entry['data']
+
+            self._stats['misses'] += 1
+
+        fetch = self._async_fetches.get(url)
+        if fetch is None:
+            fetch = self._async_fetches[url] = asyncio.ensure_future(self._fetch_async(url, client))
+            fetch.add_done_callback(lambda _: self._async_fetches.pop(url, None))
+        # Shielded so one cancelled request doesn't abort the download for the others
+        return await asyncio.shield(fetch)
+
+    async def _background_refresh_async(self, url: str, client):
+        try:
+            await self._fetch_async(url, client)
+        except Exception as e:
+            logger.warning(f"Background refresh of {url} failed, keeping stale copy: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(url)
+
+    async def _fetch_async(self, url: str, client) -> Any:
+        entry, headers = self._validators(url)
+        loop = asyncio.get_running_loop()
+
+        try:
+            with stage_timer('feed_cache', 'download'):
+                async with client.request('GET', url, headers=headers) as response:
+                    status = response.status
+                    if status == 304 and entry:
+                        return self._revalidated(entry)
+                    response.raise_for_status()
+                    body = await response.read()
+                    etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+
+            # Decoding and the listeners (reindexing) are CPU-bound; keep them off the event loop
+            with stage_timer('feed_cache', 'json_decode'):
+                data = await loop.run_in_executor(None, json.loads, body)
+        except Exception:
+            with self._lock:
+                self._stats['errors'] += 1
+            raise
+
+        return await loop.run_in_executor(None, self._store, url, data, etag, last_modified, len(body))
+
+    def _validators(self, url: str):
+        """The cached entry for url (if any) and the conditional-request headers it allows"""
+        with self._lock:
+            entry = self._entries.get(url)
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return entry, headers
+
+    def _revalidated(self, entry: Dict) -> Any:
+        with self._lock:
+            entry['fetched_at'] = time.monotonic()
+            self._stats['revalidated'] += 1
+        return entry['data']
+
+    def _store(self, url: str, data: Any, etag: Optional[str], last_modified: Optional[str], size: int) -> Any:
+        cached = data
+        if self._transform is not None:
+            try:
+                cached = self._transform(url, data)
+            except Exception as e:
+                logger.error(f"Feed transform failed for {url}, caching it as decoded: {str(e)}")
+
+        with self._lock:
+            self._entries[url] = {
+                'data': cached,
+                'etag': etag,
+                'last_modified': last_modified,
+                'fetched_at': time.monotonic()
+            }
+            self._stats['refreshes'] += 1
+
+        logger.info(f"Fetched feed {url} ({size} bytes)")
+
+        for callback in self._listeners:
+            try:
+                callback(url, data)
+            except Exception as e:
+                logger.error(f"Feed listener failed for {url}: {str(e)}")
+        return cached
+
+    def _fetch(self, url: str) -> Any:
+        """Fetch url, sending validators from any cached copy"""
+        entry, headers = self._validators(url)
+
+        try:
+            with stage_timer('feed_cache', 'download'):
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+            if response.status_code == 304 and entry:
+                return self._revalidated(entry)
+
+            response.raise_for_status()
+            with stage_timer('feed_cache', 'json_decode'):
+                data = response.json()
+        except Exception:
+            with self._lock:
+                self._stats['errors'] += 1
+            raise
+
+        return self._store(url, data, response.headers.get('ETag'), response.headers.get('Last-Modified'), len(response.content))
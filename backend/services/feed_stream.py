@@ -0,0 +1,121 @@
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Iterable, Iterator, List, Union
+
+CHUNK_SIZE = 64 * 1024
+
+# A single array element larger than this is treated as a malformed feed
+MAX_ITEM_CHARS = 16 * 1024 * 1024
+
+WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+# Characters that can continue a number the decoder stopped short of ('1' + '.5', '1' + 'e3')
+NUMBER_CONTINUATION = frozenset('.eE+-0123456789')
+
+
+class FeedFormatError(ValueError):
+    """The feed is not a well-formed JSON array"""
+
+
+def iter_file_chunks(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            return
+        yield block
+
+
+class JsonArrayParser:
+    """
+    Push parser for a top-level JSON array: feed() it chunks as they arrive
+    and it returns the elements completed so far. Only the unfinished
+    element (plus one chunk) is buffered. Elements are decoded by the
+    C-accelerated json scanner
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        # 'start' before '[', 'first' right after it, 'item' after a comma,
+        # 'separator' after an element, 'done' after the closing ']'
+        self._state = 'start'
+
+    @property
+    def done(self) -> bool:
+        return self._state == 'done'
+
+    def feed(self, chunk: Union[bytes, str]) -> List[Any]:
+        text = self._utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+        return self._parse(text, final=False)
+
+    def close(self) -> List[Any]:
+        """Flush the end of the stream; raises if the array was not closed"""
+        items = self._parse(self._utf8.decode(b'', final=True), final=True)
+        if not self.done:
+            raise FeedFormatError("Feed ended before the closing ']'")
+        return items
+
+    def _parse(self, text: str, final: bool) -> List[Any]:
+        buffer = self._buffer + text
+        pos = 0
+        items = []
+
+        while self._state != 'done':
+            pos = WHITESPACE_RE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+
+            char = buffer[pos]
+            if self._state == 'start':
+                if char != '[':
+                    raise FeedFormatError("Feed is not a JSON array")
+                self._state = 'first'
+                pos += 1
+                continue
+
+            if self._state in ('first', 'separator') and char == ']':
+                self._state = 'done'
+                pos += 1
+                break
+            if self._state == 'separator':
+                if char != ',':
+                    raise FeedFormatError(f"Expected ',' or ']' between feed elements, got {char!r}")
+                self._state = 'item'
+                pos += 1
+                continue
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if final:
+                    raise FeedFormatError(f"Malformed feed element: {e.msg}")
+                if len(buffer) - pos > MAX_ITEM_CHARS:
+                    raise FeedFormatError("Feed element exceeds the size limit")
+                # Element continues in the next chunk
+                break
+
+            # A bare number may be cut short by the end of the buffer, even where
+            # the decoder stopped before it ('[1.' holds the number 1 followed by '.')
+            if not final and isinstance(item, (int, float)) and (end == len(buffer) or buffer[end] in NUMBER_CONTINUATION):
+                break
+
+            items.append(item)
+            pos = end
+            self._state = 'separator'
+
+        self._buffer = buffer[pos:]
+        return items
+
+
+def iter_json_array(chunks: Iterable[Union[bytes, str]]) -> Iterator[Any]:
+    """
+    Decode a top-level JSON array element by element from a stream of chunks
+    A caller can filter or store each posting as it arrives and stop early
+    """
+    parser = JsonArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+    yield from parser.close()
@@ -0,0 +1,138 @@
+import threading
+from typing import Dict, Iterable, Optional
+import logging
+
+from .feed_stream import CHUNK_SIZE, iter_file_chunks, iter_json_array
+from .job_database import JobDatabase
+from .scheduler import HostLock
+
+logger = logging.getLogger(__name__)
+
+
+class FeedIngestor:
+    """
+    Keeps the JobDatabase in sync with the RemoteOK feed
+    A daemon thread revalidates the feed every interval seconds; new content
+    arrives through the FeedCache listener and is normalized with the same
+    projection _scrape_remoteok uses, then upserted incrementally.
+
+    With streaming=True the daemon instead downloads the feed itself and
+    parses it posting by posting straight into the database, so ingestion
+    memory stays constant whatever the feed size; the database is then the
+    only copy (the in-memory index is not refreshed).
+
+    With lock, only the process holding it syncs with the upstream; the
+    others (server workers sharing the database) follow its changes
+    """
+
+    def __init__(self, scraper, database: JobDatabase, interval: float = 300, streaming: bool = False,
+                 lock: Optional[HostLock] = None):
+        self.scraper = scraper
+        self.database = database
+        self.interval = interval
+        self.streaming = streaming
+        self.lock = lock
+        self.last_counts: Dict[str, int] = {}
+
+        self._etag: Optional[str] = None
+        self._data_version: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread = None
+        scraper.feed_cache.add_listener(self._on_feed_refresh)
+
+    def ingest(self, data: Iterable) -> Dict[str, int]:
+        """Normalize raw RemoteOK postings (a list, or any iterable of them) and upsert them"""
+        provider = self.scraper.sources['remoteok']
+        rows = (
+            (job.get('id'), self.scraper._process_remoteok_job(job))
+            for job in data
+            if isinstance(job, dict) and job.get('position') and job.get('id') is not None
+        )
+        self.last_counts = self.database.upsert_jobs(provider.label, rows, deduplicator=self.scraper.deduplicator)
+
+        if any(self.last_counts[key] for key in ('inserted', 'updated', 'deleted')):
+            self.scraper.database_changed()
+        return self.last_counts
+
+    def ingest_file(self, path: str, index: bool = True) -> Dict[str, int]:
+        """
+        Ingest a saved feed (or a stand-in fixture) instead of the network
+        The file is streamed into the database; with index it is read a second
+        time to rebuild the in-memory index
+        """
+        with open(path, 'rb') as f:
+            counts = self.ingest(iter_json_array(iter_file_chunks(f)))
+        if index:
+            with open(path, 'rb') as f:
+                self.scraper.job_store.replace(iter_json_array(iter_file_chunks(f)))
+        return counts
+
+    def ingest_url(self, url: str) -> Optional[Dict[str, int]]:
+        """
+        Stream a feed from the network into the database in constant memory
+        Returns None when the upstream answers 304 (unchanged since last time)
+        """
+        headers = {'If-None-Match': self._etag} if self._etag else {}
+        response = self.scraper.transport.get(url, headers=headers, stream=True)
+        try:
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+            counts = self.ingest(iter_json_array(response.iter_content(CHUNK_SIZE)))
+            self._etag = response.headers.get('ETag')
+            return counts
+        finally:
+            response.close()
+
+    def run_once(self) -> bool:
+        """
+        One sync with the upstream feed, as the daemon (or a scheduler) does
+        every interval. Returns False without syncing while another process
+        holds the lock
+        """
+        if self.lock is not None and not self.lock.acquire():
+            return False
+
+        url = self.scraper.sources['remoteok'].api_url
+        if self.streaming:
+            self.ingest_url(url)
+        else:
+            self.scraper.feed_cache.refresh(url)
+        return True
+
+    def follow(self) -> bool:
+        """
+        Pick up another process's ingest: drop this process's cached results
+        (and database snapshot) if the database changed since the last call.
+        Returns whether it had
+        """
+        version = self.database.data_version()
+        changed = self._data_version is not None and version != self._data_version
+        self._data_version = version
+        if changed:
+            self.scraper.database_changed()
+        return changed
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='feed-ingestor', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _on_feed_refresh(self, url: str, data):
+        if url == self.scraper.sources['remoteok'].api_url and isinstance(data, list):
+            self.ingest(data)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if not self.run_once():
+                    self.follow()
+            except Exception as e:
+                logger.warning(f"Feed ingestion from {self.scraper.sources['remoteok'].api_url} failed: {str(e)}")
+            self._stop.wait(self.interval)
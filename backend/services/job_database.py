@@ -0,0 +1,311 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+
+from .facets import report_counts, salary_bucket
+from .job_store import query_terms
+from .ranking import FIELD_WEIGHTS
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    source_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT,
+    salary TEXT,
+    description TEXT,
+    url TEXT,
+    posted_date TEXT,
+    salary_min INTEGER,
+    salary_max INTEGER,
+    location_key TEXT,
+    remote INTEGER,
+    seniority TEXT,
+    tags TEXT,
+    duplicate_of INTEGER,
+    ingested_at REAL NOT NULL,
+    UNIQUE (source, source_id)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, tags, description,
+    content='jobs', content_rowid='id',
+    tokenize="unicode61 tokenchars '+#'"
+);
+
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, tags, description) VALUES (new.id, new.title, new.tags, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, tags, description) VALUES ('delete', old.id, old.title, old.tags, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, tags, description) VALUES ('delete', old.id, old.title, old.tags, old.description);
+    INSERT INTO jobs_fts(rowid, title, tags, description) VALUES (new.id, new.title, new.tags, new.description);
+END;
+"""
+
+# Columns added after the first release (typed facets, duplicate links); older databases gain them on open
+ADDED_COLUMNS = {
+    'salary_min': 'INTEGER',
+    'salary_max': 'INTEGER',
+    'location_key': 'TEXT',
+    'remote': 'INTEGER',
+    'seniority': 'TEXT',
+    'duplicate_of': 'INTEGER'
+}
+
+FACET_INDEXES = """
+CREATE INDEX IF NOT EXISTS jobs_location_key ON jobs(location_key);
+CREATE INDEX IF NOT EXISTS jobs_seniority ON jobs(seniority);
+"""
+
+# tags must stay last (stored as JSON)
+JOB_FIELDS = ('title', 'company', 'location', 'salary', 'description', 'url', 'posted_date',
+              'salary_min', 'salary_max', 'location_key', 'remote', 'seniority', 'tags')
+
+
+def content_hash(job: Dict) -> str:
+    """Stable hash of a normalized posting, used to skip unchanged rows"""
+    payload = json.dumps({field: job.get(field) for field in JOB_FIELDS}, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class JobDatabase:
+    """
+    Persistent SQLite store of normalized postings with an FTS5 index
+    Rows are keyed by (source, source_id) and upserted only when their
+    content hash changes. Near-duplicate rows of a source point at the row
+    they duplicate (duplicate_of) and are left out of searches and counts.
+    Each thread gets its own connection
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+        existing = {row['name'] for row in conn.execute('PRAGMA table_info(jobs)')}
+        for column, column_type in ADDED_COLUMNS.items():
+            if column not in existing:
+                conn.execute(f'ALTER TABLE jobs ADD COLUMN {column} {column_type}')
+        conn.executescript(FACET_INDEXES)
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            if self.path != ':memory:':
+                conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def count(self, source: Optional[str] = None) -> int:
+        conn = self._connection()
+        if source is None:
+            return conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+        return conn.execute('SELECT COUNT(*) FROM jobs WHERE source = ?', (source,)).fetchone()[0]
+
+    def data_version(self) -> int:
+        """Changes whenever another connection (e.g. another process) commits to the database"""
+        return self._connection().execute('PRAGMA data_version').fetchone()[0]
+
+    def upsert_jobs(self, source: str, jobs: Iterable[Tuple[str, Dict]], prune: bool = True,
+                    deduplicator=None) -> Dict[str, int]:
+        """
+        Write (source_id, job) pairs for one source
+        Unchanged rows (same content hash) are not rewritten. With prune, rows
+        of this source that are missing from the batch are deleted, which is
+        what a full-snapshot feed like RemoteOK needs. With deduplicator (a
+        dedup.NearDuplicateDetector), the source's near-duplicates are
+        relinked whenever a row changed
+        """
+        conn = self._connection()
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0}
+        now = time.time()
+
+        with conn:
+            # Take the write lock before reading hashes so concurrent ingesters
+            # (one per server worker) serialize instead of racing on inserts
+            conn.execute('BEGIN IMMEDIATE')
+            existing = dict(conn.execute('SELECT source_id, content_hash FROM jobs WHERE source = ?', (source,)))
+            seen = set()
+
+            for source_id, job in jobs:
+                source_id = str(source_id)
+                if source_id in seen:
+                    continue
+                seen.add(source_id)
+
+                digest = content_hash(job)
+                previous = existing.get(source_id)
+                if previous == digest:
+                    counts['unchanged'] += 1
+                    continue
+
+                values = [job.get(field) for field in JOB_FIELDS[:-1]] + [json.dumps(job.get('tags') or [])]
+                if previous is None:
+                    conn.execute(
+                        f"INSERT INTO jobs (source, source_id, content_hash, {', '.join(JOB_FIELDS)}, ingested_at) "
+                        f"VALUES (?, ?, ?, {', '.join('?' * len(JOB_FIELDS))}, ?)",
+                        [source, source_id, digest] + values + [now]
+                    )
+                    counts['inserted'] += 1
+                else:
+                    conn.execute(
+                        f"UPDATE jobs SET content_hash = ?, {', '.join(f'{field} = ?' for field in JOB_FIELDS)}, ingested_at = ? "
+                        "WHERE source = ? AND source_id = ?",
+                        [digest] + values + [now, source, source_id]
+                    )
+                    counts['updated'] += 1
+
+            if prune:
+                stale = [(source, source_id) for source_id in existing if source_id not in seen]
+                conn.executemany('DELETE FROM jobs WHERE source = ? AND source_id = ?', stale)
+                counts['deleted'] = len(stale)
+
+            if deduplicator is not None and any(counts[key] for key in ('inserted', 'updated', 'deleted')):
+                self._link_duplicates(conn, source, deduplicator)
+
+        logger.info(f"Ingested {source}: {counts}")
+        return counts
+
+    def _link_duplicates(self, conn: sqlite3.Connection, source: str, deduplicator):
+        """Point every near-duplicate row of source at the oldest row of its cluster (NULL for that row)"""
+        ids: List[int] = []
+        links: List[Optional[int]] = []
+
+        def postings():
+            # Only the signatures are kept, not the rows
+            for row in conn.execute('SELECT id, title, company, description, duplicate_of FROM jobs WHERE source = ? ORDER BY id', (source,)):
+                ids.append(row['id'])
+                links.append(row['duplicate_of'])
+                yield {'title': row['title'], 'company': row['company'], 'description': row['description']}
+
+        changes = []
+        duplicates = 0
+        for members in deduplicator.clusters(postings()):
+            canonical = ids[members[0]]
+            for i in members:
+                link = None if i == members[0] else canonical
+                if links[i] != link:
+                    changes.append((link, ids[i]))
+            duplicates += len(members) - 1
+        conn.executemany('UPDATE jobs SET duplicate_of = ? WHERE id = ?', changes)
+        logger.info(f"Linked {duplicates} duplicate {source} postings ({len(changes)} changed)")
+
+    def search(self, keywords: str, limit: int = 10, source: Optional[str] = None, filters: Optional[Dict] = None) -> List[Dict]:
+        """Postings matching any keyword and passing filters, best FTS5 bm25 score first"""
+        where, params = self._match_clause(keywords, source, filters)
+        if where is None:
+            return []
+
+        weights = ', '.join(str(FIELD_WEIGHTS[field]) for field in ('title', 'tags', 'description'))
+        sql = (
+            f"SELECT jobs.*, bm25(jobs_fts, {weights}) AS rank FROM jobs_fts "
+            f"JOIN jobs ON jobs.id = jobs_fts.rowid WHERE {where} "
+            "ORDER BY rank LIMIT ?"
+        )
+        return [self._row_to_job(row) for row in self._connection().execute(sql, params + [limit])]
+
+    def jobs(self, source: Optional[str] = None) -> Iterator[Dict]:
+        """Every posting (of source), duplicates left out, oldest first"""
+        sql = 'SELECT * FROM jobs WHERE duplicate_of IS NULL'
+        params: List = []
+        if source is not None:
+            sql += ' AND source = ?'
+            params.append(source)
+        for row in self._connection().execute(sql + ' ORDER BY id', params):
+            yield self._row_to_job(row)
+
+    def count_matches(self, keywords: str, source: Optional[str] = None, filters: Optional[Dict] = None) -> int:
+        """How many postings search() would find without a limit"""
+        where, params = self._match_clause(keywords, source, filters)
+        if where is None:
+            return 0
+
+        sql = f"SELECT COUNT(*) FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid WHERE {where}"
+        return self._connection().execute(sql, params).fetchone()[0]
+
+    def facet_counts(self, keywords: str, source: Optional[str] = None, filters: Optional[Dict] = None) -> Dict:
+        """
+        Facet value counts over the postings search() would find without a
+        limit (same shape as JobStore.facet_counts), plus how many there are
+        """
+        totals = {facet: Counter() for facet in ('seniority', 'location', 'remote', 'salary')}
+        matched = 0
+        where, params = self._match_clause(keywords, source, filters)
+        if where is not None:
+            sql = (
+                "SELECT jobs.seniority, jobs.location_key, jobs.remote, jobs.salary_min, jobs.salary_max, COUNT(*) AS matches "
+                f"FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid WHERE {where} GROUP BY 1, 2, 3, 4, 5"
+            )
+            for row in self._connection().execute(sql, params):
+                totals['seniority'][row['seniority']] += row['matches']
+                totals['location'][row['location_key']] += row['matches']
+                totals['remote'][bool(row['remote'])] += row['matches']
+                totals['salary'][salary_bucket(row['salary_min'], row['salary_max'])] += row['matches']
+                matched += row['matches']
+        return dict(report_counts(totals), matched=matched)
+
+    def _match_clause(self, keywords: str, source: Optional[str], filters: Optional[Dict]) -> Tuple[Optional[str], List]:
+        """WHERE clause and parameters shared by search, count_matches and facet_counts; None when no keyword is searchable"""
+        terms = query_terms(keywords)
+        if not terms:
+            return None, []
+
+        match = ' OR '.join('"' + term.replace('"', '""') + '"' for term in terms)
+        clauses = ['jobs_fts MATCH ?', 'jobs.duplicate_of IS NULL']
+        params: List = [match]
+        if source is not None:
+            clauses.append('jobs.source = ?')
+            params.append(source)
+        for clause, values in self._filter_clauses(filters or {}):
+            clauses.append(clause)
+            params.extend(values)
+        return ' AND '.join(clauses), params
+
+    def _filter_clauses(self, filters: Dict) -> List[Tuple[str, List]]:
+        """SQL conditions and their parameters for facets.parse_filters output (same semantics as facets.matches_filters)"""
+        clauses = []
+        if 'salary_min' in filters:
+            clauses.append(('COALESCE(jobs.salary_max, jobs.salary_min) >= ?', [filters['salary_min']]))
+        if 'salary_max' in filters:
+            clauses.append(('COALESCE(jobs.salary_min, jobs.salary_max) <= ?', [filters['salary_max']]))
+        if 'location' in filters:
+            clauses.append(('jobs.location_key = ?', [filters['location']]))
+        if 'seniority' in filters:
+            levels = list(filters['seniority'])
+            clauses.append((f"jobs.seniority IN ({', '.join('?' * len(levels))})", levels))
+        if 'remote' in filters:
+            clauses.append(('jobs.remote = ?', [int(filters['remote'])]))
+        return clauses
+
+    def _row_to_job(self, row: sqlite3.Row) -> Dict:
+        job = {field: row[field] for field in JOB_FIELDS}
+        job['tags'] = json.loads(row['tags'] or '[]')
+        job['remote'] = bool(job['remote'])
+        job['source'] = row['source']
+        if 'rank' in row.keys():
+            job['relevance'] = round(-row['rank'], 4)
+        return job
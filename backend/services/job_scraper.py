@@ -1,97 +1,477 @@
-import requests
+import threading
 import time
 import random
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Iterable, List, Dict, Optional
 import logging
 
+from models.job import Job, with_extras
+from .dedup import NearDuplicateDetector
+from .facets import FacetIndex, filter_key, matches_filters, typed_fields
+from .feed_cache import FeedCache
+from .feed_stream import CHUNK_SIZE, iter_json_array
+from .job_store import JobStore, document_fields, query_terms
+from .metrics import STAGE_SECONDS, stage_timer
+from .result_cache import QueryLog, ResultCache, normalize_query
+from .transport import HttpTransport
+from .providers import JobProvider, RemoteOKProvider, MockProvider
+
 logger = logging.getLogger(__name__)
 
+class SourceResults:
+    """
+    One fan-out's jobs and per-source status report, collected in source
+    registration order; shared by JobScraper and AsyncJobSearch, which
+    differ only in how they wait for each source
+    """
+    
+    def __init__(self, depth: int = 0):
+        self.depth = depth
+        self.started = time.monotonic()
+        self.jobs: List[Dict] = []
+        self.report: List[Dict] = []
+    
+    def remaining(self, provider: JobProvider) -> float:
+        """Seconds left before provider's deadline"""
+        return max(0.0, provider.timeout - (time.monotonic() - self.started))
+    
+    def add(self, provider: JobProvider, jobs: List[Dict], status: str = 'ok'):
+        jobs = jobs[:max(provider.max_jobs, self.depth)]
+        self.jobs.extend(jobs)
+        self.report.append({
+            'name': provider.name,
+            'status': status,
+            'jobs': len(jobs),
+            'elapsed_ms': round((time.monotonic() - self.started) * 1000, 1)
+        })
+        logger.info(f"Found {len(jobs)} jobs from {provider.label} ({status})")
+    
+    def timed_out(self, provider: JobProvider):
+        logger.warning(f"Source {provider.name} missed its {provider.timeout}s deadline")
+        self.add(provider, [], 'timeout')
+    
+    def failed(self, provider: JobProvider, error: Exception):
+        logger.error(f"Source {provider.name} failed: {str(error)}")
+        self.add(provider, [], 'error')
+    
+    def finish(self):
+        STAGE_SECONDS.observe(time.monotonic() - self.started, 'job_scraper', 'fanout')
+
+
 class JobScraper:
     """
     Job scraper that works with real APIs and generates mock data
     Designed to handle ANY job search query
     """
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, cache_ttl: float = 300, source_timeouts: Optional[Dict[str, float]] = None, max_workers: int = 8,
+                 result_cache_size: int = 1024, result_cache_ttl: float = 120, job_database=None,
+                 dedup_threshold: float = 0.7, dedup_num_perm: int = 64, transport: Optional[HttpTransport] = None,
+                 streaming: bool = False, query_log_window: float = 900):
+        # Pooled, retrying, circuit-broken HTTP client shared by every provider
+        self.transport = transport or HttpTransport()
+        self.session = self.transport.session
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
-        # Job sources configuration
-        self.sources = {
-            'remoteok': {
-                'enabled': True,
-                'api_url': 'https://remoteok.io/api',
-                'max_jobs': 10
-            },
-            'mock': {
-                'enabled': True,
-                'max_jobs': 5
-            }
-        }
+        # Job sources, queried concurrently in registration order. Each has its own
+        # pool of max_workers threads, so a source that hangs can't starve the others
+        self.sources: Dict[str, JobProvider] = {}
+        self.executors: Dict[str, ThreadPoolExecutor] = {}
+        self.max_workers = max_workers
+        self.register_provider(RemoteOKProvider(self))
+        self.register_provider(MockProvider(self))
+        
+        for name, timeout in (source_timeouts or {}).items():
+            if name in self.sources:
+                self.sources[name].timeout = timeout
+        
+        # Upstream feeds are shared across requests and revalidated after cache_ttl seconds
+        # (timeouts come from the transport's connect/read settings)
+        self.feed_cache = FeedCache(self.transport, ttl=cache_ttl, timeout=None)
+        
+        # Collapses the same posting seen on several boards (or reworded) into one result;
+        # reposts within the feed are already collapsed on ingest
+        self.deduplicator = NearDuplicateDetector(threshold=dedup_threshold, num_perm=dedup_num_perm)
+        
+        # Postings are tokenized and projected once per feed download, not once per request;
+        # the store's compact records stand in for the raw feed in the cache
+        self.job_store = JobStore(project=self._remoteok_record, deduplicator=self.deduplicator)
+        self.feed_cache.set_transform(self._on_feed_refresh)
+        
+        # Merged, ranked results per normalized query; dropped whenever the feed changes
+        self.result_cache = ResultCache(max_entries=result_cache_size, ttl=result_cache_ttl)
+        
+        # Optional persistent store (kept up to date by FeedIngestor); when set,
+        # RemoteOK results are read from it instead of the network
+        self.job_database = job_database
+        # Profile matching index over a snapshot of the database, for processes that
+        # don't index the feed themselves; rebuilt after database_changed()
+        self.database_snapshot = JobStore()
+        self._snapshot_stale = True
+        self._snapshot_lock = threading.Lock()
+        
+        # Without a database, streaming mode filters the upstream feed as it downloads
+        # instead of caching and indexing the whole payload
+        self.streaming = streaming
+        
+        # Set when a background scheduler keeps upstream data fresh: requests then
+        # read only local data (cached feed or database) and never wait on an upstream
+        self.local_only = False
+        
+        # Recent queries by frequency, replayed by prewarm()
+        self.query_log = QueryLog(window=query_log_window)
+
+    
+    def register_provider(self, provider: JobProvider):
+        """Add (or replace) a job source"""
+        self.sources[provider.name] = provider
+        if provider.name not in self.executors:
+            self.executors[provider.name] = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                               thread_name_prefix=f'source-{provider.name}')
+    
+    def shutdown(self):
+        """Stop the source pools; fetches still queued are dropped"""
+        for executor in self.executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _on_feed_refresh(self, url: str, data):
+        """Reindex a new RemoteOK feed; returns what the feed cache keeps for url"""
+        if url == self.sources['remoteok'].api_url and isinstance(data, list):
+            self.job_store.replace(data)
+            self.result_cache.clear()
+            return self.job_store.jobs
+        return data
+    
+    def database_changed(self):
+        """The job database changed (here or in another process): drop results read from the old data"""
+        self.result_cache.clear()
+        self._snapshot_stale = True
     
     def search_jobs(self, keywords: str, location: str = "") -> List[Dict]:
         """
         Main job search method - works with ANY keywords
         """
-        logger.info(f"Searching jobs for: '{keywords}' in '{location}'")
+        return self.search(keywords, location)['jobs']
+    
+    def search(self, keywords: str, location: str = "", limit: Optional[int] = None, offset: int = 0,
+               filters: Optional[Dict] = None, log_query: bool = True) -> Dict:
+        """
+        Query every enabled source concurrently, each under its own deadline
+        Returns the merged jobs, best match first, plus a per-source status
+        report; sources that miss their deadline are reported as 'timeout'
+        and left out. filters (see facets.parse_filters) narrow the jobs and
+        facets holds value counts for the matching indexed postings.
+        limit/offset page through the ranked list: each source is asked for
+        enough matches to fill the page, and total counts every match.
+        Complete results are cached under the normalized query and filters,
+        and the query is logged for prewarm() unless log_query is False
+        """
+        depth = self._fetch_depth(limit, offset)
+        with stage_timer('job_scraper', 'cache_lookup'):
+            cache_key = self._cache_key(keywords, location, filters)
+            result = self._cached_result(cache_key, depth)
+        cached = result is not None
+        if log_query:
+            self.query_log.record(cache_key, keywords, location, filters, depth)
+        
+        if not cached:
+            result = self._search_sources(keywords, location, filters, depth)
+            # Partial results are not cached so a recovered source is picked up next time
+            if not result['partial']:
+                self.result_cache.put(cache_key, result)
+        
+        return self._page(result, limit, offset, cached)
+    
+    def _cache_key(self, keywords: str, location: str, filters: Optional[Dict]):
+        """Result cache (and query log) key: the normalized query, plus the filters when there are any"""
+        query_key = normalize_query(keywords, location)
+        return query_key + (filter_key(filters),) if filters else query_key
+    
+    def _fetch_depth(self, limit: Optional[int], offset: int) -> int:
+        """
+        How many of its best matches each source is asked for so the page
+        offset:offset+limit is complete (0: each source's max_jobs). Rounded
+        up to a power of two, so the pages that follow are served from the
+        same cached result
+        """
+        if limit is None:
+            return 0
+        return 1 << (offset + limit - 1).bit_length()
+    
+    def _cached_result(self, cache_key, depth: int) -> Optional[Dict]:
+        """A cached result that reaches depth (or already holds every match), else None (a miss)"""
+        return self.result_cache.get(
+            cache_key, accept=lambda result: result['depth'] >= depth or len(result['jobs']) >= result['total']
+        )
+    
+    def _page(self, result: Dict, limit: Optional[int], offset: int, cached: bool) -> Dict:
+        end = None if limit is None else offset + limit
+        return dict(result, jobs=result['jobs'][offset:end], cached=cached)
+    
+    def prewarm(self, top_n: int) -> int:
+        """
+        Recompute and cache results for the top_n most frequent recent
+        queries, so they are served from the result cache even right after
+        a refresh invalidated it. Each is replayed with its filters and the
+        deepest page asked for. Returns how many were cached
+        """
+        if self.result_cache.max_entries <= 0:
+            return 0
+        
+        warmed = 0
+        started = time.monotonic()
+        for keywords, location, filters, depth, _ in self.query_log.top(top_n):
+            result = self._search_sources(keywords, location, filters, depth)
+            if not result['partial']:
+                self.result_cache.put(self._cache_key(keywords, location, filters), result)
+                warmed += 1
+        
+        logger.info(f"Prewarmed {warmed} queries in {time.monotonic() - started:.2f}s")
+        return warmed
+    
+    def match_profile(self, term_counts: Dict[str, float], limit: int = 20, offset: int = 0) -> Dict:
+        """
+        Rank every posting in the indexed feed (or, in a process that doesn't
+        index it, a snapshot of the job database) by TF-IDF cosine similarity
+        to a candidate profile (term -> count, e.g. from job_store.profile_terms)
+        """
+        store = self._profile_store()
+        with stage_timer('job_scraper', 'similarity'):
+            ranked, total = store.similar(term_counts, limit=limit, offset=offset)
+        with stage_timer('job_scraper', 'project'):
+            jobs = [with_extras(job, similarity=round(score, 4)) for score, job in ranked]
+        
+        return {'jobs': jobs, 'total': total}
+    
+    def _profile_store(self) -> JobStore:
+        """The postings match_profile ranks; only reads the network while nothing is stored locally"""
+        if len(self.job_store):
+            return self.job_store
         
-        all_jobs = []
+        if self.job_database is not None:
+            # The ingestor (or the process holding the refresh lock) fills the database
+            with self._snapshot_lock:
+                if self._snapshot_stale:
+                    self._snapshot_stale = False
+                    with stage_timer('job_scraper', 'snapshot'):
+                        self.database_snapshot.replace_records(
+                            Job.from_dict(job) for job in self.job_database.jobs(source=self.sources['remoteok'].label)
+                        )
+            return self.database_snapshot
         
-        # Source 1: RemoteOK API (real remote jobs)
-        if self.sources['remoteok']['enabled']:
-            remote_jobs = self._scrape_remoteok(keywords)
-            all_jobs.extend(remote_jobs)
-            logger.info(f"Found {len(remote_jobs)} jobs from RemoteOK")
+        if not self.local_only:
+            # First call before any refresh: loading the feed fills the store via _on_feed_refresh
+            try:
+                self.feed_cache.get(self.sources['remoteok'].api_url)
+            except Exception as e:
+                logger.error(f"Error loading feed for matching: {str(e)}")
+        # Local-only: empty until the scheduler's first refresh fills the store
+        return self.job_store
+    
+    def _search_sources(self, keywords: str, location: str, filters: Optional[Dict] = None, depth: int = 0) -> Dict:
+        """Fan out to every source (for at least depth jobs each), then merge, rank and dedupe"""
+        providers = self._fanout_providers(keywords, location)
+        results = SourceResults(depth)
+        futures = [(p, self.executors[p.name].submit(self._fetch_from, p, keywords, location, filters, max(p.max_jobs, depth)))
+                   for p in providers]
         
-        # Source 2: Mock jobs (for any job type testing)
-        if self.sources['mock']['enabled']:
-            mock_jobs = self._generate_smart_mock_jobs(keywords, location)
-            all_jobs.extend(mock_jobs)
-            logger.info(f"Generated {len(mock_jobs)} mock jobs")
+        for provider, future in futures:
+            try:
+                results.add(provider, future.result(timeout=results.remaining(provider)))
+            except FutureTimeoutError:
+                # Still queued behind the source's busy threads: don't run it at all
+                future.cancel()
+                results.timed_out(provider)
+            except Exception as e:
+                results.failed(provider, e)
+        results.finish()
         
-        # Remove duplicates and return
-        unique_jobs = self._remove_duplicates(all_jobs)
-        logger.info(f"Total unique jobs found: {len(unique_jobs)}")
+        return self._merge_results(results.jobs, results.report, keywords, filters, depth)
+    
+    def _fanout_providers(self, keywords: str, location: str) -> List[JobProvider]:
+        """The enabled sources, in registration order so the merged list is deterministic"""
+        logger.info(f"Searching jobs for: '{keywords}' in '{location}'")
+        return [p for p in self.sources.values() if p.enabled]
+    
+    def _merge_results(self, all_jobs: List[Dict], source_report: List[Dict], keywords: str,
+                       filters: Optional[Dict] = None, depth: int = 0) -> Dict:
+        """
+        Rank, dedupe and filter the jobs collected from every source, and
+        count facets. total also counts the RemoteOK matches beyond the
+        depth that was fetched
+        """
+        # Rank first so the best-scoring copy of a duplicate is the one kept
+        with stage_timer('job_scraper', 'rank'):
+            ranked_jobs = self._rank_jobs(all_jobs, keywords)
+        with stage_timer('job_scraper', 'dedup'):
+            unique_jobs = self._remove_duplicates(ranked_jobs)
+        with stage_timer('job_scraper', 'facets'):
+            # Sources that can't filter (or filter loosely) are caught here
+            unique_jobs = [job for job in unique_jobs if matches_filters(job, filters)]
+            facets = self._facet_counts(keywords, filters, unique_jobs)
+            total = len(unique_jobs) + self._unfetched_matches(facets, source_report)
+        logger.info(f"Total unique jobs found: {len(unique_jobs)} of {total}")
         
-        return unique_jobs
+        return {
+            'jobs': unique_jobs,
+            'total': total,
+            'depth': depth,
+            'facets': facets,
+            'sources': source_report,
+            'sources_answered': [r['name'] for r in source_report if r['status'] == 'ok'],
+            'partial': any(r['status'] != 'ok' for r in source_report)
+        }
+    
+    def _facet_counts(self, keywords: str, filters: Optional[Dict], jobs: List[Dict]) -> Dict:
+        """
+        Counts over every RemoteOK match, from the database or the indexed feed
+        (whichever RemoteOK results are read from), else over the merged jobs
+        """
+        if self.job_database is not None:
+            return self.job_database.facet_counts(keywords, source=self.sources['remoteok'].label, filters=filters)
+        if len(self.job_store):
+            return self.job_store.facet_counts(keywords, filters)
+        index = FacetIndex(jobs)
+        return dict(index.counts(index.mask(None)), matched=len(jobs))
+    
+    def _unfetched_matches(self, facets: Dict, source_report: List[Dict]) -> int:
+        """RemoteOK matches past the ones fetched, as counted by the database or index facets without loading them"""
+        report = next((r for r in source_report if r['name'] == 'remoteok' and r['status'] == 'ok'), None)
+        if report is None or (self.job_database is None and not len(self.job_store)):
+            # Streamed: nothing counts the matches that were not downloaded
+            return 0
+        return max(0, facets['matched'] - report['jobs'])
+    
+    def _fetch_from(self, provider: JobProvider, keywords: str, location: str, filters: Optional[Dict] = None,
+                    limit: Optional[int] = None) -> List[Dict]:
+        with stage_timer('job_scraper', f'source_{provider.name}'):
+            return provider.fetch_jobs(keywords, location, filters, limit)
     
-    def _scrape_remoteok(self, keywords: str) -> List[Dict]:
-        """Scrape RemoteOK API for real remote jobs"""
+    def _scrape_remoteok(self, keywords: str, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Scrape RemoteOK API for real remote jobs (the best limit matches, max_jobs by default)"""
         try:
-            url = "https://remoteok.io/api"
-            response = self.session.get(url, timeout=10)
+            provider = self.sources['remoteok']
+            limit = limit or provider.max_jobs
+            mode = self._remoteok_mode()
+            if mode == 'database':
+                return self._search_database(keywords, limit, filters)
             
-            if response.status_code == 200:
-                data = response.json()
-                jobs = []
-                
-                # Filter jobs by keywords (case insensitive)
-                keywords_lower = keywords.lower()
-                
-                for job in data[1:21]:  # Skip first item (metadata), limit to 20
-                    if isinstance(job, dict) and self._job_matches_keywords(job, keywords_lower):
-                        processed_job = {
-                            'title': job.get('position', 'Unknown Title'),
-                            'company': job.get('company', 'Unknown Company'),
-                            'location': 'Remote',
-                            'salary': self._format_salary(job),
-                            'description': self._clean_description(job.get('description', '')),
-                            'url': f"https://remoteok.io/remote-jobs/{job.get('id', '')}",
-                            'source': 'RemoteOK',
-                            'posted_date': 'Recently',
-                            'tags': job.get('tags', [])
-                        }
-                        jobs.append(processed_job)
-                
-                return jobs[:self.sources['remoteok']['max_jobs']]
+            if mode == 'stream':
+                with stage_timer('job_scraper', 'stream_filter'):
+                    return self.stream_remoteok(keywords, limit=limit, filters=filters)
+            
+            with stage_timer('job_scraper', 'upstream_fetch'):
+                # Local-only reads whatever the scheduler last fetched; the network
+                # is used only while nothing has been fetched yet
+                data = self.feed_cache.peek(provider.api_url) if self.local_only else None
+                if data is None:
+                    data = self.feed_cache.get(provider.api_url)
+            
+            if isinstance(data, list):
+                return self._rank_indexed(keywords, limit, filters)
                 
         except Exception as e:
             logger.error(f"Error scraping RemoteOK: {str(e)}")
         
         return []
     
+    def _remoteok_mode(self) -> str:
+        """
+        Where RemoteOK results come from: 'database', 'stream' (the feed
+        filtered as it downloads) or 'index' (the cached, indexed feed)
+        """
+        if self.job_database is not None:
+            return 'database'
+        if self.streaming and not self.local_only:
+            return 'stream'
+        return 'index'
+    
+    def _search_database(self, keywords: str, limit: int, filters: Optional[Dict] = None) -> List[Dict]:
+        with stage_timer('job_scraper', 'db_query'):
+            return self.job_database.search(keywords, limit=limit, source=self.sources['remoteok'].label, filters=filters)
+    
+    def _rank_indexed(self, keywords: str, limit: int, filters: Optional[Dict] = None) -> List[Dict]:
+        """
+        The best limit matches of the whole indexed feed (reindexed by
+        _on_feed_refresh whenever the feed changes), not just its first rows
+        """
+        with stage_timer('job_scraper', 'index_query'):
+            ranked = self.job_store.rank(keywords, limit=limit, filters=filters)
+        with stage_timer('job_scraper', 'project'):
+            return [with_extras(job, relevance=round(score, 4)) for score, job in ranked]
+    
+    def stream_remoteok(self, keywords: str, limit: int, filters: Optional[Dict] = None) -> List[Dict]:
+        """
+        Parse the RemoteOK feed posting by posting as it downloads, keeping
+        the first limit keyword matches that pass filters (projected as they
+        arrive) and closing the connection as soon as enough are collected
+        """
+        jobs = []
+        response = self.transport.get(self.sources['remoteok'].api_url, stream=True)
+        try:
+            response.raise_for_status()
+            self._collect_matches(iter_json_array(response.iter_content(CHUNK_SIZE)), keywords, limit, filters, jobs)
+        finally:
+            response.close()
+        
+        return jobs
+    
+    def _collect_matches(self, postings: Iterable, keywords: str, limit: int, filters: Optional[Dict], jobs: List[Dict]) -> bool:
+        """
+        Append the raw feed postings matching keywords and filters to jobs,
+        projected; stops consuming postings and returns True once jobs
+        holds limit
+        """
+        keywords_lower = keywords.lower()
+        for job in postings:
+            if isinstance(job, dict) and job.get('position') and self._job_matches_keywords(job, keywords_lower):
+                job = self._process_remoteok_job(job)
+                if not matches_filters(job, filters):
+                    continue
+                jobs.append(job)
+                if len(jobs) >= limit:
+                    return True
+        return False
+    
+    def _rank_jobs(self, jobs: List[Dict], keywords: str) -> List[Dict]:
+        """
+        Order jobs by BM25F relevance to keywords
+        Jobs from sources without precomputed scores are scored here against
+        the indexed feed's statistics; ties keep source order
+        """
+        terms = query_terms(keywords)
+        ranker = self.job_store.ranker
+        
+        scored = []
+        for job in jobs:
+            if 'relevance' not in job:
+                fields = document_fields(job.get('title', ''), job.get('description', ''), job.get('tags', []))
+                job = with_extras(job, relevance=round(ranker.score(fields, terms), 4))
+            scored.append(job)
+        
+        return sorted(scored, key=lambda job: job['relevance'], reverse=True)
+    
+    def _process_remoteok_job(self, job: Dict) -> Dict:
+        """Project a raw RemoteOK posting onto our job shape, typed facet fields included"""
+        return {
+            'title': job.get('position', 'Unknown Title'),
+            'company': job.get('company', 'Unknown Company'),
+            'location': 'Remote',
+            'salary': self._format_salary(job),
+            'description': self._clean_description(job.get('description', '')),
+            'url': f"https://remoteok.io/remote-jobs/{job.get('id', '')}",
+            'source': 'RemoteOK',
+            'posted_date': 'Recently',
+            'tags': job.get('tags', []),
+            **self.job_store.typed_fields(job)
+        }
+    
+    def _remoteok_record(self, job: Dict) -> Job:
+        """The same projection as a compact record, as the job store keeps it"""
+        return Job(**self._process_remoteok_job(job))
+    
     def _job_matches_keywords(self, job: Dict, keywords: str) -> bool:
         """Check if job matches search keywords"""
         searchable_text = f"{job.get('position', '')} {job.get('description', '')} {' '.join(job.get('tags', []))}".lower()
@@ -129,11 +509,15 @@ class JobScraper:
         
         return clean_desc.strip()
     
-    def _generate_smart_mock_jobs(self, keywords: str, location: str) -> List[Dict]:
+    def _generate_smart_mock_jobs(self, keywords: str, location: str, remote: Optional[bool] = None) -> List[Dict]:
         """
         Generate realistic mock jobs for ANY job type
-        This ensures we always have results for testing
+        This ensures we always have results for testing. The jobs are remote
+        when remote is True, or when it is None and the keywords ask for it
         """
+        if remote is None:
+            remote = 'remote' in keywords.lower()
+
         # Extract main job concept
         main_concept = self._extract_job_concept(keywords)
         location = location or "Various Locations"
@@ -161,7 +545,7 @@ class JobScraper:
             {
                 'title': f'Freelance {main_concept}',
                 'company': 'Freelance Network',
-                'salary_range': (30, 80),  # Hourly rates
+                'salary_range': (30, 80),  # Hourly rates (annualized in the typed salary fields)
                 'description_template': f'Flexible {main_concept} position. Work on your own schedule with multiple clients.',
                 'is_hourly': True
             },
@@ -174,7 +558,7 @@ class JobScraper:
         ]
         
         mock_jobs = []
-        for i, template in enumerate(mock_templates[:self.sources['mock']['max_jobs']]):
+        for i, template in enumerate(mock_templates[:self.sources['mock'].max_jobs]):
             salary_min, salary_max = template['salary_range']
             
             if template.get('is_hourly'):
@@ -182,16 +566,19 @@ class JobScraper:
             else:
                 salary_str = f"${salary_min:,} - ${salary_max:,}"
             
+            mock_location = location if not remote else 'Remote'
             mock_job = {
                 'title': template['title'],
                 'company': template['company'],
-                'location': location if not ('remote' in keywords.lower()) else 'Remote',
+                'location': mock_location,
                 'salary': salary_str,
                 'description': template['description_template'],
                 'url': f'https://example.com/job/{i+1}',
                 'source': 'MockData',
                 'posted_date': f'{random.randint(1, 7)} days ago',
-                'tags': self._generate_relevant_tags(keywords)
+                'tags': self._generate_relevant_tags(keywords),
+                **typed_fields(template['title'], mock_location, salary_min, salary_max,
+                               remote=remote, hourly=template.get('is_hourly', False))
             }
             mock_jobs.append(mock_job)
         
@@ -240,15 +627,12 @@ class JobScraper:
         return tags[:4]  # Limit to 4 tags
     
     def _remove_duplicates(self, jobs: List[Dict]) -> List[Dict]:
-        """Remove duplicate jobs based on title and company"""
-        seen = set()
-        unique_jobs = []
-        
-        for job in jobs:
-            # Create unique key from title and company
-            key = (job['title'].lower().strip(), job['company'].lower().strip())
-            if key not in seen:
-                seen.add(key)
-                unique_jobs.append(job)
-        
-        return unique_jobs
+        """
+        Remove duplicate jobs: exact (normalized title, company) matches and
+        near-duplicates found by MinHash/LSH. The first (best-ranked) copy is
+        kept and records every source merged into it in merged_sources.
+        RemoteOK reposts are already collapsed on ingest into the index or
+        database, so only the streamed feed is deduplicated against itself
+        """
+        deduplicated_sources = [] if self._remoteok_mode() == 'stream' else [self.sources['remoteok'].label]
+        return self.deduplicator.deduplicate(jobs, deduplicated_sources)
@@ -0,0 +1,247 @@
+import heapq
+import re
+import threading
+from collections import Counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import logging
+
+import numpy as np
+
+from .facets import FacetIndex, typed_fields
+from .ranking import BM25Ranker
+from .similarity import TfidfMatrix
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#]*')
+TAG_RE = re.compile(r'<[^>]+>')
+# Trailing characters that could be the start of a token cut by a chunk boundary
+PARTIAL_TOKEN_RE = re.compile(r'[a-z0-9+#]*$')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; keeps '+' and '#' so c++ and c# survive"""
+    return TOKEN_RE.findall(text.lower())
+
+
+def query_terms(keywords: str) -> List[str]:
+    """Search terms from a keyword string (same >2 character rule as the keyword scan)"""
+    terms = []
+    for keyword in keywords.lower().split():
+        if len(keyword) > 2:
+            terms.extend(t for t in tokenize(keyword) if t not in terms)
+    return terms
+
+
+def document_fields(title: str, description: str, tags: Iterable[str]) -> Dict[str, List[str]]:
+    """Tokenized ranking fields for one posting"""
+    return {
+        'title': tokenize(title or ''),
+        'tags': tokenize(' '.join(tags or [])),
+        'description': tokenize(TAG_RE.sub(' ', description or ''))
+    }
+
+
+def profile_terms(text: str) -> Counter:
+    """Term counts for a query or resume text"""
+    return Counter(TOKEN_RE.findall(text.lower()))
+
+
+def count_terms(chunks: Iterable[str], counts: Counter) -> Iterator[str]:
+    """
+    Pass chunks through unchanged while adding their term counts to counts
+    A token split across two chunks is counted once, whole
+    """
+    carry = ''
+    for chunk in chunks:
+        text = carry + chunk.lower()
+        tail = PARTIAL_TOKEN_RE.search(text).start()
+        if tail == 0 and len(text) > 1024:
+            # No separator for a long stretch; don't let the carry grow without bound
+            tail = len(text)
+        counts.update(TOKEN_RE.findall(text, 0, tail))
+        carry = text[tail:]
+        yield chunk
+    counts.update(TOKEN_RE.findall(carry))
+
+
+class JobStore:
+    """
+    In-memory store of raw feed postings with an inverted index
+    Each posting is tokenized once on ingest; keyword queries are answered
+    with posting-list unions/intersections instead of scanning every job.
+    Postings carry precomputed BM25F term weights so ranking only has to
+    sum over the query's posting lists, a TF-IDF matrix of the same
+    snapshot answers whole-profile similarity queries, and a FacetIndex
+    filters and counts by salary, location, seniority and remote.
+    With project, each posting is kept as project(raw posting) (e.g. a
+    compact models.job.Job) and the raw dict is dropped once indexed.
+    With deduplicator (a dedup.NearDuplicateDetector), near-duplicate
+    postings are collapsed on ingest, keeping the first in feed order,
+    so every count the store answers is already deduplicated
+    """
+
+    def __init__(self, ranker_factory=BM25Ranker, project: Optional[Callable[[Dict], object]] = None,
+                 deduplicator=None):
+        self._lock = threading.Lock()
+        self._ranker_factory = ranker_factory
+        self._project = project
+        self._deduplicator = deduplicator
+        self._jobs: List[Dict] = []
+        self._index: Dict[str, Dict[int, float]] = {}
+        self._ranker = ranker_factory()
+        self._vectors = TfidfMatrix.empty()
+        self._facets = FacetIndex([])
+
+    def __len__(self):
+        return len(self._jobs)
+
+    @property
+    def ranker(self) -> BM25Ranker:
+        """Ranker fitted on the current snapshot (for scoring jobs from other sources)"""
+        return self._ranker
+
+    def replace(self, raw_jobs: Iterable[Dict]):
+        """Rebuild the store from a fresh feed; readers keep the old snapshot until the swap"""
+        jobs = [job for job in raw_jobs if isinstance(job, dict) and job.get('position')]
+        if self._deduplicator is not None:
+            clusters = self._deduplicator.clusters(
+                {'title': job.get('position'), 'company': job.get('company'), 'description': job.get('description')}
+                for job in jobs
+            )
+            if len(clusters) < len(jobs):
+                logger.info(f"Collapsed {len(jobs) - len(clusters)} duplicate postings")
+                jobs = [jobs[members[0]] for members in clusters]
+        fields = [self._document_fields(job) for job in jobs]
+        facets = FacetIndex([self.typed_fields(job) for job in jobs])
+        if self._project is not None:
+            jobs = [self._project(job) for job in jobs]
+        self._swap(jobs, fields, facets)
+
+    def replace_records(self, records: Iterable):
+        """
+        Rebuild the store from postings already in the API job shape (e.g.
+        database rows, which are deduplicated on ingest), kept as they are
+        """
+        jobs = list(records)
+        fields = [document_fields(job['title'], job['description'], job['tags']) for job in jobs]
+        self._swap(jobs, fields, FacetIndex(jobs))
+
+    def _swap(self, jobs: List, fields: List[Dict[str, List[str]]], facets: FacetIndex):
+        """Index a new snapshot and swap it in"""
+        ranker = self._ranker_factory()
+        ranker.fit(fields)
+
+        index: Dict[str, Dict[int, float]] = {}
+        for doc_id, doc_fields in enumerate(fields):
+            for term, weight in ranker.term_weights(doc_fields).items():
+                postings = index.get(term)
+                if postings is None:
+                    index[term] = {doc_id: weight}
+                else:
+                    postings[doc_id] = weight
+
+        vectors = TfidfMatrix.fit(fields)
+
+        with self._lock:
+            self._jobs = jobs
+            self._index = index
+            self._ranker = ranker
+            self._vectors = vectors
+            self._facets = facets
+
+        logger.info(f"Indexed {len(jobs)} postings ({len(index)} terms)")
+
+    @property
+    def jobs(self) -> List:
+        """The current snapshot's postings, as stored"""
+        return self._jobs
+
+    def search(self, keywords: str, limit: Optional[int] = None, match_all: bool = False) -> List[Dict]:
+        """
+        Return postings matching any (or, with match_all, every) keyword
+        Results keep feed order
+        """
+        with self._lock:
+            jobs, index = self._jobs, self._index
+
+        doc_ids = self._match(index, query_terms(keywords), match_all)
+        ordered = sorted(doc_ids) if limit is None else heapq.nsmallest(limit, doc_ids)
+        return [jobs[doc_id] for doc_id in ordered]
+
+    def rank(self, keywords: str, limit: int = 10, offset: int = 0, filters: Optional[Dict] = None) -> List[Tuple[float, Dict]]:
+        """
+        Top-k postings by BM25F score as (score, job) pairs, among those
+        passing filters (see facets.parse_filters). Ties keep feed order
+        """
+        with self._lock:
+            jobs, index, ranker, facets = self._jobs, self._index, self._ranker, self._facets
+
+        scores: Dict[int, float] = {}
+        for term in query_terms(keywords):
+            postings = index.get(term)
+            if not postings:
+                continue
+            idf = ranker.idf(term)
+            for doc_id, weight in postings.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * ranker.saturate(weight)
+
+        if filters:
+            allowed = facets.to_mask(facets.mask(filters))
+            scores = {doc_id: score for doc_id, score in scores.items() if allowed[doc_id]}
+
+        top = heapq.nsmallest(offset + limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(score, jobs[doc_id]) for doc_id, score in top[offset:]]
+
+    def facet_counts(self, keywords: str, filters: Optional[Dict] = None) -> Dict:
+        """
+        Facet value counts over every posting matching any keyword (all
+        postings for an empty query) and passing filters, plus the number
+        of such postings
+        """
+        with self._lock:
+            index, facets = self._index, self._facets
+
+        terms = query_terms(keywords)
+        matched = facets.mask(filters)
+        if terms:
+            doc_ids = self._match(index, terms, match_all=False)
+            matched = matched & facets.from_ids(np.fromiter(doc_ids, dtype=np.int64, count=len(doc_ids)))
+        return dict(facets.counts(matched), matched=facets.count(matched))
+
+    def similar(self, term_counts: Dict[str, float], limit: int = 10, offset: int = 0) -> Tuple[List[Tuple[float, Dict]], int]:
+        """
+        Postings most similar to a profile (term -> count, see profile_terms)
+        by TF-IDF cosine, as (score, job) pairs, plus the number of postings
+        sharing any term with the profile
+        """
+        with self._lock:
+            jobs, vectors = self._jobs, self._vectors
+
+        top, total = vectors.top_k(term_counts, k=limit, offset=offset)
+        return [(score, jobs[doc_id]) for score, doc_id in top], total
+
+    def _match(self, index: Dict[str, Dict[int, float]], terms: List[str], match_all: bool) -> Set[int]:
+        if not terms:
+            return set()
+
+        postings = [index.get(term, {}) for term in terms]
+        if match_all:
+            # Intersect smallest lists first so the working set shrinks quickly
+            postings.sort(key=len)
+            result = set(postings[0])
+            for posting in postings[1:]:
+                result.intersection_update(posting)
+                if not result:
+                    break
+            return result
+
+        return set().union(*postings)
+
+    def _document_fields(self, job: Dict) -> Dict[str, List[str]]:
+        return document_fields(job.get('position', ''), job.get('description'), job.get('tags'))
+
+    @staticmethod
+    def typed_fields(job: Dict) -> Dict:
+        """Typed facet fields of a raw RemoteOK posting (every RemoteOK job is remote)"""
+        return typed_fields(job.get('position'), job.get('location'), job.get('salary_min'), job.get('salary_max'), remote=True)
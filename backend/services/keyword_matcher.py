@@ -0,0 +1,88 @@
+import re
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Tuple
+
+WORD_CHARS = 'a-z0-9'
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Regex alternation factored on common prefixes ('data|database' becomes
+    'data(?:base)?') so the engine walks shared prefixes once. Longer
+    continuations are tried first, so each start reports its longest keyword
+    """
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node: Dict) -> str:
+        ends_here = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if ends_here:
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class KeywordHit(NamedTuple):
+    keyword: str
+    start: int
+    end: int
+    labels: Tuple[Hashable, ...]
+
+
+class KeywordMatcher:
+    """
+    Single-pass matcher for a fixed keyword vocabulary
+    All keywords are compiled into one alternation that only matches on word
+    boundaries (so 'pm' no longer fires inside 'development'), with an
+    optional plural 's'. Keywords nested inside longer ones ('data' inside
+    'data scientist') are reported too, using offsets precomputed at build time
+    """
+
+    def __init__(self, vocabulary: Dict[str, Iterable[Hashable]]):
+        self.labels = {keyword.lower(): tuple(labels) for keyword, labels in vocabulary.items()}
+
+        keywords = sorted(self.labels, key=len, reverse=True)
+        self._pattern = re.compile(
+            rf'(?<![{WORD_CHARS}])(?=({_trie_pattern(keywords)})s?(?![{WORD_CHARS}]))'
+        )
+
+        self._nested: Dict[str, List[Tuple[str, int]]] = {}
+        for outer in keywords:
+            nested = []
+            for inner in keywords:
+                if inner == outer or len(inner) >= len(outer):
+                    continue
+                inner_re = re.compile(rf'(?<![{WORD_CHARS}]){re.escape(inner)}(?![{WORD_CHARS}])')
+                nested.extend((inner, m.start()) for m in inner_re.finditer(outer))
+            if nested:
+                self._nested[outer] = nested
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """Every keyword occurrence in (lowercased) text, ordered by offset"""
+        hits = []
+        expanded = False
+
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1)
+            start = match.start(1)
+            hits.append(KeywordHit(keyword, start, start + len(keyword), self.labels[keyword]))
+
+            nested = self._nested.get(keyword)
+            if nested:
+                expanded = True
+                for inner, offset in nested:
+                    inner_start = start + offset
+                    hits.append(KeywordHit(inner, inner_start, inner_start + len(inner), self.labels[inner]))
+
+        if expanded:
+            # A nested keyword can also be found on its own at the same offset
+            hits = sorted(set(hits), key=lambda hit: (hit.start, -len(hit.keyword)))
+        return hits
@@ -0,0 +1,57 @@
+from typing import List, Dict, Optional
+
+
+class JobProvider:
+    """
+    A single job source queried by JobScraper
+    Subclasses implement fetch_jobs; the scraper runs providers concurrently
+    and enforces each provider's deadline. filters (see facets.parse_filters)
+    may be applied at the source so they act before its result limit; the
+    scraper applies them again to the merged list either way. limit asks
+    for that many of the best matches when a page reaches past max_jobs;
+    sources with a fixed result set may ignore it
+    """
+
+    def __init__(self, name: str, label: str, enabled: bool = True, max_jobs: int = 10, timeout: float = 5.0):
+        self.name = name
+        self.label = label
+        self.enabled = enabled
+        self.max_jobs = max_jobs
+        self.timeout = timeout
+
+    def fetch_jobs(self, keywords: str, location: str, filters: Optional[Dict] = None,
+                   limit: Optional[int] = None) -> List[Dict]:
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self.name!r}, enabled={self.enabled}, timeout={self.timeout})"
+
+
+class RemoteOKProvider(JobProvider):
+    """Real remote jobs from the RemoteOK JSON feed"""
+
+    def __init__(self, scraper, api_url: str = 'https://remoteok.io/api', **kwargs):
+        kwargs.setdefault('max_jobs', 10)
+        kwargs.setdefault('timeout', 8.0)
+        super().__init__('remoteok', 'RemoteOK', **kwargs)
+        self.scraper = scraper
+        self.api_url = api_url
+
+    def fetch_jobs(self, keywords: str, location: str, filters: Optional[Dict] = None,
+                   limit: Optional[int] = None) -> List[Dict]:
+        return self.scraper._scrape_remoteok(keywords, filters, limit)
+
+
+class MockProvider(JobProvider):
+    """Generated jobs so every query has results to show"""
+
+    def __init__(self, scraper, **kwargs):
+        kwargs.setdefault('max_jobs', 5)
+        kwargs.setdefault('timeout', 1.0)
+        super().__init__('mock', 'MockData', **kwargs)
+        self.scraper = scraper
+
+    def fetch_jobs(self, keywords: str, location: str, filters: Optional[Dict] = None,
+                   limit: Optional[int] = None) -> List[Dict]:
+        # Generated postings can honour a remote filter (e.g. one implied by the query's analysis)
+        return self.scraper._generate_smart_mock_jobs(keywords, location, remote=(filters or {}).get('remote'))
@@ -0,0 +1,71 @@
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+# Field weights for BM25F: a title hit counts three times a description hit
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'tags': 2.0,
+    'description': 1.0
+}
+
+
+class BM25Ranker:
+    """
+    BM25F scoring over title, tags and description
+    Corpus statistics (document frequencies, average field lengths) are
+    computed once per ingest with fit(); per-document term weights can then
+    be precomputed so a query only sums idf * saturation over posting lists
+    """
+
+    def __init__(self, field_weights: Optional[Dict[str, float]] = None, k1: float = 1.2, b: float = 0.75):
+        self.field_weights = field_weights or dict(FIELD_WEIGHTS)
+        self.k1 = k1
+        self.b = b
+        self.doc_count = 0
+        self.avg_field_len = {field: 0.0 for field in self.field_weights}
+        self.doc_freq: Dict[str, int] = {}
+
+    def fit(self, documents: Iterable[Dict[str, List[str]]]):
+        """Collect document frequencies and average field lengths"""
+        doc_count = 0
+        total_len = {field: 0 for field in self.field_weights}
+        doc_freq = Counter()
+
+        for fields in documents:
+            doc_count += 1
+            terms = set()
+            for field in self.field_weights:
+                tokens = fields.get(field, [])
+                total_len[field] += len(tokens)
+                terms.update(tokens)
+            doc_freq.update(terms)
+
+        self.doc_count = doc_count
+        self.avg_field_len = {field: (total_len[field] / doc_count if doc_count else 0.0) for field in self.field_weights}
+        self.doc_freq = dict(doc_freq)
+
+    def idf(self, term: str) -> float:
+        df = self.doc_freq.get(term, 0)
+        return math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+
+    def term_weights(self, fields: Dict[str, List[str]]) -> Dict[str, float]:
+        """Length-normalized, field-weighted term frequencies for one document"""
+        weights: Dict[str, float] = {}
+        for field, field_weight in self.field_weights.items():
+            tokens = fields.get(field, [])
+            if not tokens:
+                continue
+            avg_len = self.avg_field_len.get(field) or len(tokens)
+            norm = 1 - self.b + self.b * len(tokens) / avg_len
+            for term, tf in Counter(tokens).items():
+                weights[term] = weights.get(term, 0.0) + field_weight * tf / norm
+        return weights
+
+    def saturate(self, weight: float) -> float:
+        return weight / (self.k1 + weight)
+
+    def score(self, fields: Dict[str, List[str]], terms: List[str]) -> float:
+        """Score a document that was not precomputed (e.g. from another source)"""
+        weights = self.term_weights(fields)
+        return sum(self.idf(term) * self.saturate(weights[term]) for term in terms if term in weights)
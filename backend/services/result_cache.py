@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+STOP_WORDS = {
+    'a', 'an', 'and', 'the', 'in', 'of', 'or', 'to', 'at', 'as', 'with', 'for', 'looking',
+    'job', 'jobs', 'position', 'positions', 'work', 'career', 'role', 'opening', 'openings'
+}
+
+
+def normalize_query(keywords: str, location: str = '') -> Tuple[Tuple[str, ...], str]:
+    """
+    Cache key for a search: lowercased, stop words removed, tokens sorted
+    'Remote Python developer' and 'python developer remote' share a key
+    """
+    tokens = sorted({word for word in keywords.lower().split() if word not in STOP_WORDS})
+    return tuple(tokens), ' '.join(location.lower().split())
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with a per-entry TTL and a size bound
+    Keeps hit/miss/eviction counters for health reporting
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 120):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0
+        }
+
+    def get(self, key: Hashable, accept: Optional[Callable[[Any], bool]] = None) -> Optional[Any]:
+        """The live entry for key, else None; with accept, an entry it rejects counts as a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            stored_at, value = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            if accept is not None and not accept(value):
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def clear(self):
+        """Drop every entry (e.g. because the data behind them changed)"""
+        with self._lock:
+            if self._entries:
+                self._stats['invalidations'] += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['max_entries'] = self.max_entries
+        stats['ttl_seconds'] = self.ttl
+        return stats
+
+
+class QueryLog:
+    """
+    Recent searches counted per normalized query over a sliding window
+    (fixed time buckets), so the most frequent ones can be prewarmed.
+    At most max_queries distinct queries are tracked per window
+    """
+
+    def __init__(self, window: float = 900, buckets: int = 15, max_queries: int = 10000):
+        self.window = window
+        self.buckets = buckets
+        self.max_queries = max_queries
+        self._bucket_seconds = window / buckets
+        self._counts: Deque[Tuple[int, Counter]] = deque()
+        # Latest raw (keywords, location, filters) seen for each key and the deepest
+        # fetch depth asked for, to replay it
+        self._queries: Dict[Hashable, Tuple[str, str, Optional[Dict], int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: Hashable, keywords: str, location: str = '', filters: Optional[Dict] = None, depth: int = 0):
+        bucket = int(time.monotonic() // self._bucket_seconds)
+        with self._lock:
+            self._expire(bucket)
+            if key not in self._queries and len(self._queries) >= self.max_queries:
+                return
+            if not self._counts or self._counts[-1][0] != bucket:
+                self._counts.append((bucket, Counter()))
+            self._counts[-1][1][key] += 1
+            previous = self._queries.get(key)
+            if previous is not None:
+                depth = max(depth, previous[3])
+            self._queries[key] = (keywords, location, filters, depth)
+
+    def top(self, n: int) -> List[Tuple[str, str, Optional[Dict], int, int]]:
+        """The n most frequent queries in the window as (keywords, location, filters, depth, count)"""
+        with self._lock:
+            self._expire(int(time.monotonic() // self._bucket_seconds))
+            totals = Counter()
+            for _, counts in self._counts:
+                totals.update(counts)
+            return [(*self._queries[key], count) for key, count in totals.most_common(n)]
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def _expire(self, bucket: int):
+        while self._counts and self._counts[0][0] <= bucket - self.buckets:
+            _, expired = self._counts.popleft()
+            for key in expired:
+                if not any(key in counts for _, counts in self._counts):
+                    del self._queries[key]
@@ -0,0 +1,130 @@
+import codecs
+import os
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Iterator
+import logging
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+class ResumeParseError(ValueError):
+    """The upload could not be read as a resume"""
+
+
+class UnsupportedResumeType(ResumeParseError):
+    """The upload is not PDF, DOCX or plain text"""
+
+
+def detect_format(stream: BinaryIO, filename: str) -> str:
+    """Sniff the first bytes (falling back to the extension) without consuming the stream"""
+    head = stream.read(8)
+    stream.seek(0)
+    extension = os.path.splitext(filename or '')[1].lower()
+
+    if head.startswith(b'%PDF'):
+        return 'pdf'
+    if head.startswith(b'PK\x03\x04'):
+        if extension in ('.docx', ''):
+            return 'docx'
+        raise UnsupportedResumeType(f"Unsupported archive type '{extension}'")
+    if extension in ('.pdf', '.docx'):
+        raise ResumeParseError(f"File does not look like a valid {extension[1:].upper()}")
+    if extension in ('.txt', '.md', '.text', ''):
+        return 'text'
+    raise UnsupportedResumeType(f"Unsupported resume type '{extension}'. Upload a PDF, DOCX or TXT file")
+
+
+def iter_resume_text(stream: BinaryIO, filename: str, max_chars: int = 200_000) -> Iterator[str]:
+    """
+    Yield the resume's text in chunks of roughly CHUNK_SIZE characters
+    The upload is never read into memory whole; extraction stops after
+    max_chars so compressed formats can't expand without bound
+    """
+    readers = {'pdf': _iter_pdf_text, 'docx': _iter_docx_text, 'text': _iter_plain_text}
+    reader = readers[detect_format(stream, filename)]
+
+    emitted = 0
+    for chunk in reader(stream):
+        if emitted + len(chunk) > max_chars:
+            yield chunk[:max_chars - emitted]
+            logger.warning(f"Resume text truncated at {max_chars} characters")
+            return
+        emitted += len(chunk)
+        yield chunk
+
+
+def _iter_plain_text(stream: BinaryIO) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    while True:
+        block = stream.read(CHUNK_SIZE)
+        if not block:
+            break
+        text = decoder.decode(block)
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def _iter_pdf_text(stream: BinaryIO) -> Iterator[str]:
+    try:
+        from pypdf import PdfReader
+        from pypdf.errors import PdfReadError
+    except ImportError:
+        raise UnsupportedResumeType("PDF support requires the 'pypdf' package")
+
+    try:
+        reader = PdfReader(stream)
+        # Pages are parsed lazily, one at a time
+        for page in reader.pages:
+            text = page.extract_text() or ''
+            if text:
+                yield text + '\n'
+    except PdfReadError as e:
+        raise ResumeParseError(f"Could not read PDF: {str(e)}")
+
+
+def _iter_docx_text(stream: BinaryIO) -> Iterator[str]:
+    try:
+        archive = zipfile.ZipFile(stream)
+        document = archive.open('word/document.xml')
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise ResumeParseError(f"Could not read DOCX: {str(e)}")
+
+    buffer = []
+    buffered = 0
+    body = None
+
+    with archive, document:
+        try:
+            # Stream the XML and drop finished paragraphs so memory stays flat
+            for event, elem in ET.iterparse(document, events=('start', 'end')):
+                if event == 'start':
+                    if elem.tag == WORD_NS + 'body':
+                        body = elem
+                    continue
+
+                if elem.tag == WORD_NS + 't' and elem.text:
+                    buffer.append(elem.text)
+                    buffered += len(elem.text)
+                elif elem.tag == WORD_NS + 'tab':
+                    buffer.append(' ')
+                elif elem.tag == WORD_NS + 'p':
+                    buffer.append('\n')
+                    if body is not None:
+                        body.clear()
+                    if buffered >= CHUNK_SIZE:
+                        yield ''.join(buffer)
+                        buffer = []
+                        buffered = 0
+        except ET.ParseError as e:
+            raise ResumeParseError(f"Could not read DOCX: {str(e)}")
+
+    if buffer:
+        yield ''.join(buffer)
@@ -0,0 +1,199 @@
+import os
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+import logging
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process dev server, nothing to elect
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class HostLock:
+    """
+    Non-blocking exclusive lock on a file, kept once taken until release()
+    Elects one process per host (one gunicorn worker among N) for work that
+    must not run once per process, such as downloading and ingesting a feed
+    into a shared database. The OS drops the lock when its holder exits, so
+    another process takes over at its next acquire()
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    @property
+    def held(self) -> bool:
+        return self._file is not None
+
+    def acquire(self) -> bool:
+        """Take the lock if no other process holds it; True while this process does"""
+        with self._lock:
+            if self._file is not None or fcntl is None:
+                return True
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            lock_file = open(self.path, 'a+')
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return False
+            lock_file.truncate(0)
+            lock_file.write(f"{os.getpid()}\n")
+            lock_file.flush()
+            self._file = lock_file
+            logger.info(f"Process {os.getpid()} holds {self.path}")
+            return True
+
+    def release(self):
+        with self._lock:
+            if self._file is not None:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+                self._file.close()
+                self._file = None
+
+
+class RefreshScheduler:
+    """
+    In-process background scheduler for upstream refreshes and prewarming
+    Jobs run one at a time on a single daemon thread, and each is next due a
+    jittered interval after its run finishes (not after it started): a slow
+    upstream pushes back its own next refresh instead of runs piling up, and
+    workers started together drift apart instead of refreshing in lockstep.
+    A job's defer callback can hold it back (seconds to wait, e.g. while
+    its upstream's circuit breaker is open) without counting a failure
+    """
+
+    def __init__(self, jitter: float = 0.1):
+        self.jitter = jitter
+        self._jobs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add_job(self, name: str, interval: float, func: Callable[[], object], initial_delay: float = 0.0,
+                defer: Optional[Callable[[], float]] = None):
+        """Run func every interval seconds (jittered), first after initial_delay"""
+        with self._lock:
+            self._jobs[name] = {
+                'interval': interval,
+                'func': func,
+                'defer': defer,
+                'due': time.monotonic() + self._jittered(initial_delay),
+                'running': False,
+                'runs': 0,
+                'failures': 0,
+                'consecutive_failures': 0,
+                'deferrals': 0,
+                'last_run': None,
+                'last_success': None,
+                'last_duration': None,
+                'last_error': None
+            }
+        self._wakeup.set()
+
+    def run_soon(self, name: str):
+        """Move a job's next run forward to now (no-op for unknown jobs)"""
+        with self._lock:
+            job = self._jobs.get(name)
+            if job is None:
+                return
+            now = time.monotonic()
+            # While it runs, any change to 'due' marks a rerun (see _run_job)
+            job['due'] = now if job['running'] else min(job['due'], now)
+        self._wakeup.set()
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='refresh-scheduler', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get_stats(self) -> Dict:
+        """Per job: how long ago it last refreshed successfully, when it runs next, and its failure counts"""
+        now = time.monotonic()
+        age = lambda at: round(now - at, 1) if at is not None else None
+        with self._lock:
+            return {
+                name: {
+                    'interval_seconds': job['interval'],
+                    'last_refresh_age_seconds': age(job['last_success']),
+                    'last_run_age_seconds': age(job['last_run']),
+                    'last_duration_ms': round(job['last_duration'] * 1000, 1) if job['last_duration'] is not None else None,
+                    'next_run_in_seconds': round(max(0.0, job['due'] - now), 1),
+                    'running': job['running'],
+                    'runs': job['runs'],
+                    'failures': job['failures'],
+                    'consecutive_failures': job['consecutive_failures'],
+                    'deferrals': job['deferrals'],
+                    'last_error': job['last_error']
+                }
+                for name, job in self._jobs.items()
+            }
+
+    def _jittered(self, seconds: float) -> float:
+        return seconds * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._lock:
+                name, job = min(self._jobs.items(), key=lambda item: item[1]['due'], default=(None, None))
+                wait = job['due'] - time.monotonic() if job is not None else None
+                self._wakeup.clear()
+
+            if job is None or wait > 0:
+                # Woken early by add_job/run_soon/stop
+                self._wakeup.wait(wait)
+                continue
+
+            hold = job['defer']() if job['defer'] is not None else 0
+            if hold and hold > 0:
+                with self._lock:
+                    job['deferrals'] += 1
+                    job['due'] = time.monotonic() + hold
+                logger.info(f"Deferring scheduled job {name} for {hold:.1f}s")
+                continue
+
+            self._run_job(name, job)
+
+    def _run_job(self, name: str, job: Dict):
+        with self._lock:
+            job['running'] = True
+            due = job['due']
+        started = time.monotonic()
+        error = None
+        try:
+            job['func']()
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            logger.warning(f"Scheduled job {name} failed: {error}")
+
+        finished = time.monotonic()
+        with self._lock:
+            job['running'] = False
+            job['runs'] += 1
+            job['last_run'] = finished
+            job['last_duration'] = finished - started
+            if error is None:
+                job['last_success'] = finished
+                job['consecutive_failures'] = 0
+            else:
+                job['failures'] += 1
+                job['consecutive_failures'] += 1
+                job['last_error'] = error
+            # Unless run_soon() moved it while this run was in progress
+            if job['due'] == due:
+                job['due'] = finished + self._jittered(job['interval'])
@@ -0,0 +1,129 @@
+import math
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .ranking import FIELD_WEIGHTS
+
+
+class TfidfMatrix:
+    """
+    Postings as L2-normalized TF-IDF vectors in a sparse CSR matrix
+    The matrix is stored term-major (row t lists every posting containing
+    term t), so scoring a profile against the corpus is one sparse
+    matrix-vector product that only reads the rows of the profile's terms:
+    a vectorized gather plus a bincount, with no Python loop over postings
+    """
+
+    def __init__(self, vocabulary: Dict[str, int], indptr: np.ndarray, indices: np.ndarray, data: np.ndarray,
+                 idf: np.ndarray, doc_count: int):
+        self.vocabulary = vocabulary
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.idf = idf
+        self.doc_count = doc_count
+
+    @classmethod
+    def empty(cls) -> 'TfidfMatrix':
+        return cls({}, np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32),
+                   np.zeros(0, dtype=np.float32), 0)
+
+    @classmethod
+    def fit(cls, documents: List[Dict[str, List[str]]], field_weights: Optional[Dict[str, float]] = None) -> 'TfidfMatrix':
+        """
+        Vectorize tokenized postings (see job_store.document_fields)
+        Term frequency is field-weighted like BM25F, then dampened with 1 + log(tf)
+        """
+        field_weights = field_weights or FIELD_WEIGHTS
+        vocabulary: Dict[str, int] = {}
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        frequencies: List[float] = []
+
+        for doc_id, fields in enumerate(documents):
+            weighted: Dict[str, float] = {}
+            for field, field_weight in field_weights.items():
+                for term, tf in Counter(fields.get(field, [])).items():
+                    weighted[term] = weighted.get(term, 0.0) + field_weight * tf
+            for term, tf in weighted.items():
+                term_id = vocabulary.get(term)
+                if term_id is None:
+                    term_id = vocabulary[term] = len(vocabulary)
+                term_ids.append(term_id)
+                doc_ids.append(doc_id)
+                frequencies.append(tf)
+
+        doc_count = len(documents)
+        if not term_ids:
+            matrix = cls.empty()
+            matrix.doc_count = doc_count
+            return matrix
+
+        terms = np.array(term_ids, dtype=np.int32)
+        docs = np.array(doc_ids, dtype=np.int32)
+        doc_freq = np.bincount(terms, minlength=len(vocabulary))
+        # Smoothed idf, always positive so terms found in every posting still count a little
+        idf = (np.log((1 + doc_count) / (1 + doc_freq)) + 1).astype(np.float32)
+
+        weights = (1 + np.log(np.array(frequencies, dtype=np.float32))) * idf[terms]
+        norms = np.sqrt(np.bincount(docs, weights=weights * weights, minlength=doc_count))
+        weights /= norms[docs]
+
+        # COO -> term-major CSR
+        order = np.argsort(terms, kind='stable')
+        indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(doc_freq, out=indptr[1:])
+        return cls(vocabulary, indptr, docs[order], weights[order].astype(np.float32), idf, doc_count)
+
+    def vectorize(self, term_counts: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray]:
+        """Sparse unit query vector as (term ids, weights); unknown terms are dropped"""
+        ids = []
+        weights = []
+        for term, count in term_counts.items():
+            term_id = self.vocabulary.get(term)
+            if term_id is not None and count > 0:
+                ids.append(term_id)
+                weights.append((1 + math.log(count)) * float(self.idf[term_id]))
+
+        ids = np.array(ids, dtype=np.int64)
+        weights = np.array(weights, dtype=np.float32)
+        if len(weights):
+            weights /= np.sqrt(np.dot(weights, weights))
+        return ids, weights
+
+    def scores(self, term_counts: Dict[str, float]) -> np.ndarray:
+        """Cosine similarity of the profile with every posting"""
+        ids, weights = self.vectorize(term_counts)
+        if not len(ids):
+            return np.zeros(self.doc_count, dtype=np.float64)
+
+        starts = self.indptr[ids]
+        lengths = self.indptr[ids + 1] - starts
+        total = int(lengths.sum())
+        # Positions of every stored entry in the selected rows, without a Python loop
+        row_offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        positions = np.arange(total, dtype=np.int64) + row_offsets
+
+        contributions = self.data[positions] * np.repeat(weights, lengths)
+        return np.bincount(self.indices[positions], weights=contributions, minlength=self.doc_count)
+
+    def top_k(self, term_counts: Dict[str, float], k: int = 10, offset: int = 0) -> Tuple[List[Tuple[float, int]], int]:
+        """
+        Best-matching postings as (score, doc_id) pairs, plus how many matched at all
+        Ties keep feed order
+        """
+        scores = self.scores(term_counts)
+        matched = np.flatnonzero(scores > 0)
+        total = len(matched)
+        wanted = min(offset + k, total)
+        if wanted <= 0:
+            return [], total
+
+        if wanted < total:
+            # Partial selection, widened to every posting tied with the cut-off score
+            cutoff = -np.partition(-scores[matched], wanted - 1)[wanted - 1]
+            matched = matched[scores[matched] >= cutoff]
+        order = np.lexsort((matched, -scores[matched]))[offset:wanted]
+        return [(float(scores[doc_id]), int(doc_id)) for doc_id in matched[order]], total
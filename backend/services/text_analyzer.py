@@ -0,0 +1,276 @@
+from typing import Dict, Optional, Tuple
+
+from .keyword_matcher import KeywordMatcher
+from .metrics import stage_timer
+from .result_cache import ResultCache
+
+class AIReadyTextAnalyzer:
+    """Text analyzer designed for easy AI integration later"""
+    
+    def __init__(self, cache_size=1024, cache_ttl=120):
+        self.known_job_patterns = {
+            'Software Developer': ['developer', 'programming', 'coding', 'software engineer'],
+            'Data Scientist': ['data scientist', 'data', 'analytics', 'machine learning', 'ml'],
+            'Frontend Developer': ['frontend', 'front-end', 'react', 'javascript', 'css', 'html', 'ui'],
+            'Backend Developer': ['backend', 'back-end', 'api', 'server', 'database'],
+            'DevOps Engineer': ['devops', 'docker', 'kubernetes', 'aws', 'infrastructure'],
+            'Full Stack Developer': ['full stack', 'fullstack', 'full-stack'],
+            'Nurse': ['nurse', 'nursing', 'healthcare', 'medical', 'rn'],
+            'Teacher': ['teacher', 'education', 'instructor', 'professor', 'tutor'],
+            'Accountant': ['accountant', 'accounting', 'finance', 'bookkeeper'],
+            'Chef': ['chef', 'cook', 'culinary', 'kitchen', 'restaurant'],
+            'Sales Representative': ['sales', 'salesperson', 'selling', 'sales rep'],
+            'Marketing Manager': ['marketing', 'marketing manager', 'digital marketing'],
+            'Graphic Designer': ['graphic designer', 'designer', 'design', 'photoshop'],
+            'Project Manager': ['project manager', 'pm', 'project management'],
+        }
+        
+        self.skill_patterns = [
+            'python', 'javascript', 'react', 'java', 'c++', 'sql',
+            'aws', 'docker', 'kubernetes', 'git', 'linux', 'html', 'css'
+        ]
+        
+        self.preference_patterns = {
+            'remote_preferred': ['remote', 'work from home', 'wfh'],
+            'part_time': ['part time', 'part-time'],
+            'freelance': ['freelance', 'contract'],
+            'senior_level': ['senior', 'lead', 'principal'],
+            'junior_level': ['junior', 'entry', 'new grad']
+        }
+        
+        self.intent_words = ['job', 'position', 'work', 'career']
+        
+        # Every role, skill, preference and intent keyword in one automaton, so a
+        # query is scanned once instead of once per keyword
+        vocabulary = {}
+        for role, keywords in self.known_job_patterns.items():
+            for keyword in keywords:
+                vocabulary.setdefault(keyword, []).append(('role', role))
+        for skill in self.skill_patterns:
+            vocabulary.setdefault(skill, []).append(('skill', skill))
+        for preference, terms in self.preference_patterns.items():
+            for term in terms:
+                vocabulary.setdefault(term, []).append(('preference', preference))
+        for word in self.intent_words:
+            vocabulary.setdefault(word, []).append(('intent', word))
+        self.matcher = KeywordMatcher(vocabulary)
+        
+        self.ai_service = None
+        self.confidence_threshold = 0.7
+        
+        # Keyed on the lowercased text: results carry keyword offsets, so
+        # reordered queries cannot share an entry
+        self.cache = ResultCache(max_entries=cache_size, ttl=cache_ttl)
+        
+    def analyze_text(self, search_text):
+        search_text = search_text.strip()
+        original_text = search_text
+        search_text_lower = search_text.lower()
+        
+        with stage_timer('analyzer', 'cache_lookup'):
+            cached = self.cache.get(search_text_lower)
+        if cached is not None:
+            return dict(cached, original_query=original_text)
+        
+        with stage_timer('analyzer', 'pattern_analysis'):
+            simple_result = self._simple_pattern_analysis(search_text_lower)
+        
+        if simple_result['confidence'] < self.confidence_threshold:
+            if self.ai_service:
+                pass
+            else:
+                with stage_timer('analyzer', 'fallback'):
+                    enhanced_result = self._fallback_analysis(search_text_lower)
+                if enhanced_result.get('predicted_roles'):
+                    simple_result['predicted_roles'] = enhanced_result['predicted_roles']
+                    simple_result['confidence'] = max(simple_result['confidence'], 0.6)
+                    simple_result['fallback_used'] = True
+                    simple_result['analysis_method'] = 'fallback_patterns'
+        
+        if 'analysis_method' not in simple_result:
+            simple_result['analysis_method'] = 'pattern_matching'
+        
+        simple_result.update({
+            'original_query': original_text,
+            'search_type': 'text_search',
+            'ai_ready': True,
+            'can_enhance_with_ai': simple_result['confidence'] < self.confidence_threshold
+        })
+        
+        self.cache.put(search_text_lower, simple_result)
+        return simple_result
+    
+    def _simple_pattern_analysis(self, search_text):
+        with stage_timer('analyzer', 'match'):
+            hits = self.matcher.find_all(search_text)
+        
+        result = self._analysis_from_hits(hits)
+        result['keyword_hits'] = [{'keyword': hit.keyword, 'offset': hit.start} for hit in hits]
+        return result
+    
+    def analyze_stream(self, chunks, overlap=64):
+        """
+        Analyze a long document delivered as text chunks (e.g. a resume)
+        Each chunk is matched once, holding back the trailing partial word and a
+        short overlap so keywords split across chunk boundaries are still found.
+        Memory is bounded by the vocabulary, not the document
+        """
+        counts = {}
+        first_hits = {}
+        state = {'carry': '', 'seen': 0, 'consumed': 0}
+        
+        def scan(window, cut):
+            # state['seen'] leading characters of window were matched in the previous window
+            with stage_timer('analyzer', 'match'):
+                window_hits = self.matcher.find_all(window[:cut])
+            for hit in window_hits:
+                if hit.end <= state['seen']:
+                    continue
+                counts[hit.keyword] = counts.get(hit.keyword, 0) + 1
+                if hit.keyword not in first_hits:
+                    offset = state['consumed']
+                    first_hits[hit.keyword] = hit._replace(start=offset + hit.start, end=offset + hit.end)
+            
+            # Carry the unmatched remainder plus an overlap starting on a word boundary
+            overlap_start = 0
+            if cut > overlap:
+                overlap_start = cut
+                for i in range(cut - overlap, cut):
+                    if window[i].isspace():
+                        overlap_start = i + 1
+                        break
+            state['consumed'] += overlap_start
+            state['carry'] = window[overlap_start:]
+            state['seen'] = cut - overlap_start
+        
+        for chunk in chunks:
+            window = state['carry'] + chunk.lower()
+            # Hold back the trailing (possibly partial) word
+            cut = len(window)
+            while cut > state['seen'] and not window[cut - 1].isspace():
+                cut -= 1
+            if cut > state['seen']:
+                scan(window, cut)
+            elif len(window) - state['seen'] > 16 * overlap:
+                # One enormous "word": cut anyway so the carry can't grow without bound
+                scan(window, len(window))
+            else:
+                state['carry'] = window
+        
+        if len(state['carry']) > state['seen']:
+            scan(state['carry'], len(state['carry']))
+        
+        hits = sorted(first_hits.values(), key=lambda hit: (hit.start, -len(hit.keyword)))
+        result = self._analysis_from_hits(hits, counts)
+        result.update({
+            'keyword_hits': [{'keyword': hit.keyword, 'offset': hit.start, 'count': counts[hit.keyword]} for hit in hits],
+            'analysis_method': 'pattern_matching',
+            'search_type': 'resume',
+            'ai_ready': True,
+            'can_enhance_with_ai': result['confidence'] < self.confidence_threshold
+        })
+        return result
+    
+    def _analysis_from_hits(self, hits, counts=None):
+        """Roles, skills, preferences and confidence from matcher hits"""
+        found_roles = []
+        confidence_score = 0.5
+        
+        found = self._group_hits(hits)
+        role_hits = found['role']
+        
+        for role, keywords in self.known_job_patterns.items():
+            if role not in role_hits:
+                continue
+            matched_keywords = [kw for kw in keywords if kw in role_hits[role]]
+            found_roles.append({
+                'role': role,
+                'confidence': min(0.9, 0.5 + (len(matched_keywords) * 0.2)),
+                'matched_keywords': matched_keywords
+            })
+        
+        if counts:
+            # Long documents saturate confidence; break ties by how often the role's keywords occur
+            occurrences = lambda role: sum(counts.get(kw, 0) for kw in role['matched_keywords'])
+            found_roles = sorted(found_roles, key=lambda x: (x['confidence'], occurrences(x)), reverse=True)[:3]
+        else:
+            found_roles = sorted(found_roles, key=lambda x: x['confidence'], reverse=True)[:3]
+        role_names = [role['role'] for role in found_roles]
+        
+        found_skills = [skill.title() for skill in self.skill_patterns if skill in found['skill']]
+        
+        preferences = self._extract_preferences(None, hits)
+        
+        if found_roles:
+            confidence_score = max(role['confidence'] for role in found_roles)
+        elif found_skills:
+            confidence_score = 0.6
+        elif found['intent']:
+            confidence_score = 0.4
+        
+        return {
+            'predicted_roles': role_names,
+            'mentioned_skills': found_skills,
+            'work_preferences': preferences,
+            'confidence': confidence_score,
+            'role_details': found_roles
+        }
+    
+    def _group_hits(self, hits):
+        """Bucket matcher hits by label kind: roles map to their matched keywords"""
+        found = {'role': {}, 'skill': set(), 'preference': set(), 'intent': set()}
+        for hit in hits:
+            for kind, value in hit.labels:
+                if kind == 'role':
+                    found['role'].setdefault(value, set()).add(hit.keyword)
+                else:
+                    found[kind].add(value)
+        return found
+    
+    def _fallback_analysis(self, search_text):
+        job_title = self._extract_job_title_patterns(search_text)
+        return {
+            'predicted_roles': [job_title] if job_title else ['General Position'],
+            'extracted_job_title': job_title
+        }
+    
+    def _extract_job_title_patterns(self, search_text):
+        stop_words = ['looking', 'for', 'job', 'position', 'work', 'career', 'remote', 'part', 'time', 'full', 'flexible', 'schedule']
+        words = [word for word in search_text.split() if word not in stop_words and len(word) > 2]
+        
+        if words:
+            return ' '.join(words[:2]).title()
+        
+        return None
+    
+    def _extract_preferences(self, search_text, hits=None):
+        if hits is None:
+            hits = self.matcher.find_all(search_text)
+        
+        found = self._group_hits(hits)['preference']
+        return {preference: preference in found for preference in self.preference_patterns}
+
+
+# The analyzer of a batch pool worker, built once per process by init_batch_worker
+_worker_analyzer: Optional[AIReadyTextAnalyzer] = None
+
+
+def init_batch_worker(cache_size: int = 0, cache_ttl: float = 0):
+    """ProcessPoolExecutor initializer: each worker process builds its own analyzer"""
+    global _worker_analyzer
+    _worker_analyzer = AIReadyTextAnalyzer(cache_size=cache_size, cache_ttl=cache_ttl)
+
+
+def analyze_batch_item(item: Tuple[int, object], analyzer: Optional[AIReadyTextAnalyzer] = None) -> Dict:
+    """
+    Analyze one batch entry (index, search_text) with analyzer, or in a pool
+    worker with the worker's own; bad input or failures become that entry's error
+    """
+    index, search_text = item
+    if not isinstance(search_text, str) or not search_text.strip():
+        return {"index": index, "success": False, "error": "search_text must be a non-empty string"}
+
+    try:
+        return {"index": index, "success": True, "analysis": (analyzer or _worker_analyzer).analyze_text(search_text)}
+    except Exception as e:
+        return {"index": index, "success": False, "error": str(e)}
@@ -0,0 +1,239 @@
+import email.utils
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .metrics import stage_timer
+
+logger = logging.getLogger(__name__)
+
+# Responses worth another attempt: throttling and transient server/gateway errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(requests.RequestException):
+    """An upstream failed repeatedly and is not being called until its breaker resets"""
+
+
+class CircuitBreaker:
+    """
+    Per-upstream breaker: after failure_threshold consecutive failed calls it
+    opens and rejects calls for reset_timeout seconds, then lets a single
+    probe through (half-open); the probe's outcome closes or reopens it
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit opened after {self.failures} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release_probe(self):
+        """Let another probe through after one ended without a verdict on the upstream"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probing = False
+
+    def retry_in(self) -> float:
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+
+class HttpTransport:
+    """
+    Shared HTTP client for job providers
+    Keeps a keep-alive connection pool per upstream host (sized per host),
+    applies separate connect/read timeouts, retries transient failures with
+    jittered exponential backoff and trips a per-host circuit breaker when an
+    upstream keeps failing, so a dead board fails fast instead of tying up
+    request threads. get() mirrors requests.Session.get for callers
+    """
+
+    def __init__(self, connect_timeout: float = 3.05, read_timeout: float = 10, max_retries: int = 2,
+                 backoff_base: float = 0.2, backoff_max: float = 2.0, pool_size: int = 16,
+                 host_pool_sizes: Optional[Dict[str, int]] = None, failure_threshold: int = 5,
+                 reset_timeout: float = 30, headers: Optional[Dict[str, str]] = None):
+        self.timeout = (connect_timeout, read_timeout)
+        self.pool_size = pool_size
+        self.host_pool_sizes = dict(host_pool_sizes or {})
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        # Retries are ours (with jitter and breaker accounting), not urllib3's
+        for prefix in ('http://', 'https://'):
+            self.session.mount(prefix, HTTPAdapter(pool_connections=8, pool_maxsize=pool_size, max_retries=0))
+        for host, size in self.host_pool_sizes.items():
+            for scheme in ('http', 'https'):
+                self.session.mount(f'{scheme}://{host}', HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=0))
+
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'retries': 0,
+            'failures': 0,
+            'short_circuited': 0
+        }
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[Union[float, Tuple[float, float]]] = None, stream: bool = False) -> requests.Response:
+        return self.request('GET', url, headers=headers, timeout=timeout, stream=stream)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[Union[float, Tuple[float, float]]] = None, stream: bool = False) -> requests.Response:
+        """
+        Send a request through the host's breaker, retrying transient errors
+        Raises CircuitOpenError without touching the network while the breaker
+        is open. Returns the final response (which may still be an error
+        status) or raises the last connection error; other request errors
+        fail the call without retrying. With stream=True the body is left
+        unread; the caller must close the response
+        """
+        host = urlsplit(url).netloc
+        breaker = self.breaker(host)
+        if not breaker.allow():
+            self.count('short_circuited')
+            raise CircuitOpenError(f"Circuit open for {host}; retrying in {breaker.retry_in():.1f}s")
+
+        self.count('requests')
+        probe = breaker.state == CircuitBreaker.HALF_OPEN
+        try:
+            return self._send(method, url, breaker, headers, timeout, stream)
+        except BaseException:
+            # Interrupted or failed without an outcome recorded: a half-open
+            # breaker must not keep waiting on this probe forever
+            if probe:
+                breaker.release_probe()
+            raise
+
+    def _send(self, method: str, url: str, breaker: CircuitBreaker, headers: Optional[Dict[str, str]],
+              timeout: Optional[Union[float, Tuple[float, float]]], stream: bool) -> requests.Response:
+        """Attempt loop of request(): retries, backoff and the breaker's verdict"""
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                with stage_timer('transport', 'attempt'):
+                    response = self.session.request(method, url, headers=headers, timeout=timeout or self.timeout, stream=stream)
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                error = None
+                retry_after = self.retry_after(response.headers)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                response, error = None, e
+            except requests.RequestException:
+                # Not transient (a mangled body, a redirect loop, a bad URL): fail the call without retrying
+                self.count('failures')
+                breaker.record_failure()
+                raise
+
+            if attempt >= self.max_retries:
+                self.count('failures')
+                breaker.record_failure()
+                if error is not None:
+                    raise error
+                return response
+
+            if response is not None:
+                # Hand the connection back to the pool before trying again
+                response.close()
+            attempt += 1
+            self.count('retries')
+            delay = retry_after if retry_after is not None else self.backoff(attempt)
+            reason = str(error) if error is not None else f"HTTP {response.status_code}"
+            logger.info(f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt + 1}): {reason}")
+            time.sleep(delay)
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return breaker
+
+    def get_stats(self) -> Dict:
+        """Counters plus each upstream's breaker state, for health reporting"""
+        with self._lock:
+            stats = dict(self._stats)
+            breakers = dict(self._breakers)
+
+        stats['upstreams'] = {
+            host: {'state': breaker.state, 'consecutive_failures': breaker.failures, 'retry_in': round(breaker.retry_in(), 1)}
+            for host, breaker in breakers.items()
+        }
+        return stats
+
+    def close(self):
+        self.session.close()
+
+    def backoff(self, attempt: int) -> float:
+        """Full jitter: uniform over [0, base * 2^(attempt - 1)], capped at backoff_max"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def retry_after(self, headers) -> Optional[float]:
+        """Honor a Retry-After header (seconds or HTTP date), capped at backoff_max"""
+        value = headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(0.0, delay), self.backoff_max)
+
+    def count(self, event: str):
+        with self._lock:
+            self._stats[event] += 1
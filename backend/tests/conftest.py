@@ -0,0 +1,55 @@
+import logging
+import os
+import sys
+
+import pytest
+
+# Tests import backend modules the way the app and benchmarks do (services.x, models.x)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+SAMPLE_FEED = os.path.join(BACKEND_DIR, 'data', 'sample_remoteok_feed.json')
+# Nothing answers here (TEST-NET-1): any request that reaches the network fails
+UNROUTABLE_URL = 'http://192.0.2.1/api'
+
+from benchmarks.stub_upstream import StubUpstream  # noqa: E402
+
+
+@pytest.fixture
+def stub():
+    """Local RemoteOK stand-in, see benchmarks.stub_upstream"""
+    upstream = StubUpstream(jobs=20).start()
+    yield upstream
+    upstream.stop()
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs():
+    logging.disable(logging.WARNING)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope='session')
+def app_module(tmp_path_factory):
+    """
+    The Flask app module, configured offline: the sample feed is ingested
+    into a temporary database at startup, the upstream is unroutable and
+    no scheduler runs. The app reads its config once, at import
+    """
+    os.environ.update({
+        'JOB_DB_PATH': str(tmp_path_factory.mktemp('db') / 'jobs.db'),
+        'REMOTEOK_FEED_FILE': SAMPLE_FEED,
+        'REMOTEOK_API_URL': UNROUTABLE_URL,
+        'UPSTREAM_CONNECT_TIMEOUT': '0.2',
+        'UPSTREAM_RETRIES': '0',
+        'SCHEDULER_ENABLED': '0'
+    })
+    import app
+    yield app
+    app.shutdown()
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
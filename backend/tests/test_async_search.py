@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+from services.async_search import AsyncJobSearch
+from services.async_transport import AsyncHttpTransport
+from services.job_scraper import JobScraper
+
+
+def test_merge_runs_off_the_event_loop(stub):
+    scraper = JobScraper()
+    scraper.sources['remoteok'].api_url = stub.url
+    merge = scraper._merge_results
+    threads = []
+
+    def recording_merge(*args):
+        threads.append(threading.current_thread())
+        return merge(*args)
+    scraper._merge_results = recording_merge
+
+    async def scenario():
+        client = AsyncHttpTransport(scraper.transport)
+        try:
+            result = await AsyncJobSearch(scraper, client).search('python developer', limit=10)
+            return result, threading.current_thread()
+        finally:
+            await client.close()
+
+    result, loop_thread = asyncio.run(scenario())
+
+    assert result['jobs']
+    assert len(threads) == 1 and threads[0] is not loop_thread
+
+
+def test_streamed_results_match_the_threaded_search(stub):
+    scraper = JobScraper(streaming=True, result_cache_size=0)
+    scraper.sources['remoteok'].api_url = stub.url
+    filters = {'remote': True}
+
+    async def scenario():
+        client = AsyncHttpTransport(scraper.transport)
+        try:
+            return await AsyncJobSearch(scraper, client).search('python developer', filters=filters)
+        finally:
+            await client.close()
+
+    streamed = asyncio.run(scenario())
+    threaded = scraper.search('python developer', filters=filters)
+
+    remoteok = [job['url'] for job in streamed['jobs'] if job['source'] == 'RemoteOK']
+    assert remoteok and remoteok == [job['url'] for job in threaded['jobs'] if job['source'] == 'RemoteOK']
+    assert streamed['sources'][0] == dict(threaded['sources'][0], elapsed_ms=streamed['sources'][0]['elapsed_ms'])
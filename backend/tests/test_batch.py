@@ -0,0 +1,38 @@
+from models.serialization import loads
+
+TEXTS = ['python developer', '', 'remote nurse', 42, 'senior data scientist']
+
+
+def post_batch(client, parallel: bool):
+    response = client.post('/api/analyze-text/batch', json={'search_texts': TEXTS, 'parallel': parallel})
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    return [loads(line) for line in response.get_data().splitlines()]
+
+
+def test_serial_batch_streams_ndjson_in_order(client):
+    results = post_batch(client, parallel=False)
+
+    assert [result['index'] for result in results] == list(range(len(TEXTS)))
+    assert [result['success'] for result in results] == [True, False, True, False, True]
+    assert results[0]['analysis']['predicted_roles'][0] == 'Software Developer'
+
+
+def test_parallel_batch_matches_serial(app_module, client):
+    serial = post_batch(client, parallel=False)
+    parallel = post_batch(client, parallel=True)
+
+    strip = lambda results: [{k: v for k, v in result.items() if k != 'analysis'} for result in results]
+    assert strip(parallel) == strip(serial)
+    assert [r['analysis']['predicted_roles'] for r in parallel if r['success']] == \
+        [r['analysis']['predicted_roles'] for r in serial if r['success']]
+
+
+def test_pool_workers_do_not_fork_or_import_app(app_module, client):
+    post_batch(client, parallel=True)
+    executor = app_module.batch_executor
+
+    assert executor._mp_context.get_start_method() in ('forkserver', 'spawn')
+    # eval is picklable by name; it runs in a worker process
+    assert executor.submit(eval, "'app' in __import__('sys').modules").result(timeout=30) is False
+    assert executor.submit(eval, "'services.text_analyzer' in __import__('sys').modules").result(timeout=30) is True
@@ -0,0 +1,89 @@
+import threading
+import time
+
+from services.feed_cache import FeedCache
+from services.transport import HttpTransport
+
+
+def make_cache(ttl: float = 300) -> FeedCache:
+    return FeedCache(HttpTransport(max_retries=0), ttl=ttl, timeout=None)
+
+
+def wait_for(condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_hit_within_ttl(stub):
+    cache = make_cache()
+
+    first = cache.get(stub.url)
+    second = cache.get(stub.url)
+
+    assert second is first
+    assert stub.requests['200'] == 1
+    stats = cache.get_stats()
+    assert (stats['misses'], stats['hits'], stats['entries']) == (1, 1, 1)
+
+
+def test_revalidates_with_conditional_get(stub):
+    cache = make_cache()
+    data = cache.get(stub.url)
+
+    assert cache.refresh(stub.url) is data
+    assert (stub.requests['200'], stub.requests['304']) == (1, 1)
+    assert stub.last_headers['If-None-Match'] == stub.etag
+    assert stub.last_headers['If-Modified-Since'] == stub.last_modified
+    assert cache.get_stats()['revalidated'] == 1
+
+
+def test_serves_stale_while_refreshing(stub):
+    cache = make_cache(ttl=0.05)
+    old = cache.get(stub.url)
+    time.sleep(cache.ttl)
+    stub.set_feed([{'legal': 'updated'}, {'id': 1, 'position': 'Python Developer'}])
+    stub.delay = 0.3
+
+    started = time.monotonic()
+    assert cache.get(stub.url) is old
+    assert time.monotonic() - started < stub.delay
+    assert cache.get_stats()['stale_hits'] == 1
+
+    assert wait_for(lambda: cache.peek(stub.url) is not old)
+    assert cache.peek(stub.url)[1]['position'] == 'Python Developer'
+    assert stub.requests['200'] == 2
+
+
+def test_concurrent_cold_misses_fetch_once(stub):
+    cache = make_cache()
+    stub.delay = 0.2
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(cache.get(stub.url))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    assert stub.requests['200'] == 1
+    assert cache.get_stats()['misses'] == 8
+
+
+def test_health_reports_counters(stub, app_module, client):
+    before = client.get('/health').get_json()['feed_cache']
+
+    app_module.job_scraper.feed_cache.get(stub.url)
+    app_module.job_scraper.feed_cache.get(stub.url)
+
+    after = client.get('/health').get_json()['feed_cache']
+    assert after['misses'] == before['misses'] + 1
+    assert after['hits'] == before['hits'] + 1
+    assert after['refreshes'] == before['refreshes'] + 1
+    assert after['entries'] == before['entries'] + 1
+    assert 0 < after['hit_ratio'] <= 1
@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from services.feed_stream import FeedFormatError, iter_json_array
+
+from .conftest import SAMPLE_FEED
+
+NUMBERS = '[1.5, 1e3, -2, 0.25E-2, 12345, {"salary": [40000, 6.5e4]}, "x", true, null, []]'
+
+
+def splits(data):
+    """data cut in two at every offset"""
+    return [[data[:i], data[i:]] for i in range(len(data) + 1)]
+
+
+@pytest.mark.parametrize('name', ['sample', 'numbers'])
+def test_any_split_decodes_the_same(name):
+    with open(SAMPLE_FEED, 'rb') as f:
+        data = f.read() if name == 'sample' else NUMBERS.encode()
+    expected = json.loads(data)
+
+    for chunks in splits(data):
+        assert list(iter_json_array(chunks)) == expected, chunks
+
+
+@pytest.mark.parametrize('chunks', [['[1.', '5]'], ['[1e', '3]'], ['[1', 'e', '+', '3]'], ['[-', '2]'], ['[12', '34, 5]']])
+def test_numbers_split_across_chunks(chunks):
+    assert list(iter_json_array(chunks)) == json.loads(''.join(chunks))
+
+
+@pytest.mark.parametrize('data', ['{"a": 1}', '', '[1, 2', '[1 2]', '[1,]', '[1.]', '[{"a": 1]', '[tru]', '["open'])
+def test_malformed_feeds_are_rejected(data):
+    for chunks in splits(data):
+        with pytest.raises(FeedFormatError):
+            list(iter_json_array(chunks))
@@ -0,0 +1,50 @@
+import pytest
+
+from services.facets import FacetIndex, matches_filters, parse_filters, typed_fields
+from services.job_database import JobDatabase
+
+TITLES = ['Junior Analyst', 'Python Developer', 'Senior Engineer', 'Lead Engineer', 'Principal Architect']
+
+
+def posting(title: str) -> dict:
+    return dict(title=title, company='Acme', location='Remote', salary='', description=title, url='',
+                source='RemoteOK', posted_date='', tags=[], **typed_fields(title, 'Remote'))
+
+
+def test_seniority_filter_takes_several_levels():
+    assert parse_filters({'seniority': 'senior'}) == {'seniority': ('senior',)}
+    assert parse_filters({'seniority': ['lead', 'senior']}) == {'seniority': ('senior', 'lead')}
+    with pytest.raises(ValueError):
+        parse_filters({'seniority': ['senior', 'boss']})
+
+
+def test_senior_preference_keeps_lead_postings(app_module):
+    filters = app_module._preference_filters({'senior_level': True})
+    jobs = [posting(title) for title in TITLES]
+
+    kept = [job['title'] for job in jobs if matches_filters(job, filters)]
+    index = FacetIndex(jobs)
+
+    assert kept == ['Senior Engineer', 'Lead Engineer', 'Principal Architect']
+    assert index.count(index.mask(filters)) == 3
+
+
+def test_database_filters_on_several_levels(tmp_path):
+    database = JobDatabase(str(tmp_path / 'jobs.db'))
+    database.upsert_jobs('RemoteOK', [(i, posting(title)) for i, title in enumerate(TITLES)])
+
+    found = database.search(' '.join(TITLES), limit=10, filters=parse_filters({'seniority': ['senior', 'lead']}))
+
+    assert sorted(job['title'] for job in found) == ['Lead Engineer', 'Principal Architect', 'Senior Engineer']
+
+
+def test_remote_preference_keeps_mock_jobs(client):
+    analysis = {'search_type': 'text_search', 'predicted_roles': ['Nurse'],
+                'work_preferences': {'remote_preferred': True}}
+
+    body = client.post('/api/search-jobs', json={'analysis': analysis}).get_json()
+
+    assert body['filters'] == {'remote': True}
+    mock = [job for job in body['jobs'] if job['source'] == 'MockData']
+    assert mock and all(job['remote'] and job['location'] == 'Remote' for job in mock)
+    assert body['total_found'] >= len(mock)
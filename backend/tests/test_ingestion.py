@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from services.ingestion import FeedIngestor
+from services.job_database import JobDatabase
+from services.job_scraper import JobScraper
+
+from .conftest import SAMPLE_FEED, UNROUTABLE_URL
+
+
+@pytest.fixture
+def feed():
+    with open(SAMPLE_FEED) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def ingestor(tmp_path):
+    return FeedIngestor(JobScraper(), JobDatabase(str(tmp_path / 'jobs.db')))
+
+
+def ingest(ingestor: FeedIngestor, feed, path):
+    path.write_text(json.dumps(feed))
+    return ingestor.ingest_file(str(path), index=False)
+
+
+def ingested_at(database: JobDatabase):
+    return dict(database._connection().execute('SELECT source_id, ingested_at FROM jobs'))
+
+
+def test_first_run_inserts_every_posting(ingestor):
+    counts = ingestor.ingest_file(SAMPLE_FEED, index=False)
+
+    assert counts == {'inserted': 8, 'updated': 0, 'unchanged': 0, 'deleted': 0}
+    assert ingestor.database.count() == 8
+
+
+def test_second_run_rewrites_nothing(ingestor):
+    ingestor.ingest_file(SAMPLE_FEED, index=False)
+    before = ingested_at(ingestor.database)
+
+    counts = ingestor.ingest_file(SAMPLE_FEED, index=False)
+
+    assert counts == {'inserted': 0, 'updated': 0, 'unchanged': 8, 'deleted': 0}
+    assert ingested_at(ingestor.database) == before
+
+
+def test_edited_and_dropped_postings(ingestor, feed, tmp_path):
+    ingestor.ingest_file(SAMPLE_FEED, index=False)
+
+    feed[1]['position'] = 'Staff Python Engineer'
+    dropped = feed.pop()
+    counts = ingest(ingestor, feed, tmp_path / 'feed.json')
+
+    assert counts == {'inserted': 0, 'updated': 1, 'unchanged': 6, 'deleted': 1}
+    titles = {job['title'] for job in ingestor.database.search('engineer manager', limit=20)}
+    assert 'Staff Python Engineer' in titles
+    assert dropped['position'] not in titles
+
+
+def test_search_answers_from_database_offline(app_module, client):
+    assert app_module.job_scraper.sources['remoteok'].api_url == UNROUTABLE_URL
+    requests_before = app_module.upstream_transport.get_stats()['requests']
+
+    response = client.post('/api/search-jobs-simple', json={'keywords': 'python'})
+
+    body = response.get_json()
+    assert response.status_code == 200
+    remoteok = [job for job in body['jobs'] if job['source'] == 'RemoteOK']
+    assert {job['title'] for job in remoteok} == {'Senior Python Engineer', 'Data Scientist'}
+    assert all(job['relevance'] > 0 for job in remoteok)
+    assert not body['partial_results']
+    assert app_module.upstream_transport.get_stats()['requests'] == requests_before
@@ -0,0 +1,22 @@
+import pytest
+
+from services.keyword_matcher import KeywordMatcher
+from services.text_analyzer import AIReadyTextAnalyzer
+
+
+@pytest.fixture(scope='module')
+def matcher():
+    return AIReadyTextAnalyzer(cache_size=0).matcher
+
+
+@pytest.mark.parametrize('text, keyword', [('modern web development', 'pm'), ('a modern stack', 'rn')])
+def test_keywords_do_not_match_inside_words(matcher, text, keyword):
+    assert keyword not in {hit.keyword for hit in matcher.find_all(text)}
+
+
+def test_keywords_match_whole_words_and_plurals():
+    matcher = KeywordMatcher({'pm': ['role'], 'rn': ['role'], 'data': ['skill'], 'data scientist': ['role']})
+
+    hits = matcher.find_all('rn or pm, data scientists wanted')
+
+    assert [(hit.keyword, hit.start) for hit in hits] == [('rn', 0), ('pm', 6), ('data scientist', 10), ('data', 10)]
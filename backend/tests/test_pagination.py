@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from benchmarks.stub_upstream import StubUpstream
+from benchmarks.synthetic import make_feed
+from services.async_search import AsyncJobSearch
+from services.async_transport import AsyncHttpTransport
+from services.ingestion import FeedIngestor
+from services.job_database import JobDatabase
+from services.job_scraper import JobScraper
+
+QUERY = 'python developer'
+PAGE = 20
+
+
+@pytest.fixture
+def feed():
+    return make_feed(300)
+
+
+@pytest.fixture
+def indexed(feed):
+    """Scraper reading the stub's feed through the feed cache and in-memory index"""
+    upstream = StubUpstream(feed=feed).start()
+    scraper = JobScraper()
+    scraper.sources['remoteok'].api_url = upstream.url
+    yield scraper
+    upstream.stop()
+
+
+@pytest.fixture
+def database(feed, tmp_path):
+    """Scraper reading RemoteOK postings from the database only"""
+    scraper = JobScraper(job_database=JobDatabase(str(tmp_path / 'jobs.db')))
+    FeedIngestor(scraper, scraper.job_database).ingest(feed)
+    return scraper
+
+
+def pages(search, total_pages: int):
+    return [search(QUERY, limit=PAGE, offset=page * PAGE) for page in range(total_pages)]
+
+
+@pytest.mark.parametrize('source', ['indexed', 'database'])
+def test_pages_reach_past_the_source_defaults(request, source):
+    scraper = request.getfixturevalue(source)
+    first = scraper.search(QUERY, limit=PAGE)
+    total = first['total']
+    assert total > 2 * PAGE
+
+    results = pages(scraper.search, -(-total // PAGE) + 1)
+    urls = [job['url'] for result in results for job in result['jobs']]
+
+    assert len(urls) == len(set(urls)) == total
+    assert all(result['total'] == total for result in results)
+    assert results[-1]['jobs'] == []
+
+
+def test_total_is_the_index_match_count(indexed):
+    result = indexed.search(QUERY, limit=PAGE)
+    mock = next(report['jobs'] for report in result['sources'] if report['name'] == 'mock')
+
+    assert result['total'] == indexed.job_store.facet_counts(QUERY)['matched'] + mock
+
+
+def test_total_is_the_database_match_count(database):
+    result = database.search(QUERY, limit=PAGE)
+    mock = next(report['jobs'] for report in result['sources'] if report['name'] == 'mock')
+
+    assert result['total'] == database.job_database.count_matches(QUERY, source='RemoteOK') + mock
+
+
+@pytest.mark.parametrize('source', ['indexed', 'database'])
+def test_reposts_are_collapsed_on_ingest(request, source, feed):
+    scraper = request.getfixturevalue(source)
+    total = scraper.search(QUERY, limit=PAGE)['total']
+
+    # The same postings again under new ids, as boards repost them
+    reposted = feed + [dict(job, id=f'9{job["id"]}') for job in feed[1:101]]
+    if source == 'indexed':
+        scraper._on_feed_refresh(scraper.sources['remoteok'].api_url, reposted)
+    else:
+        FeedIngestor(scraper, scraper.job_database).ingest(reposted)
+
+    assert scraper.search(QUERY, limit=PAGE)['total'] == total
+    assert scraper.search(QUERY, limit=PAGE, offset=total - PAGE)['total'] == total
+
+
+@pytest.mark.parametrize('filters', [None, {'seniority': ('senior',)}, {'salary_min': 90000}])
+def test_database_facets_count_every_match(indexed, database, filters):
+    from_index = indexed.search(QUERY, limit=PAGE, filters=filters)['facets']
+    from_database = database.search(QUERY, limit=PAGE, filters=filters)['facets']
+
+    assert from_database == from_index
+    assert from_database['matched'] > PAGE
+
+
+def test_following_pages_reuse_the_cached_result(indexed):
+    indexed.search(QUERY, limit=PAGE, offset=PAGE)
+
+    assert indexed.search(QUERY, limit=PAGE, offset=2 * PAGE)['cached']
+    assert not indexed.search(QUERY, limit=PAGE, offset=4 * PAGE)['cached']
+
+
+def test_too_shallow_entries_count_as_misses(indexed):
+    indexed.search(QUERY, limit=PAGE)
+    indexed.search(QUERY, limit=PAGE, offset=4 * PAGE)
+
+    stats = indexed.result_cache.get_stats()
+    assert (stats['hits'], stats['misses']) == (0, 2)
+
+
+def test_async_search_pages_the_same_way(indexed):
+    async def scenario():
+        client = AsyncHttpTransport(indexed.transport)
+        try:
+            search = AsyncJobSearch(indexed, client)
+            return [await search.search(QUERY, limit=PAGE, offset=offset) for offset in (0, 3 * PAGE)]
+        finally:
+            await client.close()
+
+    first, deep = asyncio.run(scenario())
+    indexed.result_cache.clear()
+
+    assert deep['jobs'] and deep['total'] == first['total']
+    threaded = indexed.search(QUERY, limit=PAGE, offset=3 * PAGE)
+    assert [job['url'] for job in deep['jobs']] == [job['url'] for job in threaded['jobs']]
+
+
+def test_offsets_past_the_cap_are_rejected(client, app_module):
+    deepest = app_module.config.MAX_OFFSET
+
+    assert client.post('/api/search-jobs', json={'keywords': QUERY, 'offset': deepest}).status_code == 200
+    response = client.post('/api/search-jobs', json={'keywords': QUERY, 'offset': deepest + 1})
+    assert response.status_code == 400
+    assert 'offset' in response.get_json()['error']
@@ -0,0 +1,98 @@
+import pytest
+
+from benchmarks.stub_upstream import StubUpstream
+from benchmarks.synthetic import make_feed
+from services.ingestion import FeedIngestor
+from services.job_database import JobDatabase
+from services.job_scraper import JobScraper
+from services.job_store import profile_terms
+from services.scheduler import HostLock
+
+
+def test_host_lock_elects_one_holder(tmp_path):
+    path = str(tmp_path / 'refresh.lock')
+    first, second = HostLock(path), HostLock(path)
+
+    assert first.acquire() and first.acquire()
+    assert not second.acquire()
+    first.release()
+    assert second.acquire() and second.held
+
+
+@pytest.fixture
+def workers(stub, tmp_path):
+    """Two ingestors standing in for two server workers sharing a database on one host"""
+    ingestors = []
+    for _ in range(2):
+        database = JobDatabase(str(tmp_path / 'jobs.db'))
+        scraper = JobScraper(job_database=database)
+        scraper.sources['remoteok'].api_url = stub.url
+        ingestors.append(FeedIngestor(scraper, database, lock=HostLock(str(tmp_path / 'jobs.db-refresh.lock'))))
+    yield ingestors
+    for ingestor in ingestors:
+        ingestor.lock.release()
+
+
+def test_one_worker_refreshes_the_others_follow(stub, workers):
+    leader, follower = workers
+    follower.follow()
+
+    assert leader.run_once()
+    assert not follower.run_once()
+    assert stub.requests['200'] == 1
+    assert follower.database.count() == leader.database.count() == 20
+
+    follower.scraper.result_cache.put(('cached',), {'jobs': []})
+    assert follower.follow()
+    assert follower.scraper.result_cache.get(('cached',)) is None
+    assert not follower.follow()
+
+
+def test_followers_match_profiles_against_the_database(stub, workers):
+    leader, follower = workers
+    follower.follow()
+    leader.run_once()
+    profile = profile_terms('python developer engineer data')
+
+    matched = follower.scraper.match_profile(profile)
+    assert matched['jobs'] and stub.requests['200'] == 1
+
+    stub.set_feed(make_feed(40, seed=7))
+    leader.run_once()
+    assert follower.follow()
+    assert follower.scraper.match_profile(profile, limit=100)['total'] > matched['total']
+    assert stub.requests['200'] == 2
+
+
+def test_local_only_profile_matching_stays_offline(stub):
+    scraper = JobScraper()
+    scraper.sources['remoteok'].api_url = stub.url
+    scraper.local_only = True
+
+    assert scraper.match_profile(profile_terms('python developer')) == {'jobs': [], 'total': 0}
+    assert stub.requests['200'] == 0
+
+
+def test_warmup_is_not_logged(app_module):
+    tracked = len(app_module.job_scraper.query_log)
+
+    app_module.warmup()
+
+    assert len(app_module.job_scraper.query_log) == tracked
+
+
+def test_prewarm_replays_depth_and_filters():
+    upstream = StubUpstream(feed=make_feed(300)).start()
+    try:
+        scraper = JobScraper()
+        scraper.sources['remoteok'].api_url = upstream.url
+        queries = [None, {'remote': True}]
+        for filters in queries:
+            scraper.search('python developer', limit=20, filters=filters)
+        scraper.result_cache.clear()
+
+        assert scraper.prewarm(5) == len(queries)
+        for filters in queries:
+            assert scraper.search('python developer', limit=20, filters=filters)['cached']
+    finally:
+        upstream.stop()
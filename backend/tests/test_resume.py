@@ -0,0 +1,126 @@
+import io
+import zipfile
+
+import pytest
+
+from services.resume_parser import ResumeParseError, UnsupportedResumeType, detect_format, iter_resume_text
+from services.text_analyzer import AIReadyTextAnalyzer
+
+RESUME = 'Senior Python developer with Kubernetes and React experience, looking for remote work. '
+
+
+def pdf_bytes(text: str) -> bytes:
+    """Single-page PDF showing text in Helvetica"""
+    content = f'BT /F1 12 Tf 72 720 Td ({text}) Tj ET'.encode()
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>',
+        b'<< /Length %d >>\nstream\n%s\nendstream' % (len(content), content),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'
+    ]
+    pdf = b'%PDF-1.4\n'
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n%s\nendobj\n' % (number, obj)
+    xref = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    pdf += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return pdf
+
+
+def docx_bytes(paragraphs) -> bytes:
+    """Minimal DOCX: just word/document.xml with one run per paragraph"""
+    body = ''.join(f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>' for text in paragraphs)
+    document = ('<?xml version="1.0" encoding="UTF-8"?>'
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                f'<w:body>{body}</w:body></w:document>')
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('word/document.xml', document)
+    return buffer.getvalue()
+
+
+def read(data: bytes, filename: str, **kwargs) -> str:
+    return ''.join(iter_resume_text(io.BytesIO(data), filename, **kwargs))
+
+
+@pytest.mark.parametrize('data, filename, expected', [
+    (b'%PDF-1.4', 'cv.pdf', 'pdf'),
+    (b'%PDF-1.4', 'cv', 'pdf'),
+    (b'PK\x03\x04', 'cv.docx', 'docx'),
+    (b'PK\x03\x04', 'cv', 'docx'),
+    (b'plain', 'cv.txt', 'text'),
+    (b'plain', 'cv', 'text')
+])
+def test_format_is_sniffed_from_content(data, filename, expected):
+    stream = io.BytesIO(data)
+    assert detect_format(stream, filename) == expected
+    assert stream.tell() == 0
+
+
+@pytest.mark.parametrize('data, filename, error', [
+    (b'PK\x03\x04', 'cv.zip', UnsupportedResumeType),
+    (b'MZ', 'cv.exe', UnsupportedResumeType),
+    (b'plain', 'cv.pdf', ResumeParseError),
+    (b'plain', 'cv.docx', ResumeParseError)
+])
+def test_unsupported_and_mislabelled_uploads(data, filename, error):
+    with pytest.raises(error):
+        detect_format(io.BytesIO(data), filename)
+
+
+def test_readers_extract_text():
+    assert 'Senior Python developer' in read(pdf_bytes(RESUME), 'cv.pdf')
+    assert read(docx_bytes(['Senior Python developer', 'Remote']), 'cv.docx') == 'Senior Python developer\nRemote\n'
+    assert read('Développeur Python'.encode(), 'cv.txt') == 'Développeur Python'
+
+
+def test_corrupt_documents_are_parse_errors():
+    with pytest.raises(ResumeParseError):
+        read(b'PK\x03\x04 not really a zip', 'cv.docx')
+    with pytest.raises(ResumeParseError):
+        read(pdf_bytes(RESUME)[:40], 'cv.pdf')
+
+
+def test_extracted_text_is_capped():
+    assert len(read(RESUME.encode() * 1000, 'cv.txt', max_chars=500)) == 500
+
+
+def test_keywords_split_across_chunks_are_counted_once():
+    analyzer = AIReadyTextAnalyzer(cache_size=0)
+    text = RESUME * 3
+    expected = analyzer.analyze_stream([text])['keyword_hits']
+
+    for cut in range(len(text) + 1):
+        assert analyzer.analyze_stream([text[:cut], text[cut:]])['keyword_hits'] == expected, cut
+    small_chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+    assert analyzer.analyze_stream(small_chunks)['keyword_hits'] == expected
+
+
+def upload(client, data: bytes, filename: str):
+    return client.post('/api/analyze-resume', data={'resume': (io.BytesIO(data), filename)},
+                       content_type='multipart/form-data')
+
+
+@pytest.mark.parametrize('data, filename', [(pdf_bytes(RESUME), 'cv.pdf'), (docx_bytes([RESUME]), 'cv.docx'),
+                                            (RESUME.encode(), 'cv.txt')])
+def test_resume_upload_is_analyzed(client, data, filename):
+    response = upload(client, data, filename)
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['analysis']['search_type'] == 'resume'
+    assert 'Python' in body['analysis']['mentioned_skills']
+    assert body['search_keywords'] == body['analysis']['predicted_roles'][0]
+
+
+def test_resume_upload_errors(client, app_module, monkeypatch):
+    assert client.post('/api/analyze-resume', data={}, content_type='multipart/form-data').status_code == 400
+    assert upload(client, b'MZ', 'cv.exe').status_code == 415
+    assert upload(client, b'not a pdf', 'cv.pdf').status_code == 422
+
+    monkeypatch.setitem(app_module.app.config, 'MAX_CONTENT_LENGTH', 1024)
+    assert upload(client, RESUME.encode() * 100, 'cv.txt').status_code == 413
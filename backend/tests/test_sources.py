@@ -0,0 +1,37 @@
+import threading
+
+from services.job_scraper import JobScraper
+from services.providers import JobProvider
+
+
+class HangingProvider(JobProvider):
+    """A source whose upstream never answers until released"""
+
+    def __init__(self):
+        super().__init__('hanging', 'Hanging', timeout=0.1)
+        self.release = threading.Event()
+        self.calls = 0
+
+    def fetch_jobs(self, keywords, location, filters=None, limit=None):
+        self.calls += 1
+        self.release.wait(5)
+        return []
+
+
+def test_hung_source_does_not_starve_the_others():
+    scraper = JobScraper(max_workers=1, result_cache_size=0)
+    scraper.sources['remoteok'].enabled = False
+    hanging = HangingProvider()
+    scraper.register_provider(hanging)
+    try:
+        results = [scraper.search('python developer') for _ in range(3)]
+    finally:
+        hanging.release.set()
+        scraper.executors['hanging'].shutdown(wait=True)
+
+    for result in results:
+        statuses = {report['name']: report['status'] for report in result['sources']}
+        assert statuses == {'mock': 'ok', 'hanging': 'timeout'}
+        assert result['jobs']
+    # Fetches still queued behind the hung one were cancelled at their deadline
+    assert hanging.calls == 1
@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from services.async_transport import AsyncHttpTransport
+from services.transport import CircuitBreaker, CircuitOpenError, HttpTransport
+
+
+def make_transport(**kwargs) -> HttpTransport:
+    options = dict(max_retries=2, backoff_base=0.001, backoff_max=0.005, failure_threshold=2, reset_timeout=0.05)
+    options.update(kwargs)
+    return HttpTransport(**options)
+
+
+def open_breaker(transport: HttpTransport, stub) -> CircuitBreaker:
+    """Fail calls until the stub's breaker opens, then wait out its reset timeout"""
+    stub.set_faults(fail_rate=1.0)
+    for _ in range(transport.failure_threshold):
+        transport.get(stub.url)
+    breaker = transport.breaker(stub.url.split('/')[2])
+    assert breaker.state == CircuitBreaker.OPEN
+    time.sleep(transport.reset_timeout)
+    stub.set_faults()
+    return breaker
+
+
+def test_retries_transient_failures(stub):
+    stub.set_faults(fail_rate=0.2, drop_rate=0.2)
+    transport = make_transport(max_retries=5, failure_threshold=100)
+
+    statuses = [transport.get(stub.url).status_code for _ in range(20)]
+
+    assert statuses == [200] * 20
+    assert transport.get_stats()['retries'] == stub.requests['error'] + stub.requests['dropped'] > 0
+
+
+def test_returns_last_error_status_after_retries(stub):
+    stub.set_faults(fail_rate=1.0, error_status=502)
+    transport = make_transport(failure_threshold=100)
+
+    assert transport.get(stub.url).status_code == 502
+    assert stub.requests['error'] == transport.max_retries + 1
+    assert transport.get_stats()['failures'] == 1
+
+
+def test_opens_after_consecutive_failures(stub):
+    stub.set_faults(fail_rate=1.0)
+    transport = make_transport(reset_timeout=30)
+
+    for _ in range(transport.failure_threshold):
+        transport.get(stub.url)
+    hits = stub.requests['error']
+    with pytest.raises(CircuitOpenError):
+        transport.get(stub.url)
+
+    assert stub.requests['error'] == hits
+    assert transport.get_stats()['short_circuited'] == 1
+
+
+def test_half_open_probe_closes_on_success(stub):
+    transport = make_transport()
+    breaker = open_breaker(transport, stub)
+
+    assert transport.get(stub.url).status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+
+def test_half_open_probe_reopens_on_failure(stub):
+    transport = make_transport(max_retries=0)
+    breaker = open_breaker(transport, stub)
+    stub.set_faults(drop_rate=1.0)
+
+    with pytest.raises(requests.ConnectionError):
+        transport.get(stub.url)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+@pytest.mark.parametrize('error', [requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError,
+                                   requests.TooManyRedirects, requests.exceptions.InvalidURL])
+def test_half_open_probe_reopens_on_other_request_errors(stub, monkeypatch, error):
+    transport = make_transport()
+    breaker = open_breaker(transport, stub)
+
+    def broken(*args, **kwargs):
+        raise error('broken upstream')
+    monkeypatch.setattr(transport.session, 'request', broken)
+
+    with pytest.raises(error):
+        transport.get(stub.url)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.retry_in() > 0
+
+
+def test_interrupted_probe_is_released(stub, monkeypatch):
+    transport = make_transport()
+    breaker = open_breaker(transport, stub)
+
+    class Interrupted(BaseException):
+        pass
+
+    def interrupted(*args, **kwargs):
+        raise Interrupted()
+    monkeypatch.setattr(transport.session, 'request', interrupted)
+    with pytest.raises(Interrupted):
+        transport.get(stub.url)
+    monkeypatch.undo()
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert transport.get(stub.url).status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_async_cancelled_probe_is_released(stub):
+    transport = make_transport()
+    breaker = open_breaker(transport, stub)
+
+    async def fetch(client: AsyncHttpTransport) -> int:
+        async with client.request('GET', stub.url) as response:
+            await response.read()
+            return response.status
+
+    async def scenario():
+        client = AsyncHttpTransport(transport)
+        try:
+            stub.delay = 0.5
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(fetch(client), 0.05)
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            stub.delay = 0
+            return await fetch(client)
+        finally:
+            await client.close()
+
+    assert asyncio.run(scenario()) == 200
+    assert breaker.state == CircuitBreaker.CLOSED
@@ -11,7 +11,7 @@ const ResumeUpload = ({ setJobResults, setLoading, setError, setSearchKeywords,
 
   const onDrop = useCallback((acceptedFiles, fileRejections) => {
     if (fileRejections.length > 0) {
-      setError('Invalid file type. Please upload a PDF or TXT file.');
+      setError('Invalid file type. Please upload a PDF, DOCX or TXT file.');
       return;
     }
 
@@ -62,6 +62,7 @@ const ResumeUpload = ({ setJobResults, setLoading, setError, setSearchKeywords,
     accept: {
       'application/pdf': ['.pdf'],
       'text/plain': ['.txt'],
+      'application/vnd.openxmlformats-officedocument.wordprocessingml.document': ['.docx'],
     },
     multiple: false,
     onDrop,
@@ -79,7 +80,7 @@ const ResumeUpload = ({ setJobResults, setLoading, setError, setSearchKeywords,
         {isDragActive ? (
           <p>Drop your resume here...</p>
         ) : (
-          <p>Drag and drop a PDF or TXT file, or click to select</p>
+          <p>Drag and drop a PDF, DOCX or TXT file, or click to select</p>
         )}
       </div>
 